@@ -65,6 +65,13 @@ def check_all(session: nox.Session) -> None:
     session.run("ruff", "check", ".")
 
 
+@nox.session(python="3.12")
+def generate_ecodes(session: nox.Session) -> None:
+    """Regenerate the vendored evdev constants in src/ch9329py/ecodes.py."""
+    session.install("evdev")
+    session.run("python", "scripts/generate_ecodes.py")
+
+
 @nox.session(python="3.12")
 def docs_build(session: nox.Session) -> None:
     """Build documentation."""
@@ -0,0 +1,39 @@
+"""Generate ``src/ch9329py/ecodes.py`` from python-evdev.
+
+The generated module vendors the integer ``KEY_*`` and ``BTN_*`` constants of
+``evdev.ecodes`` so that ch9329py does not need the evdev C extension at
+runtime. Run it with evdev installed, e.g. through ``nox -s generate_ecodes``.
+"""
+
+from importlib.metadata import version
+from pathlib import Path
+
+from evdev import ecodes
+
+OUTPUT = Path(__file__).resolve().parents[1] / "src" / "ch9329py" / "ecodes.py"
+PREFIXES = ("KEY_", "BTN_")
+HEADER = '''"""Linux input event codes for keys and buttons.
+
+The integer ``KEY_*`` and ``BTN_*`` constants of ``linux/input-event-codes.h``
+with the same names and values as ``evdev.ecodes``, vendored so that ch9329py
+works without the evdev C extension.
+
+Generated by ``scripts/generate_ecodes.py`` from evdev {version}; do not edit.
+"""
+
+'''
+
+
+def main() -> None:
+    """Write the constants module, ordered by code and then by name."""
+    constants = sorted(
+        (value, name)
+        for name, value in vars(ecodes).items()
+        if name.startswith(PREFIXES) and isinstance(value, int)
+    )
+    body = "".join(f"{name} = {value}\n" for value, name in constants)
+    OUTPUT.write_text(HEADER.format(version=version("evdev")) + body)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,33 +19,142 @@ Context manager usage:
     ...         driver.send_keyboard_input(input_data)
 """
 
-from ch9329py.adapter import CommunicationAdapter, SerialAdapter
-from ch9329py.driver import CH9329Driver
-from ch9329py.exceptions import CH9329PyError, UnsupportedEvdevCodeError
-from ch9329py.models import (
-    KeyboardInput,
-    KeyCode,
-    MediaKey,
-    MediaKeyInput,
-    ModifierKey,
-    MouseButton,
-    MouseInput,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ch9329py.adapter import (
+        CommunicationAdapter,
+        PipelinedSerialAdapter,
+        SerialAdapter,
+    )
+    from ch9329py.async_adapter import AsyncCommunicationAdapter, AsyncSerialAdapter
+    from ch9329py.async_driver import AsyncCH9329Driver
+    from ch9329py.driver import CH9329Driver
+    from ch9329py.engine import PacketCache, ProtocolEngine
+    from ch9329py.exceptions import (
+        CH9329PyError,
+        DeviceStatusError,
+        InvalidResponseError,
+        ResponseError,
+        UnsupportedEvdevCodeError,
+    )
+    from ch9329py.models import (
+        KeyboardInput,
+        KeyboardState,
+        KeyCode,
+        MediaKey,
+        MediaKeyInput,
+        MediaKeyState,
+        ModifierKey,
+        MouseButton,
+        MouseInput,
+        MouseState,
+        ParameterConfig,
+    )
+    from ch9329py.optimizer import OptimizedInputs, optimize_inputs
+    from ch9329py.protocol import ResponseStatus
+    from ch9329py.text import KeyboardLayout, compile_text
 
 __version__ = "0.2.1"
 
+# Module defining each public name. They are imported on first access, so
+# that ``import ch9329py`` does not load pydantic, pyserial or asyncio until
+# the features that need them are used.
+_EXPORTS: dict[str, str] = {
+    "AsyncCH9329Driver": "ch9329py.async_driver",
+    "AsyncCommunicationAdapter": "ch9329py.async_adapter",
+    "AsyncSerialAdapter": "ch9329py.async_adapter",
+    "CH9329Driver": "ch9329py.driver",
+    "CH9329PyError": "ch9329py.exceptions",
+    "CommunicationAdapter": "ch9329py.adapter",
+    "DeviceStatusError": "ch9329py.exceptions",
+    "InvalidResponseError": "ch9329py.exceptions",
+    "KeyCode": "ch9329py.models",
+    "KeyboardInput": "ch9329py.models",
+    "KeyboardLayout": "ch9329py.text",
+    "KeyboardState": "ch9329py.models",
+    "MediaKey": "ch9329py.models",
+    "MediaKeyInput": "ch9329py.models",
+    "MediaKeyState": "ch9329py.models",
+    "ModifierKey": "ch9329py.models",
+    "MouseButton": "ch9329py.models",
+    "MouseInput": "ch9329py.models",
+    "MouseState": "ch9329py.models",
+    "OptimizedInputs": "ch9329py.optimizer",
+    "PacketCache": "ch9329py.engine",
+    "ParameterConfig": "ch9329py.models",
+    "PipelinedSerialAdapter": "ch9329py.adapter",
+    "ProtocolEngine": "ch9329py.engine",
+    "ResponseError": "ch9329py.exceptions",
+    "ResponseStatus": "ch9329py.protocol",
+    "SerialAdapter": "ch9329py.adapter",
+    "UnsupportedEvdevCodeError": "ch9329py.exceptions",
+    "compile_text": "ch9329py.text",
+    "optimize_inputs": "ch9329py.optimizer",
+}
+
 __all__ = [
+    "AsyncCH9329Driver",
+    "AsyncCommunicationAdapter",
+    "AsyncSerialAdapter",
     "CH9329Driver",
     "CH9329PyError",
     "CommunicationAdapter",
+    "DeviceStatusError",
+    "InvalidResponseError",
     "KeyCode",
     "KeyboardInput",
+    "KeyboardLayout",
+    "KeyboardState",
     "MediaKey",
     "MediaKeyInput",
+    "MediaKeyState",
     "ModifierKey",
     "MouseButton",
     "MouseInput",
+    "MouseState",
+    "OptimizedInputs",
+    "PacketCache",
+    "ParameterConfig",
+    "PipelinedSerialAdapter",
+    "ProtocolEngine",
+    "ResponseError",
+    "ResponseStatus",
     "SerialAdapter",
     "UnsupportedEvdevCodeError",
     "__version__",
+    "compile_text",
+    "optimize_inputs",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name from its module on first access.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The attribute.
+
+    Raises:
+        AttributeError: If the package has no such attribute.
+    """
+    module = _EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    # Later lookups find the name directly and skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names, including those not imported yet.
+
+    Returns:
+        Sorted attribute names.
+    """
+    return sorted({*globals(), *__all__})
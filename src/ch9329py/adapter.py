@@ -5,9 +5,15 @@ The abstract base class allows for dependency injection and easy testing with mo
 implementations.
 """
 
+import select
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Future
+from typing import NamedTuple
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -16,6 +22,11 @@ else:
 
 import serial
 
+from ch9329py.engine import ProtocolEngine
+from ch9329py.low_latency import LowLatencyReport, enable_low_latency
+from ch9329py.protocol import PacketData
+from ch9329py.timing import LatencyEstimator, wire_time
+
 
 class CommunicationAdapter(ABC):
     """Abstract base class for communication adapters.
@@ -25,9 +36,12 @@ class CommunicationAdapter(ABC):
     """
 
     @abstractmethod
-    def send(self, data: bytes) -> bytes:
+    def send(self, data: PacketData) -> bytes:
         """Send data to the device and receive response.
 
+        The data may be a view into a buffer that the caller reuses, so
+        implementations must not keep a reference to it after returning.
+
         Args:
             data: Bytes to send to the device.
 
@@ -38,6 +52,45 @@ class CommunicationAdapter(ABC):
             ConnectionError: If communication fails.
         """
 
+    def send_many(self, packets: Sequence[PacketData]) -> list[bytes]:
+        """Send several packets and receive one response per packet.
+
+        The default implementation calls `send` for each packet. Adapters that
+        can do better (e.g., a single write for all packets) override it.
+
+        Args:
+            packets: Packets to send, in order.
+
+        Returns:
+            Response bytes for each packet, in the same order.
+
+        Raises:
+            ConnectionError: If communication fails.
+        """
+        return [self.send(packet) for packet in packets]
+
+    @property
+    def supports_set_baudrate(self) -> bool:
+        """Whether `set_baudrate` is implemented by this adapter."""
+        return type(self).set_baudrate is not CommunicationAdapter.set_baudrate
+
+    def set_baudrate(self, baudrate: int) -> None:
+        """Change the baud rate used to talk to the device.
+
+        Only the host side is reconfigured; use
+        `CH9329Driver.change_baudrate` to move the chip and the adapter
+        together. The default implementation does not support this, which
+        `supports_set_baudrate` reports.
+
+        Args:
+            baudrate: New baud rate in bits per second.
+
+        Raises:
+            NotImplementedError: If the adapter has no configurable baud rate.
+        """
+        msg = f"{type(self).__name__} does not support changing the baud rate"
+        raise NotImplementedError(msg)
+
     @abstractmethod
     def close(self) -> None:
         """Close the communication channel.
@@ -74,6 +127,13 @@ class SerialAdapter(CommunicationAdapter):
         port: Serial port path (e.g., "/dev/ttyUSB0" on Linux, "COM5" on Windows).
         baudrate: Communication speed in bits per second (default: 9600).
         timeout: Read timeout in seconds (default: 0.1).
+        write_read_delay: Delay between write and read in seconds (default: 0.02).
+            None derives the delay from the baud rate and the measured
+            response latency instead.
+        event_driven: Wait for the response on the port's file descriptor instead
+            of sleeping for ``write_read_delay`` (default: False). The response
+            is returned as soon as it arrives, and ``timeout`` becomes the
+            deadline for the whole response. Requires a POSIX platform.
 
     Raises:
         ConnectionError: If the serial port cannot be opened.
@@ -86,20 +146,34 @@ class SerialAdapter(CommunicationAdapter):
         Or using context manager:
         >>> with SerialAdapter("/dev/ttyUSB0", 9600) as adapter:
         ...     response = adapter.send(b"\x57\xAB\x00\x02\x08")
-    """
 
-    # Response packet length from CH9329
-    _RESPONSE_LENGTH = 7
+        Returning as soon as the device acknowledges:
+        >>> adapter = SerialAdapter("/dev/ttyUSB0", 9600, event_driven=True)
+
+        Tuning the delay to the hardware:
+        >>> adapter = SerialAdapter("/dev/ttyUSB0", 115200, write_read_delay=None)
+        >>> adapter.response_latency
+        0.0006076388888888889
+    """
 
     # Delay between write and read (in seconds)
     _WRITE_READ_DELAY = 0.02
 
+    # Length of an acknowledgement frame from CH9329
+    _ACK_LENGTH = 7
+
+    # With an adaptive delay, every this many sends read without sleeping
+    # first, so that the measured latency does not include the sleep
+    _LATENCY_PROBE_INTERVAL = 8
+
     def __init__(
         self,
         port: str,
         baudrate: int = 9600,
         timeout: float = 0.1,
-        write_read_delay: float = 0.02,
+        write_read_delay: float | None = 0.02,
+        *,
+        event_driven: bool = False,
     ) -> None:
         """Initialize serial adapter and open connection.
 
@@ -107,12 +181,22 @@ class SerialAdapter(CommunicationAdapter):
             port: Serial port path.
             baudrate: Communication speed in bits per second.
             timeout: Read timeout in seconds.
-            write_read_delay: Delay between write and read in seconds.
+            write_read_delay: Delay between write and read in seconds, or
+                None to derive it from the baud rate and measured latency.
+            event_driven: Wait on the file descriptor for the response instead
+                of sleeping for ``write_read_delay``.
 
         Raises:
             ConnectionError: If the serial port cannot be opened.
         """
         self._write_read_delay = write_read_delay
+        self._timeout = timeout
+        self._event_driven = event_driven
+        self._baudrate = baudrate
+        self._latency = LatencyEstimator()
+        self._sends = 0
+        self._low_latency = False
+        self._engine = ProtocolEngine()
         try:
             self._serial = serial.Serial(
                 port=port,
@@ -126,14 +210,14 @@ class SerialAdapter(CommunicationAdapter):
             msg = f"Failed to open serial port {port}: {e}"
             raise ConnectionError(msg) from e
 
-    def send(self, data: bytes) -> bytes:
+    def send(self, data: PacketData) -> bytes:
         """Send data to the device and receive response.
 
         Args:
             data: Bytes to send to the device.
 
         Returns:
-            Response bytes from the device (7 bytes).
+            Response frame from the device (7 bytes for input commands).
 
         Raises:
             ConnectionError: If the serial port is not open or communication fails.
@@ -142,19 +226,220 @@ class SerialAdapter(CommunicationAdapter):
             msg = "Serial port is not open"
             raise ConnectionError(msg)
 
+        self._sends += 1
+        # A sleep before the read would be part of the measured latency and
+        # push the estimate, and with it the next sleep, further up
+        measure = self._write_read_delay is None and (
+            self._event_driven or self._sends % self._LATENCY_PROBE_INTERVAL == 0
+        )
+        self._engine.send_packet(data)
         try:
+            sent_at = time.monotonic()
             # Write data to serial port
-            self._serial.write(data)
+            self._serial.write(self._engine.data_to_send())
+
+            if self._event_driven:
+                response = self._wait_for_responses(1)[0]
+            else:
+                if not measure:
+                    # Wait for device to process
+                    time.sleep(self._delay_for(len(data)))
+
+                # Read response
+                response = self._read_response()
+        except (OSError, serial.SerialException) as e:
+            self._engine.clear()
+            msg = f"Serial communication failed: {e}"
+            raise ConnectionError(msg) from e
+        if measure and response:
+            # Time from the last request byte leaving to the complete response
+            self._latency.add(
+                time.monotonic() - sent_at - wire_time(len(data), self._baudrate)
+            )
+        return response
+
+    def send_many(self, packets: Sequence[PacketData]) -> list[bytes]:
+        """Send several packets with a single write and collect their responses.
+
+        All packets are concatenated into one buffer and written at once; the
+        responses are then read in one pass.
+
+        Args:
+            packets: Packets to send, in order.
+
+        Returns:
+            Response frame for each packet, in the same order. Responses that
+            did not arrive in time are empty bytes.
+
+        Raises:
+            ConnectionError: If the serial port is not open or communication fails.
+        """
+        if not packets:
+            return []
+        if not self._serial.is_open:
+            msg = "Serial port is not open"
+            raise ConnectionError(msg)
+
+        for packet in packets:
+            self._engine.send_packet(packet)
+        try:
+            self._serial.write(self._engine.data_to_send())
 
-            # Wait for device to process
-            time.sleep(self._write_read_delay)
+            if self._event_driven:
+                return self._wait_for_responses(len(packets))
 
-            # Read response
-            return self._serial.read(self._RESPONSE_LENGTH)
-        except serial.SerialException as e:
+            time.sleep(self._delay_for(len(packets[0])))
+            return [self._read_response() for _ in packets]
+        except (OSError, serial.SerialException) as e:
+            self._engine.clear()
             msg = f"Serial communication failed: {e}"
             raise ConnectionError(msg) from e
 
+    @property
+    def response_latency(self) -> float:
+        """Expected time from the end of a request to the complete response.
+
+        If ``write_read_delay`` is None, this starts at the time an
+        acknowledgement takes on the wire and follows the 10th percentile of
+        recent measurements, so the adapter rarely sleeps past an already
+        complete response. Latencies are measured on every eighth `send`,
+        which reads without sleeping first, or on every `send` if
+        ``event_driven`` is set. Otherwise it is ``write_read_delay``.
+        """
+        if self._write_read_delay is not None:
+            return self._write_read_delay
+        floor = wire_time(self._ACK_LENGTH, self._baudrate)
+        measured = self._latency.estimate()
+        return floor if measured is None else max(floor, measured)
+
+    def _delay_for(self, request_length: int) -> float:
+        """Return how long to sleep between writing a request and reading.
+
+        Args:
+            request_length: Length of the request in bytes.
+
+        Returns:
+            Delay in seconds.
+        """
+        if self._write_read_delay is not None:
+            return self._write_read_delay
+        return wire_time(request_length, self._baudrate) + self.response_latency
+
+    def _read_response(self) -> bytes:
+        """Read a response frame with blocking reads.
+
+        Bytes are fed through the protocol engine, and each read requests
+        only as many bytes as the frame still needs, so garbage on the line
+        and unsolicited frames are skipped and reads never run into the next
+        response.
+
+        Returns:
+            Response frame for the oldest outstanding packet, or empty bytes
+            if it did not arrive before the read timeout expired.
+        """
+        # Bounds the wait when the line keeps delivering garbage
+        deadline = time.monotonic() + self._timeout
+        while (frame := self._engine.next_response()) is None:
+            chunk = (
+                self._serial.read(self._engine.bytes_needed)
+                if time.monotonic() < deadline
+                else b""
+            )
+            if not chunk:
+                # Give up on this packet and drop its incomplete frame so it
+                # cannot corrupt the next one
+                self._engine.expire()
+                return b""
+            self._engine.receive_data(chunk)
+        return frame.raw
+
+    def _wait_for_responses(self, count: int) -> list[bytes]:
+        """Read responses as soon as they become available.
+
+        Blocks on the port's file descriptor until all responses have arrived
+        or no complete frame arrived within the read timeout.
+
+        Args:
+            count: Number of responses to collect.
+
+        Returns:
+            Response frames from the device. Responses that did not arrive
+            before the deadline are empty bytes.
+        """
+        responses: list[bytes] = []
+        fd = self._serial.fileno()
+        deadline = time.monotonic() + self._timeout
+        while len(responses) < count:
+            frame = self._engine.next_response()
+            if frame is not None:
+                responses.append(frame.raw)
+                deadline = time.monotonic() + self._timeout
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                break
+            self._engine.receive_data(self._serial.read(self._serial.in_waiting or 1))
+        if len(responses) < count:
+            # Give up on the remaining packets and drop the incomplete frame
+            # so it cannot corrupt the next response
+            self._engine.clear()
+            responses.extend(b"" for _ in range(count - len(responses)))
+        return responses
+
+    def set_baudrate(self, baudrate: int) -> None:
+        """Change the baud rate of the open serial port.
+
+        Any bytes received at the old baud rate are discarded.
+
+        Args:
+            baudrate: New baud rate in bits per second.
+
+        Raises:
+            ConnectionError: If the port cannot be reconfigured.
+        """
+        try:
+            self._serial.baudrate = baudrate
+            self._serial.reset_input_buffer()
+        except (OSError, serial.SerialException) as e:
+            msg = f"Failed to set baud rate {baudrate}: {e}"
+            raise ConnectionError(msg) from e
+        self._engine.clear()
+        # Latencies measured at the old baud rate no longer apply
+        self._baudrate = baudrate
+        self._latency.clear()
+        if self._low_latency:
+            # pyserial resets VMIN whenever it reconfigures the port
+            enable_low_latency(self._serial.fileno())
+
+    def enable_low_latency(self) -> LowLatencyReport:
+        """Tune the port for the lowest response latency (Linux only).
+
+        Sets ASYNC_LOW_LATENCY on the tty driver, makes the port readable
+        once a complete acknowledgement has arrived and lowers the
+        USB-serial latency timer where the driver has one. Settings the port
+        does not support (e.g., on a pty) are skipped; the settings are
+        reapplied after `set_baudrate`.
+
+        Returns:
+            Which optimizations took effect.
+
+        Raises:
+            ConnectionError: If the serial port is not open.
+
+        Examples:
+            >>> adapter = SerialAdapter("/dev/ttyUSB0", 115200, event_driven=True)
+            >>> adapter.enable_low_latency().async_low_latency
+            True
+        """
+        if not self._serial.is_open:
+            msg = "Serial port is not open"
+            raise ConnectionError(msg)
+        self._low_latency = True
+        return enable_low_latency(self._serial.fileno())
+
     def close(self) -> None:
         """Close the serial port."""
         if hasattr(self, "_serial") and self._serial.is_open:
@@ -177,3 +462,320 @@ class SerialAdapter(CommunicationAdapter):
             exc_tb: Exception traceback if an exception was raised.
         """
         self.close()
+
+
+class _PendingPacket(NamedTuple):
+    """A packet that has been written but not yet acknowledged."""
+
+    future: Future[bytes]
+    sent_at: float
+
+
+class _BaudrateChange(NamedTuple):
+    """A baud rate change waiting for the background reader.
+
+    Attributes:
+        baudrate: New baud rate in bits per second.
+        done: Future resolved once the port has been reconfigured.
+    """
+
+    baudrate: int
+    done: Future[None]
+
+
+class PipelinedSerialAdapter(SerialAdapter):
+    r"""Serial adapter that keeps several packets in flight.
+
+    Packets are written as soon as a slot in the sliding window is free. A
+    background reader thread matches each response to its outstanding packet
+    in FIFO order and resolves the future returned by `submit`. Bulk workloads
+    are therefore limited by the serial line rate rather than by the
+    round-trip time of every single packet.
+
+    `send` keeps the request/response contract of `CommunicationAdapter` and
+    blocks until the response to that packet has arrived.
+
+    Args:
+        port: Serial port path (e.g., "/dev/ttyUSB0" on Linux, "COM5" on Windows).
+        baudrate: Communication speed in bits per second (default: 9600).
+        timeout: Time in seconds to wait for each response once the previous
+            one has arrived (default: 0.1).
+        window: Maximum number of packets in flight (default: 8).
+
+    Raises:
+        ConnectionError: If the serial port cannot be opened.
+        ValueError: If window is less than 1.
+
+    Examples:
+        >>> with PipelinedSerialAdapter("/dev/ttyUSB0", 9600) as adapter:
+        ...     futures = [adapter.submit(packet) for packet in packets]
+        ...     responses = [future.result() for future in futures]
+    """
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 9600,
+        timeout: float = 0.1,
+        window: int = 8,
+    ) -> None:
+        """Initialize pipelined adapter and start the background reader.
+
+        Args:
+            port: Serial port path.
+            baudrate: Communication speed in bits per second.
+            timeout: Time in seconds to wait for each response.
+            window: Maximum number of packets in flight.
+
+        Raises:
+            ConnectionError: If the serial port cannot be opened.
+            ValueError: If window is less than 1.
+        """
+        if window < 1:
+            msg = f"window must be at least 1, got {window}"
+            raise ValueError(msg)
+        super().__init__(port, baudrate, timeout)
+        self._slots = threading.BoundedSemaphore(window)
+        self._pending: deque[_PendingPacket] = deque()
+        self._pending_lock = threading.Lock()
+        self._last_response_at = time.monotonic()
+        self._stopped = threading.Event()
+        # Error that stopped the background reader, if any
+        self._read_error: ConnectionError | None = None
+        # Applied by the reader, which owns the parser and the input buffer
+        self._baudrate_change: _BaudrateChange | None = None
+        self._reader = threading.Thread(
+            target=self._read_loop, name=f"ch9329py-reader-{port}", daemon=True
+        )
+        self._reader.start()
+
+    def submit(self, data: PacketData) -> Future[bytes]:
+        """Write a packet without waiting for its response.
+
+        Blocks only while the window is full.
+
+        Args:
+            data: Bytes to send to the device.
+
+        Returns:
+            Future resolved with the response frame, or with a
+            ConnectionError if no response arrives in time. The packet is
+            already written, so the future cannot be cancelled.
+
+        Raises:
+            ConnectionError: If the adapter is closed, the background reader
+                has failed or the write fails. A failed write may have left
+                part of the packet on the line, so it also stops the adapter.
+        """
+        self._check_running()
+        self._slots.acquire()
+        future: Future[bytes] = Future()
+        future.set_running_or_notify_cancel()
+        try:
+            with self._pending_lock:
+                # Checked again under the lock, so that no packet is queued
+                # after the reader has failed the pending ones
+                self._check_running()
+                self._engine.send_packet(data)
+                self._pending.append(_PendingPacket(future, time.monotonic()))
+                self._serial.write(self._engine.data_to_send())
+        except ConnectionError:
+            self._slots.release()
+            raise
+        except (OSError, serial.SerialException) as e:
+            msg = f"Serial communication failed: {e}"
+            error = ConnectionError(msg)
+            # Fails this packet too and releases its slot
+            self._stop_reading(error)
+            raise error from e
+        return future
+
+    def send(self, data: PacketData) -> bytes:
+        """Send data to the device and wait for its response.
+
+        Args:
+            data: Bytes to send to the device.
+
+        Returns:
+            Response frame from the device.
+
+        Raises:
+            ConnectionError: If the port is not open, communication fails or
+                the response does not arrive in time.
+        """
+        return self.submit(data).result()
+
+    def send_many(self, packets: Sequence[PacketData]) -> list[bytes]:
+        """Send several packets through the window and wait for all responses.
+
+        Args:
+            packets: Packets to send, in order.
+
+        Returns:
+            Response frame for each packet, in the same order.
+
+        Raises:
+            ConnectionError: If the port is not open, communication fails or
+                a response does not arrive in time.
+        """
+        futures = [self.submit(packet) for packet in packets]
+        return [future.result() for future in futures]
+
+    def flush(self) -> None:
+        """Wait until every packet in flight has been resolved."""
+        with self._pending_lock:
+            futures = [pending.future for pending in self._pending]
+        for future in futures:
+            future.exception()
+
+    def set_baudrate(self, baudrate: int) -> None:
+        """Wait for packets in flight, then change the baud rate.
+
+        The background reader reconfigures the port once no packet is in
+        flight, so that it never reads while the port changes.
+
+        Args:
+            baudrate: New baud rate in bits per second.
+
+        Raises:
+            ConnectionError: If the port cannot be reconfigured, the adapter
+                is closed or the background reader has failed.
+        """
+        done: Future[None] = Future()
+        with self._pending_lock:
+            self._check_running()
+            self._baudrate_change = _BaudrateChange(baudrate, done)
+        self._serial.cancel_read()
+        done.result()
+
+    def close(self) -> None:
+        """Stop the background reader, fail pending packets and close the port."""
+        if hasattr(self, "_stopped") and not self._stopped.is_set():
+            self._stopped.set()
+            if self._serial.is_open:
+                self._serial.cancel_read()
+            self._reader.join()
+            self._fail_pending(ConnectionError("Serial port was closed"))
+        super().close()
+
+    def _check_running(self) -> None:
+        """Raise if packets can no longer be submitted.
+
+        Raises:
+            ConnectionError: If the adapter is closed or the background reader
+                has failed.
+        """
+        if self._read_error is not None:
+            msg = f"Background reader stopped: {self._read_error}"
+            raise ConnectionError(msg) from self._read_error
+        if self._stopped.is_set() or not self._serial.is_open:
+            msg = "Serial port is not open"
+            raise ConnectionError(msg)
+
+    def _read_loop(self) -> None:
+        """Match incoming responses to outstanding packets until stopped.
+
+        Any error stops the adapter and fails the pending packets, so that
+        no caller waits for a reader that is gone.
+        """
+        try:
+            while not self._stopped.is_set():
+                self._apply_baudrate_change()
+                chunk = self._serial.read(self._serial.in_waiting or 1)
+                now = time.monotonic()
+                if chunk:
+                    self._receive(chunk, now)
+                else:
+                    self._expire_head(now)
+        except (OSError, serial.SerialException) as e:
+            self._stop_reading(ConnectionError(f"Serial communication failed: {e}"))
+        except Exception as e:  # noqa: BLE001
+            self._stop_reading(ConnectionError(f"Background reader failed: {e!r}"))
+
+    def _stop_reading(self, error: ConnectionError) -> None:
+        """Stop the adapter after the background reader failed.
+
+        Args:
+            error: Error to report to pending and later packets.
+        """
+        if self._stopped.is_set():
+            # Reads fail while the adapter is being closed
+            return
+        with self._pending_lock:
+            self._read_error = error
+            self._stopped.set()
+        self._fail_pending(error)
+
+    def _apply_baudrate_change(self) -> None:
+        """Change the baud rate if requested and no packet is in flight."""
+        with self._pending_lock:
+            change = self._baudrate_change
+            if change is None or self._pending:
+                return
+            self._baudrate_change = None
+            try:
+                super().set_baudrate(change.baudrate)
+            except ConnectionError as e:
+                change.done.set_exception(e)
+            else:
+                change.done.set_result(None)
+
+    def _receive(self, chunk: bytes, now: float) -> None:
+        """Resolve the outstanding packets answered by the received bytes.
+
+        The engine tracks the packets in the same order as ``_pending`` and
+        drops unsolicited frames, so each response resolves the oldest
+        pending packet.
+
+        Args:
+            chunk: Bytes read from the device.
+            now: Monotonic time at which the bytes were read.
+        """
+        answered: list[tuple[_PendingPacket, bytes]] = []
+        with self._pending_lock:
+            self._engine.receive_data(chunk)
+            while (frame := self._engine.next_response()) is not None:
+                self._last_response_at = now
+                answered.append((self._pending.popleft(), frame.raw))
+        for pending, response in answered:
+            self._slots.release()
+            pending.future.set_result(response)
+
+    def _expire_head(self, now: float) -> None:
+        """Fail the oldest outstanding packet if its response is overdue.
+
+        Args:
+            now: Current monotonic time.
+        """
+        with self._pending_lock:
+            if not self._pending:
+                return
+            head = self._pending[0]
+            waiting_since = max(head.sent_at, self._last_response_at)
+            if now - waiting_since < self._timeout:
+                return
+            self._pending.popleft()
+            self._engine.expire()
+            self._last_response_at = now
+        self._slots.release()
+        head.future.set_exception(
+            ConnectionError("Timed out waiting for response from device")
+        )
+
+    def _fail_pending(self, error: ConnectionError) -> None:
+        """Fail every outstanding packet and baud rate change with the error.
+
+        Args:
+            error: Exception to set on each pending future.
+        """
+        with self._pending_lock:
+            pending = list(self._pending)
+            self._pending.clear()
+            self._engine.clear()
+            change = self._baudrate_change
+            self._baudrate_change = None
+        for packet in pending:
+            self._slots.release()
+            packet.future.set_exception(error)
+        if change is not None:
+            change.done.set_exception(error)
@@ -0,0 +1,287 @@
+"""Asynchronous communication adapters for CH9329 device.
+
+This module provides asyncio counterparts of the adapters in
+`ch9329py.adapter`. The abstract base class mirrors `CommunicationAdapter`
+with awaitable methods, so the event loop is never blocked while waiting for
+the device to respond.
+"""
+
+import asyncio
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+import serial
+
+from ch9329py.engine import ProtocolEngine
+from ch9329py.low_latency import LowLatencyReport, enable_low_latency
+
+
+class AsyncCommunicationAdapter(ABC):
+    """Abstract base class for asynchronous communication adapters.
+
+    This class defines the asyncio interface for communicating with the CH9329
+    device. Concrete implementations handle the actual communication protocol.
+    """
+
+    @abstractmethod
+    async def send(self, data: bytes) -> bytes:
+        """Send data to the device and receive response.
+
+        Args:
+            data: Bytes to send to the device.
+
+        Returns:
+            Response bytes from the device.
+
+        Raises:
+            ConnectionError: If communication fails.
+        """
+
+    async def send_many(self, packets: Sequence[bytes]) -> list[bytes]:
+        """Send several packets and receive one response per packet.
+
+        The default implementation awaits `send` for each packet. Adapters that
+        can do better (e.g., a single write for all packets) override it.
+
+        Args:
+            packets: Packets to send, in order.
+
+        Returns:
+            Response bytes for each packet, in the same order.
+
+        Raises:
+            ConnectionError: If communication fails.
+        """
+        return [await self.send(packet) for packet in packets]
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the communication channel.
+
+        This should clean up any resources (e.g., close serial port).
+        """
+
+    @abstractmethod
+    async def __aenter__(self) -> Self:
+        """Enter async context manager.
+
+        Returns:
+            Self for use in async with statement.
+        """
+
+    @abstractmethod
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        """Exit async context manager and close connection.
+
+        Args:
+            exc_type: Exception type if an exception was raised.
+            exc_val: Exception value if an exception was raised.
+            exc_tb: Exception traceback if an exception was raised.
+        """
+
+
+class AsyncSerialAdapter(AsyncCommunicationAdapter):
+    r"""Non-blocking serial communication adapter for CH9329 device.
+
+    The serial port is opened in non-blocking mode and its file descriptor is
+    watched by the running event loop, so awaiting a response suspends only the
+    calling task. Requests on one adapter are serialized; separate adapters can
+    drive separate devices concurrently from a single thread.
+
+    Requires an event loop that supports ``add_reader`` (any POSIX selector
+    event loop).
+
+    Args:
+        port: Serial port path (e.g., "/dev/ttyUSB0").
+        baudrate: Communication speed in bits per second (default: 9600).
+        timeout: Time in seconds to wait for the response (default: 0.1).
+
+    Raises:
+        ConnectionError: If the serial port cannot be opened.
+
+    Examples:
+        >>> async with AsyncSerialAdapter("/dev/ttyUSB0", 9600) as adapter:
+        ...     response = await adapter.send(b"\x57\xAB\x00\x02\x08")
+    """
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 9600,
+        timeout: float = 0.1,
+    ) -> None:
+        """Initialize serial adapter and open connection.
+
+        Args:
+            port: Serial port path.
+            baudrate: Communication speed in bits per second.
+            timeout: Time in seconds to wait for the response.
+
+        Raises:
+            ConnectionError: If the serial port cannot be opened.
+        """
+        self._timeout = timeout
+        self._lock = asyncio.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._engine = ProtocolEngine()
+        self._responses: list[bytes] = []
+        self._waiter: asyncio.Future[None] | None = None
+        try:
+            # timeout=0 makes reads return immediately with what is available
+            self._serial = serial.Serial(port=port, baudrate=baudrate, timeout=0)
+            if not self._serial.is_open:
+                self._serial.open()
+        except (OSError, serial.SerialException) as e:
+            msg = f"Failed to open serial port {port}: {e}"
+            raise ConnectionError(msg) from e
+
+    async def send(self, data: bytes) -> bytes:
+        """Send data to the device and await its response.
+
+        Args:
+            data: Bytes to send to the device.
+
+        Returns:
+            Response frame from the device, or empty bytes if the timeout
+            expired before a complete frame arrived.
+
+        Raises:
+            ConnectionError: If the serial port is not open or communication fails.
+        """
+        return (await self.send_many([data]))[0]
+
+    async def send_many(self, packets: Sequence[bytes]) -> list[bytes]:
+        """Send several packets with a single write and await their responses.
+
+        Args:
+            packets: Packets to send, in order.
+
+        Returns:
+            Response frame for each packet, in the same order. Responses that
+            did not arrive within the timeout are empty bytes.
+
+        Raises:
+            ConnectionError: If the serial port is not open or communication fails.
+        """
+        if not packets:
+            return []
+        if not self._serial.is_open:
+            msg = "Serial port is not open"
+            raise ConnectionError(msg)
+
+        async with self._lock:
+            loop = self._watch()
+            self._responses = []
+            for packet in packets:
+                self._engine.send_packet(packet)
+            try:
+                try:
+                    self._serial.write(self._engine.data_to_send())
+                except (OSError, serial.SerialException) as e:
+                    msg = f"Serial communication failed: {e}"
+                    raise ConnectionError(msg) from e
+                while self._engine.outstanding:
+                    self._waiter = loop.create_future()
+                    try:
+                        await asyncio.wait_for(self._waiter, self._timeout)
+                    except asyncio.TimeoutError:
+                        break
+                missing = len(packets) - len(self._responses)
+                return [*self._responses, *(b"" for _ in range(missing))]
+            finally:
+                self._waiter = None
+                # Give up on the remaining packets and drop the incomplete
+                # frame so it cannot corrupt the next response
+                self._engine.clear()
+
+    def enable_low_latency(self) -> LowLatencyReport:
+        """Tune the port for the lowest response latency.
+
+        See `SerialAdapter.enable_low_latency`.
+
+        Returns:
+            Which optimizations took effect.
+
+        Raises:
+            ConnectionError: If the serial port is not open.
+        """
+        if not self._serial.is_open:
+            msg = "Serial port is not open"
+            raise ConnectionError(msg)
+        return enable_low_latency(self._serial.fileno())
+
+    def _watch(self) -> asyncio.AbstractEventLoop:
+        """Register the port with the running event loop on first use.
+
+        Returns:
+            The running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._unwatch()
+            loop.add_reader(self._serial.fileno(), self._on_readable)
+            self._loop = loop
+        return loop
+
+    def _unwatch(self) -> None:
+        """Stop watching the port's file descriptor."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._serial.fileno())
+        self._loop = None
+
+    def _on_readable(self) -> None:
+        """Collect available bytes and wake the task awaiting responses."""
+        try:
+            chunk = self._serial.read(self._serial.in_waiting or 1)
+        except (OSError, serial.SerialException) as e:
+            if self._waiter is not None and not self._waiter.done():
+                msg = f"Serial communication failed: {e}"
+                self._waiter.set_exception(ConnectionError(msg))
+            return
+        if not self._engine.outstanding:
+            # Nobody is waiting; drop stale data.
+            return
+        self._engine.receive_data(chunk)
+        received = len(self._responses)
+        while (frame := self._engine.next_response()) is not None:
+            self._responses.append(frame.raw)
+        if (
+            len(self._responses) > received
+            and self._waiter is not None
+            and not self._waiter.done()
+        ):
+            self._waiter.set_result(None)
+
+    async def close(self) -> None:
+        """Close the serial port."""
+        if hasattr(self, "_serial") and self._serial.is_open:
+            self._unwatch()
+            self._serial.close()
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager.
+
+        Returns:
+            Self for use in async with statement.
+        """
+        return self
+
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        """Exit async context manager and close serial port.
+
+        Args:
+            exc_type: Exception type if an exception was raised.
+            exc_val: Exception value if an exception was raised.
+            exc_tb: Exception traceback if an exception was raised.
+        """
+        await self.close()
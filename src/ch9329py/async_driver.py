@@ -0,0 +1,373 @@
+"""Asynchronous driver class for CH9329 USB HID device.
+
+This module provides the asyncio counterpart of `ch9329py.driver`. Packets are
+encoded by the same `ProtocolEngine` as `CH9329Driver`; only the transport is
+awaited.
+"""
+
+from __future__ import annotations
+
+import sys
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+from ch9329py.driver import Batch
+from ch9329py.engine import ProtocolEngine
+from ch9329py.exceptions import CH9329PyError
+from ch9329py.models import ChipInfo
+from ch9329py.protocol import CH9329Protocol
+from ch9329py.text import KeyboardLayout, compile_text
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Sequence
+
+    from ch9329py.async_adapter import AsyncCommunicationAdapter
+    from ch9329py.engine import InputData, PacketCache
+    from ch9329py.models import (
+        KeyboardInput,
+        KeyboardState,
+        MediaKeyInput,
+        MediaKeyState,
+        MouseInput,
+        MouseState,
+    )
+
+
+class AsyncCH9329Driver:
+    """Asynchronous low-level driver for CH9329 USB HID device.
+
+    This class provides the same state-based API as `CH9329Driver` with
+    awaitable methods, so a single event loop can drive many devices
+    concurrently.
+
+    Args:
+        adapter: Asynchronous communication adapter for sending/receiving data.
+        check_responses: Validate the device's responses (default: False).
+        max_retries: Retransmissions per call when a response is not a
+            successful acknowledgement (default: 0).
+        packet_cache: Cache to look up packets for repeated inputs instead
+            of encoding them on every call (default: None).
+
+    Raises:
+        ValueError: If max_retries is negative.
+
+    Examples:
+        >>> from ch9329py.async_adapter import AsyncSerialAdapter
+        >>> from ch9329py.async_driver import AsyncCH9329Driver
+        >>> from ch9329py.models import KeyboardInput, KeyCode
+        >>> async with AsyncSerialAdapter("/dev/ttyUSB0", 9600) as adapter:
+        ...     async with AsyncCH9329Driver(adapter) as driver:
+        ...         await driver.send_keyboard_input(
+        ...             KeyboardInput(keys=[KeyCode.KEY_A])
+        ...         )
+        ...         await driver.send_keyboard_input(KeyboardInput())
+    """
+
+    def __init__(
+        self,
+        adapter: AsyncCommunicationAdapter,
+        *,
+        check_responses: bool = False,
+        max_retries: int = 0,
+        packet_cache: PacketCache | None = None,
+    ) -> None:
+        """Initialize the asynchronous CH9329 driver.
+
+        Args:
+            adapter: Asynchronous communication adapter for sending/receiving data.
+            check_responses: Validate the device's responses.
+            max_retries: Retransmissions per call when a response is not a
+                successful acknowledgement.
+            packet_cache: Cache to look up packets for repeated inputs.
+
+        Raises:
+            ValueError: If max_retries is negative.
+        """
+        if max_retries < 0:
+            msg = f"max_retries must not be negative, got {max_retries}"
+            raise ValueError(msg)
+        self._adapter = adapter
+        self._check_responses = check_responses
+        self._max_retries = max_retries
+        self._batch: Batch | None = None
+        self._packet_cache = packet_cache
+
+    async def send_keyboard_input(
+        self, input_data: KeyboardInput | KeyboardState
+    ) -> None:
+        """Send a complete keyboard input with multiple keys and modifiers.
+
+        Args:
+            input_data: The keyboard input containing modifiers and keys, or
+                an equivalent `KeyboardState`.
+        """
+        await self._send(self._encode(input_data))
+
+    async def send_mouse_input(self, input_data: MouseInput | MouseState) -> None:
+        """Send a complete mouse input with buttons, movement, and scroll.
+
+        Args:
+            input_data: The mouse input containing buttons, movement, and scroll,
+                or an equivalent `MouseState`.
+        """
+        await self._send(self._encode(input_data))
+
+    async def send_media_key_input(
+        self, input_data: MediaKeyInput | MediaKeyState
+    ) -> None:
+        """Send a media key input.
+
+        Args:
+            input_data: The media key input containing keys to press or release,
+                or an equivalent `MediaKeyState`.
+        """
+        await self._send(self._encode(input_data))
+
+    async def send_keyboard_report(
+        self, modifier: int, hid_codes: Sequence[int]
+    ) -> None:
+        """Send a keyboard report given as already mapped USB HID values.
+
+        See `CH9329Driver.send_keyboard_report`.
+
+        Args:
+            modifier: Modifier bitmask (USB HID modifier bits).
+            hid_codes: USB HID keycodes of pressed keys (at most 6).
+
+        Raises:
+            ValueError: If more than 6 keycodes are given or a value does
+                not fit into a byte.
+        """
+        await self._send(CH9329Protocol.build_keyboard_packet(modifier, hid_codes))
+
+    async def send_mouse_report(
+        self, buttons: int, dx: int, dy: int, wheel: int = 0
+    ) -> None:
+        """Send a relative mouse report given as already mapped USB HID values.
+
+        See `CH9329Driver.send_mouse_report`.
+
+        Args:
+            buttons: Button bitmask (0x01 left, 0x02 right, 0x04 middle).
+            dx: Relative X movement (-128 to 127).
+            dy: Relative Y movement (-128 to 127).
+            wheel: Scroll wheel movement (-127 to 127).
+
+        Raises:
+            ValueError: If buttons does not fit into a byte.
+        """
+        await self._send(CH9329Protocol.build_mouse_rel_packet(buttons, dx, dy, wheel))
+
+    async def send_batch(self, inputs: Iterable[InputData]) -> list[bytes]:
+        """Send several inputs in a single transmission.
+
+        Args:
+            inputs: Keyboard, mouse and media key inputs, in sending order.
+
+        Returns:
+            Response bytes for each input, in the same order, or an empty list
+            inside a `batch` block.
+
+        Raises:
+            ResponseError: If responses are checked and a packet was not
+                acknowledged after all retries.
+        """
+        packets = [self._encode(input_data) for input_data in inputs]
+        if self._batch is not None:
+            self._batch.packets.extend(packets)
+            return []
+        return await self._send_many(packets)
+
+    async def type_text(
+        self,
+        text: str,
+        layout: KeyboardLayout = KeyboardLayout.US,
+        *,
+        rollover: bool = False,
+        check_caps_lock: bool = False,
+    ) -> list[bytes]:
+        """Type a string on the host.
+
+        See `CH9329Driver.type_text`.
+
+        Args:
+            text: Text to type.
+            layout: Keyboard layout configured on the host.
+            rollover: Whether to press several keys per report, which needs
+                fewer packets for most text.
+            check_caps_lock: Whether to read the Caps Lock state with
+                `get_info` and toggle it when that needs fewer reports.
+
+        Returns:
+            Response bytes for each packet, in order, or an empty list inside
+            a `batch` block.
+
+        Raises:
+            ValueError: If the layout cannot type a character of the text.
+            ResponseError: If responses are checked and a packet was not
+                acknowledged after all retries.
+            CH9329PyError: If the Caps Lock state is checked and could not be
+                read.
+        """
+        caps_lock = (await self.get_info()).caps_lock if check_caps_lock else None
+        packets = list(
+            compile_text(text, layout, rollover=rollover, caps_lock=caps_lock)
+        )
+        if self._batch is not None:
+            self._batch.packets.extend(packets)
+            return []
+        return await self._send_many(packets)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[Batch]:
+        """Buffer every input sent inside the block and flush them at once.
+
+        Behaves like `CH9329Driver.batch`: the packets are sent in a single
+        `send_many` call when the block exits normally, and discarded if it
+        raises.
+
+        Yields:
+            The batch collecting packets and, after the block, responses.
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        batch = Batch()
+        self._batch = batch
+        try:
+            yield batch
+        finally:
+            self._batch = None
+        if batch.packets:
+            batch.responses = await self._send_many(batch.packets)
+
+    async def get_info(self) -> ChipInfo:
+        """Read the chip's version, USB status and the host's keyboard LEDs.
+
+        See `CH9329Driver.get_info`.
+
+        Returns:
+            The chip information.
+
+        Raises:
+            CH9329PyError: If the device does not return valid information.
+        """
+        packet = CH9329Protocol.build_get_info_packet()
+        # Commands bypass any active batch because their response is needed
+        frame = CH9329Protocol.decode_response(
+            await self._adapter.send(packet), packet[3]
+        )
+        try:
+            return ChipInfo.from_data(frame.data)
+        except ValueError as e:
+            msg = f"Invalid chip info from device: {frame.raw.hex()}"
+            raise CH9329PyError(msg) from e
+
+    def _encode(self, input_data: InputData) -> bytes:
+        """Encode an input, through the packet cache if one is configured.
+
+        Args:
+            input_data: Keyboard, mouse or media key input.
+
+        Returns:
+            Packet as bytes.
+        """
+        if self._packet_cache is not None:
+            return self._packet_cache.encode(input_data)
+        return ProtocolEngine.encode(input_data)
+
+    async def _send(self, packet: bytes) -> None:
+        """Send a packet now, or buffer it if a batch is active.
+
+        Args:
+            packet: Encoded packet.
+
+        Raises:
+            ResponseError: If responses are checked and the packet was not
+                acknowledged after all retries.
+        """
+        if self._batch is not None:
+            self._batch.packets.append(packet)
+        else:
+            await self._send_many([packet])
+
+    async def _send_many(self, packets: list[bytes]) -> list[bytes]:
+        """Send packets in one transmission, retransmitting the failed ones.
+
+        Acknowledged packets are not sent again. See
+        `ProtocolEngine.retransmission` for the packets that follow the
+        failed ones and the failures that are never retransmitted.
+
+        Args:
+            packets: Encoded packets, in sending order.
+
+        Returns:
+            Response bytes for each packet, in the same order.
+
+        Raises:
+            ResponseError: If responses are checked and a packet was not
+                acknowledged after all retries, or cannot be resent safely.
+        """
+        responses = await self._transmit(packets)
+        if not self._check_responses:
+            return responses
+        retries = self._max_retries
+        sent: list[bytes] = packets
+        received = responses
+        indices = list(range(len(packets)))
+        while (failure := ProtocolEngine.first_failure(sent, received)) is not None:
+            if retries == 0:
+                raise failure[1]
+            retries -= 1
+            retransmission = ProtocolEngine.retransmission(sent, received)
+            sent = [sent[index] for index in retransmission.indices]
+            sent += retransmission.restore
+            indices = [indices[index] for index in retransmission.indices]
+            received = await self._transmit(sent)
+            # Responses to the restoring packets are checked but not returned
+            for index, response in zip(indices, received, strict=False):
+                responses[index] = response
+        return responses
+
+    async def _transmit(self, packets: list[bytes]) -> list[bytes]:
+        """Hand packets to the adapter.
+
+        Args:
+            packets: Encoded packets, in sending order.
+
+        Returns:
+            Response bytes for each packet, in the same order.
+        """
+        if len(packets) == 1:
+            return [await self._adapter.send(packets[0])]
+        return await self._adapter.send_many(packets)
+
+    async def close(self) -> None:
+        """Close the connection to the device."""
+        await self._adapter.close()
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager.
+
+        Returns:
+            Self for use in async with statement.
+        """
+        return self
+
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        """Exit async context manager and close connection.
+
+        Args:
+            exc_type: Exception type if an exception was raised.
+            exc_val: Exception value if an exception was raised.
+            exc_tb: Exception traceback if an exception was raised.
+        """
+        await self.close()
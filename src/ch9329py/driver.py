@@ -6,6 +6,8 @@ This module provides the low-level API for interacting with the CH9329 device.
 from __future__ import annotations
 
 import sys
+import time
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 if sys.version_info >= (3, 11):
@@ -13,21 +15,51 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self
 
-from ch9329py.evdev_mapping import (
-    evdev_to_usb_hid_keyboard,
-    evdev_to_usb_hid_modifier,
-    evdev_to_usb_hid_mouse,
-)
-from ch9329py.models import (
-    MAX_ROLLOVER_KEYS,
-    KeyboardInput,
-    MediaKeyInput,
-    MouseInput,
-)
-from ch9329py.protocol import CH9329Protocol
+from pydantic import ValidationError
+
+from ch9329py.engine import ProtocolEngine
+from ch9329py.exceptions import CH9329PyError
+from ch9329py.models import ChipInfo, ParameterConfig
+from ch9329py.protocol import CH9329Protocol, PacketEncoder, ResponseFrame
+from ch9329py.text import KeyboardLayout, compile_text
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
     from ch9329py.adapter import CommunicationAdapter
+    from ch9329py.engine import InputData, PacketCache
+    from ch9329py.models import (
+        KeyboardInput,
+        KeyboardState,
+        MediaKeyInput,
+        MediaKeyState,
+        MouseInput,
+        MouseState,
+    )
+    from ch9329py.protocol import PacketData
+
+
+class Batch:
+    """Packets collected by `CH9329Driver.batch` and their responses.
+
+    Attributes:
+        packets: Encoded packets in the order they were sent.
+        responses: Response bytes for each packet, filled in when the batch
+            is flushed. Empty until then.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty batch."""
+        self.packets: list[bytes] = []
+        self.responses: list[bytes] = []
+
+    def __len__(self) -> int:
+        """Return the number of packets in the batch.
+
+        Returns:
+            Number of collected packets.
+        """
+        return len(self.packets)
 
 
 class CH9329Driver:
@@ -36,8 +68,23 @@ class CH9329Driver:
     This class provides direct state-based API for keyboard, mouse, and media key
     simulation through the CH9329 chip.
 
+    Responses are ignored unless ``check_responses`` is enabled. Then every
+    response is validated and a missing, malformed or error response is
+    retransmitted right away, up to ``max_retries`` times, before a
+    `ResponseError` is raised. Only packets that were not acknowledged are
+    retransmitted, and a packet without a valid response only if resending
+    it cannot repeat a key press or movement the chip may have executed.
+
     Args:
         adapter: Communication adapter for sending/receiving data.
+        check_responses: Validate the device's responses (default: False).
+        max_retries: Retransmissions per call when a response is not a
+            successful acknowledgement (default: 0).
+        packet_cache: Cache to look up packets for repeated inputs instead
+            of encoding them on every call (default: None).
+
+    Raises:
+        ValueError: If max_retries is negative.
 
     Examples:
         >>> from ch9329py.adapter import SerialAdapter
@@ -59,22 +106,42 @@ class CH9329Driver:
     def __init__(
         self,
         adapter: CommunicationAdapter,
+        *,
+        check_responses: bool = False,
+        max_retries: int = 0,
+        packet_cache: PacketCache | None = None,
     ) -> None:
         """Initialize the CH9329 driver.
 
         Args:
             adapter: Communication adapter for sending/receiving data.
+            check_responses: Validate the device's responses.
+            max_retries: Retransmissions per call when a response is not a
+                successful acknowledgement.
+            packet_cache: Cache to look up packets for repeated inputs.
+
+        Raises:
+            ValueError: If max_retries is negative.
         """
+        if max_retries < 0:
+            msg = f"max_retries must not be negative, got {max_retries}"
+            raise ValueError(msg)
         self._adapter = adapter
+        self._check_responses = check_responses
+        self._max_retries = max_retries
+        self._batch: Batch | None = None
+        self._encoder = PacketEncoder()
+        self._packet_cache = packet_cache
 
-    def send_keyboard_input(self, input_data: KeyboardInput) -> None:
+    def send_keyboard_input(self, input_data: KeyboardInput | KeyboardState) -> None:
         """Send a complete keyboard input with multiple keys and modifiers.
 
         This is a low-level API that directly exposes CH9329's capability
         to send up to 6 simultaneous key presses with 8 modifier keys.
 
         Args:
-            input_data: The keyboard input containing modifiers and keys.
+            input_data: The keyboard input containing modifiers and keys, or
+                an equivalent `KeyboardState`.
 
         Examples:
             >>> # Press Ctrl+Shift+A
@@ -101,28 +168,9 @@ class CH9329Driver:
             >>> # Release all keys
             >>> driver.send_keyboard_input(KeyboardInput())
         """
-        # Build modifier byte from evdev modifier keys
-        modifier_byte = 0x00
-        for modifier_key in input_data.modifiers:
-            modifier_byte |= evdev_to_usb_hid_modifier(modifier_key.value)
-
-        # Convert evdev key codes to USB HID scan codes
-        usb_hid_keys = [evdev_to_usb_hid_keyboard(key.value) for key in input_data.keys]
+        self._send(self._encode(input_data))
 
-        # Pad to 6 keys with zeros
-        while len(usb_hid_keys) < MAX_ROLLOVER_KEYS:
-            usb_hid_keys.append(0x00)
-
-        # Build packet: [modifier, reserved, key1, key2, key3, key4, key5, key6]
-        # This directly corresponds to USB HID keyboard report format
-        data = [modifier_byte, 0x00, *usb_hid_keys]
-        packet = [0x57, 0xAB, 0x00, 0x02, len(data), *data]
-        checksum = sum(packet) & 0xFF
-        packet.append(checksum)
-
-        self._adapter.send(bytes(packet))
-
-    def send_mouse_input(self, input_data: MouseInput) -> None:
+    def send_mouse_input(self, input_data: MouseInput | MouseState) -> None:
         """Send a complete mouse input with buttons, movement, and scroll.
 
         This is a low-level API that directly exposes CH9329's capability
@@ -130,7 +178,8 @@ class CH9329Driver:
         relative movement and scroll in a single packet.
 
         Args:
-            input_data: The mouse input containing buttons, movement, and scroll.
+            input_data: The mouse input containing buttons, movement, and scroll,
+                or an equivalent `MouseState`.
 
         Examples:
             >>> # Move right and down
@@ -163,18 +212,9 @@ class CH9329Driver:
             >>> # Release
             >>> driver.send_mouse_input(MouseInput())
         """
-        # Build button byte from evdev button codes
-        button_byte = 0x00
-        for button in input_data.buttons:
-            button_byte |= evdev_to_usb_hid_mouse(button.value)
-
-        # Build packet using protocol
-        packet = CH9329Protocol.build_mouse_rel_packet(
-            button_byte, input_data.x, input_data.y, input_data.scroll
-        )
-        self._adapter.send(packet)
+        self._send(self._encode(input_data))
 
-    def send_media_key_input(self, input_data: MediaKeyInput) -> None:
+    def send_media_key_input(self, input_data: MediaKeyInput | MediaKeyState) -> None:
         """Send a media key input.
 
         This is a low-level API that directly sends media key state.
@@ -182,7 +222,8 @@ class CH9329Driver:
         media keys only support single key at a time.
 
         Args:
-            input_data: The media key input containing keys to press or release.
+            input_data: The media key input containing keys to press or release,
+                or an equivalent `MediaKeyState`.
 
         Examples:
             >>> # Mute audio (press)
@@ -201,18 +242,429 @@ class CH9329Driver:
             >>> input_data = MediaKeyInput(keys=[])
             >>> driver.send_media_key_input(input_data)
         """
-        if not input_data.keys:
-            # Empty keys list means release all media keys
-            packet = CH9329Protocol.build_media_release_packet()
-            self._adapter.send(packet)
+        self._send(self._encode(input_data))
+
+    def send_keyboard_report(self, modifier: int, hid_codes: Sequence[int]) -> None:
+        """Send a keyboard report given as already mapped USB HID values.
+
+        This is the fast path for latency-critical producers such as
+        passthrough and replay. It skips model validation and the evdev
+        mapping and encodes straight into the driver's reusable buffer, so
+        the caller is responsible for passing valid values.
+
+        Args:
+            modifier: Modifier bitmask (USB HID modifier bits).
+            hid_codes: USB HID keycodes of pressed keys (at most 6).
+
+        Raises:
+            ValueError: If more than 6 keycodes are given or a value does
+                not fit into a byte.
+            ResponseError: If responses are checked and the packet was not
+                acknowledged after all retries.
+
+        Examples:
+            >>> # Left Shift + A
+            >>> driver.send_keyboard_report(0x02, [0x04])
+            >>> driver.send_keyboard_report(0x00, [])
+        """
+        self._send(self._encoder.keyboard(modifier, hid_codes))
+
+    def send_mouse_report(self, buttons: int, dx: int, dy: int, wheel: int = 0) -> None:
+        """Send a relative mouse report given as already mapped USB HID values.
+
+        Like `send_keyboard_report`, this skips model validation and the
+        evdev mapping. Movement and wheel values are clamped to the report's
+        range.
+
+        Args:
+            buttons: Button bitmask (0x01 left, 0x02 right, 0x04 middle).
+            dx: Relative X movement (-128 to 127).
+            dy: Relative Y movement (-128 to 127).
+            wheel: Scroll wheel movement (-127 to 127).
+
+        Raises:
+            ValueError: If buttons does not fit into a byte.
+            ResponseError: If responses are checked and the packet was not
+                acknowledged after all retries.
+
+        Examples:
+            >>> # Left button held while moving right
+            >>> driver.send_mouse_report(0x01, 10, 0)
+        """
+        self._send(self._encoder.mouse_rel(buttons, dx, dy, wheel))
+
+    def send_batch(self, inputs: Iterable[InputData]) -> list[bytes]:
+        """Send several inputs in a single transmission.
+
+        All inputs are encoded up front and handed to the adapter's
+        `send_many`, which writes them in one go and collects every response
+        in one pass. Use this for bulk workloads such as typing or replaying
+        recorded input.
+
+        Args:
+            inputs: Keyboard, mouse and media key inputs, in sending order.
+
+        Returns:
+            Response bytes for each input, in the same order. Inside a
+            `batch` block the inputs are buffered instead and an empty list
+            is returned; the responses are available on the batch.
+
+        Raises:
+            ResponseError: If responses are checked and a packet was not
+                acknowledged after all retries.
+
+        Examples:
+            >>> # Type "hi"
+            >>> driver.send_batch([
+            ...     KeyboardInput(keys=[KeyCode.KEY_H]),
+            ...     KeyboardInput(),
+            ...     KeyboardInput(keys=[KeyCode.KEY_I]),
+            ...     KeyboardInput(),
+            ... ])
+        """
+        encode = (
+            ProtocolEngine.encode
+            if self._packet_cache is None
+            else self._packet_cache.encode
+        )
+        packets = [encode(input_data) for input_data in inputs]
+        if self._batch is not None:
+            self._batch.packets.extend(packets)
+            return []
+        return self._send_many(packets)
+
+    def type_text(
+        self,
+        text: str,
+        layout: KeyboardLayout = KeyboardLayout.US,
+        *,
+        rollover: bool = False,
+        check_caps_lock: bool = False,
+    ) -> list[bytes]:
+        r"""Type a string on the host.
+
+        The text is compiled by `compile_text` into keyboard reports, one per
+        character or, with ``rollover``, up to 6 characters per report, and
+        sent like `send_batch`. Repeated strings reuse their compiled packets.
+
+        With ``check_caps_lock``, the host's Caps Lock state is read with
+        `get_info` first, so letters keep their case when Caps Lock is on,
+        and Caps Lock is toggled for the text when that needs fewer reports.
+        The state is read immediately, even inside a `batch` block.
+
+        Args:
+            text: Text to type.
+            layout: Keyboard layout configured on the host.
+            rollover: Whether to press several keys per report, which needs
+                fewer packets for most text.
+            check_caps_lock: Whether to read and use the Caps Lock state.
+
+        Returns:
+            Response bytes for each packet, in order. Inside a `batch` block
+            the packets are buffered instead and an empty list is returned.
+
+        Raises:
+            ValueError: If the layout cannot type a character of the text.
+            ResponseError: If responses are checked and a packet was not
+                acknowledged after all retries.
+            CH9329PyError: If the Caps Lock state is checked and could not be
+                read.
+
+        Examples:
+            >>> driver.type_text("Hello, world!\n")
+            >>> driver.type_text("C:\\Users", layout=KeyboardLayout.JIS)
+            >>> driver.type_text("long generated text", rollover=True)
+            >>> driver.type_text("SELECT 1;", rollover=True, check_caps_lock=True)
+        """
+        caps_lock = self.get_info().caps_lock if check_caps_lock else None
+        packets = compile_text(text, layout, rollover=rollover, caps_lock=caps_lock)
+        if self._batch is not None:
+            self._batch.packets.extend(packets)
+            return []
+        return self._send_many(packets)
+
+    @contextmanager
+    def batch(self) -> Iterator[Batch]:
+        """Buffer every input sent inside the block and flush them at once.
+
+        Inputs passed to `send_keyboard_input`, `send_mouse_input`,
+        `send_media_key_input` and `send_batch` inside the block are encoded
+        immediately but not transmitted. When the block exits normally, all
+        packets are sent in a single `send_many` call and the responses are
+        stored on the yielded `Batch`. If the block raises, nothing is sent.
+
+        Nested `batch` blocks join the outermost one.
+
+        Yields:
+            The batch collecting packets and, after the block, responses.
+
+        Examples:
+            >>> # Ctrl+C as a single burst
+            >>> with driver.batch() as batch:
+            ...     driver.send_keyboard_input(KeyboardInput(
+            ...         modifiers={ModifierKey.KEY_LEFTCTRL},
+            ...         keys=[KeyCode.KEY_C],
+            ...     ))
+            ...     driver.send_keyboard_input(KeyboardInput())
+            >>> len(batch.responses)
+            2
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        batch = Batch()
+        self._batch = batch
+        try:
+            yield batch
+        finally:
+            self._batch = None
+        if batch.packets:
+            batch.responses = self._send_many(batch.packets)
+
+    def get_info(self) -> ChipInfo:
+        """Read the chip's version, USB status and the host's keyboard LEDs.
+
+        Returns:
+            The chip information.
+
+        Raises:
+            CH9329PyError: If the device does not return valid information.
+        """
+        frame = self._command(CH9329Protocol.build_get_info_packet())
+        try:
+            return ChipInfo.from_data(frame.data)
+        except ValueError as e:
+            msg = f"Invalid chip info from device: {frame.raw.hex()}"
+            raise CH9329PyError(msg) from e
+
+    def get_parameter_config(self) -> ParameterConfig:
+        """Read the parameter configuration stored in the chip.
+
+        Returns:
+            The chip's current parameter configuration.
+
+        Raises:
+            CH9329PyError: If the device does not return a valid configuration.
+        """
+        frame = self._command(CH9329Protocol.build_get_parameter_config_packet())
+        try:
+            return ParameterConfig(data=frame.data)
+        except ValidationError as e:
+            msg = f"Invalid parameter configuration from device: {frame.raw.hex()}"
+            raise CH9329PyError(msg) from e
+
+    def set_parameter_config(self, config: ParameterConfig) -> None:
+        """Write a parameter configuration to the chip.
+
+        The chip applies the new configuration after the next `reset` or
+        power cycle.
+
+        Args:
+            config: Configuration to store.
+
+        Raises:
+            ResponseError: If the device does not acknowledge the command.
+        """
+        self._command(CH9329Protocol.build_set_parameter_config_packet(config.data))
+
+    def reset(self) -> None:
+        """Perform a software reset of the chip.
+
+        Raises:
+            ResponseError: If the device does not acknowledge the command.
+        """
+        self._command(CH9329Protocol.build_reset_packet())
+
+    def change_baudrate(
+        self,
+        baudrate: int = 115200,
+        *,
+        attempts: int = 5,
+        settle_time: float = 0.05,
+    ) -> None:
+        """Move the chip and the adapter to another serial baud rate.
+
+        The new baud rate is written to the chip's parameter configuration,
+        the chip is reset so that it takes effect, and the adapter is switched
+        over. The change is verified by reading the configuration back at the
+        new baud rate. If the chip does not answer, the adapter falls back to
+        the old baud rate and the old configuration is restored.
+
+        At the factory default of 9600 baud a keyboard packet takes about
+        15 ms on the wire, so raising the baud rate is the biggest single
+        throughput improvement.
+
+        Args:
+            baudrate: Target baud rate in bits per second (default: 115200).
+            attempts: Number of verification attempts at each baud rate.
+            settle_time: Seconds to wait before each verification attempt.
+
+        Raises:
+            ValueError: If baudrate is not positive.
+            NotImplementedError: If the adapter cannot change its baud rate.
+                Nothing is written to the chip in that case.
+            CH9329PyError: If the change could not be verified. The message
+                tells whether the device is still reachable at the old rate.
+
+        Examples:
+            >>> with SerialAdapter("/dev/ttyUSB0", 9600) as adapter:
+            ...     driver = CH9329Driver(adapter)
+            ...     driver.change_baudrate(115200)
+        """
+        if baudrate <= 0:
+            msg = f"baudrate must be positive, got {baudrate}"
+            raise ValueError(msg)
+        # Checked before touching the chip: once it has been reset at the new
+        # baud rate, an adapter stuck at the old one can no longer reach it
+        if not self._adapter.supports_set_baudrate:
+            msg = (
+                f"{type(self._adapter).__name__} does not support changing "
+                "the baud rate"
+            )
+            raise NotImplementedError(msg)
+
+        current = self.get_parameter_config()
+        old_baudrate = current.baudrate
+        if old_baudrate == baudrate:
+            return
+
+        self.set_parameter_config(current.with_baudrate(baudrate))
+        self.reset()
+        self._adapter.set_baudrate(baudrate)
+        if self._probe(attempts, settle_time):
+            return
+
+        # Fall back: the chip did not come up at the new baud rate.
+        self._adapter.set_baudrate(old_baudrate)
+        if self._probe(attempts, settle_time):
+            self.set_parameter_config(current)
+            msg = (
+                f"Device did not switch to {baudrate} baud; "
+                f"it remains at {old_baudrate} baud"
+            )
+            raise CH9329PyError(msg)
+        msg = (
+            f"Device does not respond at {baudrate} or {old_baudrate} baud "
+            "after changing the baud rate"
+        )
+        raise CH9329PyError(msg)
+
+    def _probe(self, attempts: int, settle_time: float) -> bool:
+        """Check whether the chip answers at the adapter's current baud rate.
+
+        Args:
+            attempts: Number of attempts.
+            settle_time: Seconds to wait before each attempt.
+
+        Returns:
+            True if the chip answered with a valid configuration.
+        """
+        for _ in range(attempts):
+            time.sleep(settle_time)
+            try:
+                self.get_parameter_config()
+            except (CH9329PyError, ConnectionError):
+                continue
+            return True
+        return False
+
+    def _command(self, packet: bytes) -> ResponseFrame:
+        """Send a command packet directly and return the device's response.
+
+        Commands bypass any active batch because their response is needed.
+
+        Args:
+            packet: Encoded command packet.
+
+        Returns:
+            The response frame.
+
+        Raises:
+            ResponseError: If the device does not acknowledge the command.
+        """
+        return CH9329Protocol.decode_response(self._adapter.send(packet), packet[3])
+
+    def _encode(self, input_data: InputData) -> PacketData:
+        """Encode an input for immediate sending.
+
+        Args:
+            input_data: Keyboard, mouse or media key input.
+
+        Returns:
+            The cached packet if a packet cache is configured, otherwise a
+            view into the driver's reusable encoding buffer.
+        """
+        if self._packet_cache is not None:
+            return self._packet_cache.encode(input_data)
+        return ProtocolEngine.encode_into(self._encoder, input_data)
+
+    def _send(self, packet: PacketData) -> None:
+        """Send a packet now, or buffer it if a batch is active.
+
+        Args:
+            packet: Encoded packet. A view into the encoder's buffer is
+                copied before it is buffered.
+
+        Raises:
+            ResponseError: If responses are checked and the packet was not
+                acknowledged after all retries.
+        """
+        if self._batch is not None:
+            self._batch.packets.append(bytes(packet))
         else:
-            # Press the single media key
-            # Extract the 4-byte media key code from the enum value
-            data0, data1, data2, data3 = input_data.keys[0].value
+            self._send_many([packet])
+
+    def _send_many(self, packets: Sequence[PacketData]) -> list[bytes]:
+        """Send packets in one transmission, retransmitting the failed ones.
+
+        Acknowledged packets are not sent again. See
+        `ProtocolEngine.retransmission` for the packets that follow the
+        failed ones and the failures that are never retransmitted.
+
+        Args:
+            packets: Encoded packets, in sending order.
 
-            # Build packet using protocol
-            packet = CH9329Protocol.build_media_press_packet(data0, data1, data2, data3)
-            self._adapter.send(packet)
+        Returns:
+            Response bytes for each packet, in the same order.
+
+        Raises:
+            ResponseError: If responses are checked and a packet was not
+                acknowledged after all retries, or cannot be resent safely.
+        """
+        responses = self._transmit(packets)
+        if not self._check_responses:
+            return responses
+        retries = self._max_retries
+        sent: Sequence[PacketData] = packets
+        received = responses
+        indices = list(range(len(packets)))
+        while (failure := ProtocolEngine.first_failure(sent, received)) is not None:
+            if retries == 0:
+                raise failure[1]
+            retries -= 1
+            retransmission = ProtocolEngine.retransmission(sent, received)
+            sent = [sent[index] for index in retransmission.indices]
+            sent += retransmission.restore
+            indices = [indices[index] for index in retransmission.indices]
+            received = self._transmit(sent)
+            # Responses to the restoring packets are checked but not returned
+            for index, response in zip(indices, received, strict=False):
+                responses[index] = response
+        return responses
+
+    def _transmit(self, packets: Sequence[PacketData]) -> list[bytes]:
+        """Hand packets to the adapter.
+
+        Args:
+            packets: Encoded packets, in sending order.
+
+        Returns:
+            Response bytes for each packet, in the same order.
+        """
+        if len(packets) == 1:
+            return [self._adapter.send(packets[0])]
+        return self._adapter.send_many(packets)
 
     def close(self) -> None:
         """Close the connection to the device."""
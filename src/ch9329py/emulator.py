@@ -0,0 +1,491 @@
+"""Pty-backed CH9329 device emulator.
+
+This module provides a software stand-in for the CH9329 chip. The emulator
+opens a pseudo-terminal, parses the frames written to it, answers them like
+the chip does and logs the HID reports it would have sent to the host.
+Any adapter can be pointed at the emulator's port, which makes it possible
+to test and benchmark every transport mode without hardware.
+
+Transmission time is modeled from the emulated baud rate, because a pty
+delivers bytes instantly regardless of the configured speed.
+
+Requires a POSIX platform with pseudo-terminal support.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import select
+import sys
+import threading
+import time
+import tty
+from typing import TYPE_CHECKING, NamedTuple, TypeAlias
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+from ch9329py.models import PARAMETER_CONFIG_LENGTH, ParameterConfig
+from ch9329py.protocol import CH9329Protocol, ResponseStatus
+from ch9329py.timing import wire_time
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# Header, address, command and length bytes plus the trailing checksum
+_FRAME_OVERHEAD = 6
+_HEADER = b"\x57\xab"
+# Longest data section the chip accepts
+_MAX_DATA_LENGTH = 64
+# Address that every chip answers to
+_BROADCAST_ADDRESS = 0xFF
+
+_CMD_GET_INFO = 0x01
+_CMD_KEYBOARD = 0x02
+_CMD_MEDIA = 0x03
+_CMD_MOUSE_ABS = 0x04
+_CMD_MOUSE_REL = 0x05
+_CMD_GET_PARA_CFG = 0x08
+_CMD_SET_PARA_CFG = 0x09
+_CMD_RESET = 0x0F
+
+# Data section lengths of the HID report commands
+_KEYBOARD_DATA_LENGTH = 8
+_MEDIA_DATA_LENGTH = 4
+_MOUSE_ABS_DATA_LENGTH = 7
+_MOUSE_REL_DATA_LENGTH = 5
+
+# Chip version and USB status reported by the get info command (enumerated)
+_INFO_VERSION = 0x30
+_INFO_USB_CONNECTED = 0x01
+# Keyboard LED bit and usage of Caps Lock, which the emulated host toggles
+_CAPS_LOCK_LED = 0x02
+_CAPS_LOCK_KEYCODE = 0x39
+
+
+def default_parameter_config(baudrate: int = 9600) -> ParameterConfig:
+    """Return the factory parameter configuration of the chip.
+
+    Args:
+        baudrate: Serial baud rate to store in the configuration.
+
+    Returns:
+        Configuration with protocol transmission mode, address 0x00 and a
+        3 ms packet interval.
+    """
+    data = bytearray(PARAMETER_CONFIG_LENGTH)
+    data[0] = 0x80
+    data[1] = 0x80
+    data[3:7] = baudrate.to_bytes(4, "big")
+    data[9:11] = (3).to_bytes(2, "big")
+    return ParameterConfig(data=bytes(data))
+
+
+class KeyboardReport(NamedTuple):
+    """Keyboard report decoded by the emulator.
+
+    Attributes:
+        modifier: USB HID modifier bitmask.
+        keycodes: USB HID codes of the pressed keys, without empty slots.
+    """
+
+    modifier: int
+    keycodes: tuple[int, ...]
+
+
+class MouseReport(NamedTuple):
+    """Mouse report decoded by the emulator.
+
+    Attributes:
+        buttons: USB HID button bitmask.
+        x: Relative movement, or absolute position (0-4095).
+        y: Relative movement, or absolute position (0-4095).
+        scroll: Scroll wheel movement.
+        absolute: Whether x and y are absolute coordinates.
+    """
+
+    buttons: int
+    x: int
+    y: int
+    scroll: int
+    absolute: bool
+
+
+class MediaReport(NamedTuple):
+    """Media key report decoded by the emulator.
+
+    Attributes:
+        data: The 4-byte media key report.
+    """
+
+    data: bytes
+
+
+HIDReport: TypeAlias = KeyboardReport | MouseReport | MediaReport
+"""Any HID report the emulator can decode."""
+
+
+class LoggedReport(NamedTuple):
+    """A HID report together with the time the emulated chip sent it.
+
+    Attributes:
+        timestamp: `time.perf_counter` value when the report was applied.
+        report: The decoded report.
+    """
+
+    timestamp: float
+    report: HIDReport
+
+
+class KeyPress(NamedTuple):
+    """Key press as the host observes it.
+
+    Attributes:
+        modifier: USB HID modifier bitmask in effect when the key went down.
+        keycode: USB HID keycode of the pressed key.
+    """
+
+    modifier: int
+    keycode: int
+
+
+def key_presses(reports: Iterable[HIDReport]) -> list[KeyPress]:
+    """Replay keyboard reports the way a host decodes them.
+
+    For each report the host applies the modifier byte first, then releases
+    the keys missing from the previous report and presses the new keys in
+    the order of the key array. Non-keyboard reports are skipped.
+
+    Args:
+        reports: Reports in the order the chip sent them, e.g. from
+            `CH9329Emulator.reports`.
+
+    Returns:
+        Every key press, in the order the host registers them.
+
+    Examples:
+        >>> key_presses([KeyboardReport(0x02, (0x04,)), KeyboardReport(0, ())])
+        [KeyPress(modifier=2, keycode=4)]
+    """
+    presses: list[KeyPress] = []
+    held: tuple[int, ...] = ()
+    for report in reports:
+        if not isinstance(report, KeyboardReport):
+            continue
+        presses.extend(
+            KeyPress(report.modifier, keycode)
+            for keycode in report.keycodes
+            if keycode not in held
+        )
+        held = report.keycodes
+    return presses
+
+
+class CH9329Emulator:
+    """Software emulation of a CH9329 chip behind a pseudo-terminal.
+
+    Frames written to `port` are parsed like the chip does. Input reports are
+    acknowledged and logged, parameter configuration and chip information
+    requests are answered, and malformed frames get the chip's error
+    responses. Pressing Caps Lock toggles the Caps Lock LED that the chip
+    information reports, like a host would. Every response is delayed by the
+    time the request and the response take on the wire at the emulated baud
+    rate plus ``processing_latency``.
+
+    Args:
+        baudrate: Emulated serial baud rate (default: 9600).
+        processing_latency: Time in seconds the chip takes to process a
+            command (default: 0.001).
+        address: Serial address of the chip (default: 0x00).
+        caps_lock: Whether the host's Caps Lock is on initially
+            (default: False).
+
+    Raises:
+        OSError: If no pseudo-terminal can be opened.
+
+    Examples:
+        >>> with CH9329Emulator(baudrate=115200) as emulator:
+        ...     with SerialAdapter(emulator.port, 115200) as adapter:
+        ...         CH9329Driver(adapter).send_keyboard_input(
+        ...             KeyboardInput(keys=[KeyCode.KEY_A])
+        ...         )
+        ...     emulator.reports[0].report
+        KeyboardReport(modifier=0, keycodes=(4,))
+    """
+
+    def __init__(
+        self,
+        baudrate: int = 9600,
+        processing_latency: float = 0.001,
+        address: int = 0x00,
+        *,
+        caps_lock: bool = False,
+    ) -> None:
+        """Open the pseudo-terminal and start emulating.
+
+        Args:
+            baudrate: Emulated serial baud rate.
+            processing_latency: Time in seconds the chip takes to process a
+                command.
+            address: Serial address of the chip.
+            caps_lock: Whether the host's Caps Lock is on initially.
+
+        Raises:
+            OSError: If no pseudo-terminal can be opened.
+        """
+        self._processing_latency = processing_latency
+        self._address = address
+        self._config = default_parameter_config(baudrate)
+        self._stored_config = self._config
+        self._received: list[bytes] = []
+        self._reports: list[LoggedReport] = []
+        self._failures: list[ResponseStatus] = []
+        self._caps_lock = caps_lock
+        self._held_keycodes: tuple[int, ...] = ()
+        self._lock = threading.Lock()
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._master)
+        self._wake_read, self._wake_write = os.pipe()
+        self.port = os.ttyname(self._slave)
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    @property
+    def baudrate(self) -> int:
+        """Baud rate the emulated chip is currently running at."""
+        return self._config.baudrate
+
+    @property
+    def caps_lock(self) -> bool:
+        """Whether the host's Caps Lock is on.
+
+        The emulated host toggles it whenever a keyboard report presses the
+        Caps Lock key.
+        """
+        with self._lock:
+            return self._caps_lock
+
+    @property
+    def received(self) -> list[bytes]:
+        """Well-formed frames received so far, in order."""
+        with self._lock:
+            return list(self._received)
+
+    @property
+    def reports(self) -> list[LoggedReport]:
+        """HID reports applied so far, in order."""
+        with self._lock:
+            return list(self._reports)
+
+    def fail_next(self, status: ResponseStatus, count: int = 1) -> None:
+        """Answer the next commands with an error instead of executing them.
+
+        Args:
+            status: Error status to report.
+            count: Number of commands to fail.
+        """
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def close(self) -> None:
+        """Stop emulating and close the pseudo-terminal."""
+        if self._thread.is_alive():
+            os.write(self._wake_write, b"\x00")
+            self._thread.join(timeout=1)
+        for fd in (self._slave, self._master, self._wake_read, self._wake_write):
+            with contextlib.suppress(OSError):
+                os.close(fd)
+
+    def __enter__(self) -> Self:
+        """Enter context manager.
+
+        Returns:
+            Self for use in with statement.
+        """
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        """Exit context manager and stop emulating.
+
+        Args:
+            exc_type: Exception type if an exception was raised.
+            exc_val: Exception value if an exception was raised.
+            exc_tb: Exception traceback if an exception was raised.
+        """
+        self.close()
+
+    def _serve(self) -> None:
+        """Read frames from the pty and answer them until closed."""
+        buffer = bytearray()
+        # Times at which the emulated RX and TX lines become idle
+        rx_idle = tx_idle = 0.0
+        while True:
+            readable, _, _ = select.select([self._master, self._wake_read], [], [])
+            if self._wake_read in readable:
+                return
+            try:
+                chunk = os.read(self._master, 4096)
+            except OSError:
+                return
+            arrived = time.perf_counter()
+            buffer += chunk
+            while (frame := self._next_frame(buffer)) is not None:
+                rx_idle = max(rx_idle, arrived) + wire_time(len(frame), self.baudrate)
+                response = self._handle(frame)
+                if response is None:
+                    continue
+                ready = max(rx_idle, tx_idle) + self._processing_latency
+                tx_idle = ready + wire_time(len(response), self.baudrate)
+                delay = tx_idle - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                try:
+                    os.write(self._master, response)
+                except OSError:
+                    return
+
+    @staticmethod
+    def _next_frame(buffer: bytearray) -> bytes | None:
+        """Remove and return the next frame from the buffer.
+
+        Bytes before a header are discarded. The frame is returned even if its
+        checksum is wrong, so that it can be answered with an error.
+
+        Args:
+            buffer: Received bytes.
+
+        Returns:
+            The next complete frame, or None if more bytes are needed.
+        """
+        while True:
+            start = buffer.find(_HEADER)
+            if start < 0:
+                del buffer[: len(buffer) - 1]
+                return None
+            del buffer[:start]
+            if len(buffer) < _FRAME_OVERHEAD - 1:
+                return None
+            if buffer[4] > _MAX_DATA_LENGTH:
+                del buffer[:1]
+                continue
+            length = buffer[4] + _FRAME_OVERHEAD
+            if len(buffer) < length:
+                return None
+            frame = bytes(buffer[:length])
+            del buffer[:length]
+            return frame
+
+    def _handle(self, frame: bytes) -> bytes | None:
+        """Execute a frame and build the chip's response.
+
+        Args:
+            frame: Complete frame received from the host.
+
+        Returns:
+            Response frame, or None if the frame is addressed to another chip.
+        """
+        address, command, data = frame[2], frame[3], frame[5:-1]
+        if address not in (self._address, _BROADCAST_ADDRESS):
+            return None
+        if sum(frame[:-1]) & 0xFF != frame[-1]:
+            return CH9329Protocol.build_status_packet(command, ResponseStatus.ERR_SUM)
+        with self._lock:
+            self._received.append(frame)
+            if self._failures:
+                status = self._failures.pop(0)
+                return CH9329Protocol.build_status_packet(command, status)
+
+        if command == _CMD_GET_INFO:
+            return CH9329Protocol.build_response_packet(command, self._info())
+        if command == _CMD_GET_PARA_CFG:
+            return CH9329Protocol.build_response_packet(command, self._config.data)
+        status = self._execute(command, data)
+        return CH9329Protocol.build_status_packet(command, status)
+
+    def _execute(self, command: int, data: bytes) -> ResponseStatus:
+        """Execute a command that is answered with a status.
+
+        Args:
+            command: Command byte.
+            data: Data section of the frame.
+
+        Returns:
+            Status to report.
+        """
+        if command == _CMD_SET_PARA_CFG:
+            if len(data) != PARAMETER_CONFIG_LENGTH:
+                return ResponseStatus.ERR_PARA
+            self._stored_config = ParameterConfig(data=data)
+            return ResponseStatus.SUCCESS
+        if command == _CMD_RESET:
+            self._config = self._stored_config
+            return ResponseStatus.SUCCESS
+        if command not in _REPORT_DECODERS:
+            return ResponseStatus.ERR_CMD
+        expected_length, decode = _REPORT_DECODERS[command]
+        if len(data) != expected_length:
+            return ResponseStatus.ERR_PARA
+        report = LoggedReport(timestamp=time.perf_counter(), report=decode(data))
+        with self._lock:
+            self._reports.append(report)
+            if isinstance(report.report, KeyboardReport):
+                keycodes = report.report.keycodes
+                if (
+                    _CAPS_LOCK_KEYCODE in keycodes
+                    and _CAPS_LOCK_KEYCODE not in self._held_keycodes
+                ):
+                    self._caps_lock = not self._caps_lock
+                self._held_keycodes = keycodes
+        return ResponseStatus.SUCCESS
+
+    def _info(self) -> bytes:
+        """Build the data section of the get info response.
+
+        Returns:
+            Chip version, USB status, keyboard LEDs and reserved bytes.
+        """
+        with self._lock:
+            leds = _CAPS_LOCK_LED if self._caps_lock else 0x00
+        return bytes([_INFO_VERSION, _INFO_USB_CONNECTED, leds, 0, 0, 0, 0, 0])
+
+
+def _decode_keyboard(data: bytes) -> KeyboardReport:
+    """Decode the data section of a keyboard command."""
+    return KeyboardReport(
+        modifier=data[0], keycodes=tuple(code for code in data[2:] if code)
+    )
+
+
+def _decode_media(data: bytes) -> MediaReport:
+    """Decode the data section of a media key command."""
+    return MediaReport(data=data)
+
+
+def _decode_mouse_abs(data: bytes) -> MouseReport:
+    """Decode the data section of an absolute mouse command."""
+    return MouseReport(
+        buttons=data[1],
+        x=int.from_bytes(data[2:4], "little"),
+        y=int.from_bytes(data[4:6], "little"),
+        scroll=int.from_bytes(data[6:7], "big", signed=True),
+        absolute=True,
+    )
+
+
+def _decode_mouse_rel(data: bytes) -> MouseReport:
+    """Decode the data section of a relative mouse command."""
+    x, y, scroll = (
+        int.from_bytes(data[i : i + 1], "big", signed=True) for i in (2, 3, 4)
+    )
+    return MouseReport(buttons=data[1], x=x, y=y, scroll=scroll, absolute=False)
+
+
+_REPORT_DECODERS: dict[int, tuple[int, Callable[[bytes], HIDReport]]] = {
+    _CMD_KEYBOARD: (_KEYBOARD_DATA_LENGTH, _decode_keyboard),
+    _CMD_MEDIA: (_MEDIA_DATA_LENGTH, _decode_media),
+    _CMD_MOUSE_ABS: (_MOUSE_ABS_DATA_LENGTH, _decode_mouse_abs),
+    _CMD_MOUSE_REL: (_MOUSE_REL_DATA_LENGTH, _decode_mouse_rel),
+}
@@ -0,0 +1,724 @@
+"""Sans-IO protocol engine for CH9329 device.
+
+This module contains the transport-independent core shared by the drivers
+and by the sync, termios, asyncio and pipelined adapters. The engine turns
+input models into packets and received bytes into responses, but never
+performs I/O itself: callers write out the bytes it produces and feed it the
+bytes they read.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple, TypeAlias
+
+from ch9329py.evdev_mapping import (
+    evdev_to_usb_hid_keyboard_report,
+    evdev_to_usb_hid_mouse_buttons,
+)
+from ch9329py.exceptions import DeviceStatusError, ResponseError
+from ch9329py.protocol import CH9329Protocol, FrameParser, ResponseFrame
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Sequence
+
+    from ch9329py.models import (
+        KeyboardInput,
+        KeyboardState,
+        MediaKeyInput,
+        MediaKeyState,
+        MouseInput,
+        MouseState,
+    )
+    from ch9329py.protocol import PacketData, PacketEncoder
+
+InputData: TypeAlias = (
+    "KeyboardInput | MouseInput | MediaKeyInput"
+    " | KeyboardState | MouseState | MediaKeyState"
+)
+"""Any input model or lightweight input state that can be sent to the device."""
+
+# Data bytes of the media key release packet
+_MEDIA_RELEASE = (0x02, 0x00, 0x00, 0x00)
+
+_CMD_KEYBOARD = 0x02
+_CMD_MEDIA = 0x03
+_CMD_MOUSE_ABS = 0x04
+_CMD_MOUSE_REL = 0x05
+# Set in the command byte of a successful and of an error response
+_RESPONSE_OK = 0x80
+_RESPONSE_ERROR = 0xC0
+# Offsets of the command byte, first data byte and mouse button byte
+_COMMAND_OFFSET = 3
+_DATA_OFFSET = 5
+_MOUSE_BUTTON_OFFSET = 6
+
+
+class _InputTypes(NamedTuple):
+    """Input classes that the encoder dispatches on."""
+
+    keyboard_input: type[KeyboardInput]
+    mouse_input: type[MouseInput]
+    media_key_input: type[MediaKeyInput]
+    keyboard_state: type[KeyboardState]
+    mouse_state: type[MouseState]
+    media_key_state: type[MediaKeyState]
+
+
+@cache
+def _input_types() -> _InputTypes:
+    """Import the input models on first use.
+
+    The transports only need the response state machine, so importing the
+    engine must not load pydantic through `ch9329py.models`.
+
+    Returns:
+        The input classes.
+    """
+    from ch9329py import models  # noqa: PLC0415
+
+    return _InputTypes(
+        models.KeyboardInput,
+        models.MouseInput,
+        models.MediaKeyInput,
+        models.KeyboardState,
+        models.MouseState,
+        models.MediaKeyState,
+    )
+
+
+def _unsupported(input_data: object) -> TypeError:
+    """Build the error for an object that is not an input.
+
+    Args:
+        input_data: The rejected object.
+
+    Returns:
+        The error to raise.
+    """
+    return TypeError(f"Unsupported input type: {type(input_data).__name__}")
+
+
+class Retransmission(NamedTuple):
+    """Packets to resend after some of them were not acknowledged.
+
+    Attributes:
+        indices: Indices of the failed packets, in sending order.
+        restore: Packets sent after the failed ones to put each device back
+            into the state the acknowledged packets left it in.
+    """
+
+    indices: list[int]
+    restore: list[bytes]
+
+
+class ResponseReceived(NamedTuple):
+    """A frame that answers the oldest outstanding packet.
+
+    Attributes:
+        frame: The response frame.
+    """
+
+    frame: ResponseFrame
+
+
+class UnsolicitedFrame(NamedTuple):
+    """A frame that does not answer the oldest outstanding packet.
+
+    Attributes:
+        frame: The received frame.
+    """
+
+    frame: ResponseFrame
+
+
+EngineEvent: TypeAlias = ResponseReceived | UnsolicitedFrame
+"""Any event returned by `ProtocolEngine.next_event`."""
+
+
+class ProtocolEngine:
+    """Sans-IO state machine for the CH9329 serial protocol.
+
+    Packets are queued with `send` or `send_packet`, the resulting bytes are
+    collected with `data_to_send` and written by the transport. Bytes read
+    from the device are passed to `receive_data`, and the frames parsed from
+    them are retrieved with `next_event`, or `next_response` when only the
+    answers are of interest.
+
+    The chip answers packets in order, so a frame answers the oldest
+    outstanding packet if it carries that packet's command. Any other frame
+    is reported as unsolicited and leaves the outstanding packets alone.
+    Transports that give up waiting for a response call `expire`.
+
+    The static methods encode inputs and check responses without any state.
+
+    Examples:
+        >>> engine = ProtocolEngine()
+        >>> engine.send(KeyboardInput(keys=[KeyCode.KEY_A]))
+        >>> engine.send(KeyboardInput())
+        >>> serial_port.write(engine.data_to_send())
+        >>> engine.receive_data(serial_port.read(14))
+        >>> while (frame := engine.next_response()) is not None:
+        ...     print(frame.command)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an engine with empty buffers."""
+        self._outgoing = bytearray()
+        self._parser = FrameParser()
+        # Commands of the packets still waiting for a response, oldest first
+        self._expected: deque[int] = deque()
+
+    @property
+    def outstanding(self) -> int:
+        """Number of queued packets whose response has not been received yet."""
+        return len(self._expected)
+
+    @property
+    def bytes_needed(self) -> int:
+        """Minimum number of bytes needed before the next frame can complete.
+
+        See `FrameParser.bytes_needed`.
+        """
+        return self._parser.bytes_needed
+
+    def send(self, input_data: InputData) -> None:
+        """Queue an input for transmission.
+
+        Args:
+            input_data: Keyboard, mouse or media key input.
+
+        Raises:
+            TypeError: If the input is not an input model or input state.
+            UnsupportedEvdevCodeError: If a key, modifier or button is not
+                supported.
+        """
+        self.send_packet(self.encode(input_data))
+
+    def send_packet(self, packet: PacketData) -> None:
+        """Queue an already encoded packet for transmission.
+
+        Args:
+            packet: Complete CH9329 packet.
+        """
+        self._outgoing += packet
+        self._expected.append(packet[_COMMAND_OFFSET])
+
+    def data_to_send(self) -> bytes:
+        """Return and clear all bytes waiting to be written to the device.
+
+        Returns:
+            Concatenated packets queued since the last call.
+        """
+        data = bytes(self._outgoing)
+        self._outgoing.clear()
+        return data
+
+    def receive_data(self, data: bytes | bytearray | memoryview) -> None:
+        """Feed bytes read from the device into the engine.
+
+        Args:
+            data: Bytes read from the device, in any chunking.
+        """
+        self._parser.feed(data)
+
+    def next_event(self) -> EngineEvent | None:
+        """Return the next frame received from the device.
+
+        Returns:
+            The oldest unread frame, as a response if it answers the oldest
+            outstanding packet and as an unsolicited frame otherwise, or
+            None if no complete frame is buffered.
+        """
+        frame = self._parser.next_frame()
+        if frame is None:
+            return None
+        if self._expected and frame.command in (
+            self._expected[0] | _RESPONSE_OK,
+            self._expected[0] | _RESPONSE_ERROR,
+        ):
+            self._expected.popleft()
+            return ResponseReceived(frame)
+        return UnsolicitedFrame(frame)
+
+    def next_response(self) -> ResponseFrame | None:
+        """Return the next response, dropping unsolicited frames.
+
+        Returns:
+            The frame answering the oldest outstanding packet, or None if no
+            complete response is buffered.
+        """
+        while (event := self.next_event()) is not None:
+            if isinstance(event, ResponseReceived):
+                return event.frame
+        return None
+
+    def expire(self) -> bool:
+        """Stop waiting for the response to the oldest outstanding packet.
+
+        The incomplete frame received so far is dropped as well, so that it
+        cannot corrupt the next response.
+
+        Returns:
+            True if a packet was outstanding.
+        """
+        self._parser.clear()
+        if not self._expected:
+            return False
+        self._expected.popleft()
+        return True
+
+    def clear(self) -> None:
+        """Forget all queued bytes, outstanding packets and received bytes."""
+        self._outgoing.clear()
+        self._parser.clear()
+        self._expected.clear()
+
+    @staticmethod
+    def encode(input_data: InputData) -> bytes:
+        """Encode any input model or input state into a CH9329 packet.
+
+        Args:
+            input_data: Keyboard, mouse or media key input.
+
+        Returns:
+            Packet as bytes.
+
+        Raises:
+            TypeError: If the input is not an input model or input state.
+        """
+        types = _input_types()
+        if isinstance(input_data, types.keyboard_state):
+            return CH9329Protocol.build_keyboard_packet(*input_data)
+        if isinstance(input_data, types.mouse_state):
+            return CH9329Protocol.build_mouse_rel_packet(*input_data)
+        if isinstance(input_data, types.media_key_state):
+            return CH9329Protocol.build_media_press_packet(*input_data.data)
+        if isinstance(input_data, types.keyboard_input):
+            return ProtocolEngine.encode_keyboard_input(input_data)
+        if isinstance(input_data, types.mouse_input):
+            return ProtocolEngine.encode_mouse_input(input_data)
+        if isinstance(input_data, types.media_key_input):
+            return ProtocolEngine.encode_media_key_input(input_data)
+        raise _unsupported(input_data)
+
+    @staticmethod
+    def encode_into(encoder: PacketEncoder, input_data: InputData) -> memoryview:
+        """Encode any input model in place into an encoder's buffer.
+
+        Produces the same packets as `encode` without allocating them.
+
+        Args:
+            encoder: Encoder that owns the packet buffer.
+            input_data: Keyboard, mouse or media key input.
+
+        Returns:
+            View of the packet, valid until the encoder writes the next
+            packet of the same type.
+
+        Raises:
+            TypeError: If the input is not an input model or input state.
+            UnsupportedEvdevCodeError: If a key, modifier or button is not
+                supported.
+        """
+        types = _input_types()
+        if isinstance(input_data, types.keyboard_state):
+            return encoder.keyboard(*input_data)
+        if isinstance(input_data, types.mouse_state):
+            return encoder.mouse_rel(*input_data)
+        if isinstance(input_data, types.keyboard_input):
+            return encoder.keyboard(*ProtocolEngine._keyboard_report(input_data))
+        if isinstance(input_data, types.mouse_input):
+            return encoder.mouse_rel(
+                ProtocolEngine._button_byte(input_data),
+                input_data.x,
+                input_data.y,
+                input_data.scroll,
+            )
+        if isinstance(input_data, types.media_key_state):
+            data = input_data.data
+        elif not isinstance(input_data, types.media_key_input):
+            raise _unsupported(input_data)
+        elif input_data.keys:
+            data = input_data.keys[0].value
+        else:
+            data = _MEDIA_RELEASE
+        return encoder.media(*data)
+
+    @staticmethod
+    def encode_keyboard_input(input_data: KeyboardInput) -> bytes:
+        """Encode a keyboard input into a CH9329 packet.
+
+        Args:
+            input_data: The keyboard input containing modifiers and keys.
+
+        Returns:
+            Keyboard packet as bytes.
+
+        Raises:
+            UnsupportedEvdevCodeError: If a key or modifier is not supported.
+        """
+        modifier_byte, usb_hid_keys = ProtocolEngine._keyboard_report(input_data)
+        return CH9329Protocol.build_keyboard_packet(modifier_byte, usb_hid_keys)
+
+    @staticmethod
+    def encode_mouse_input(input_data: MouseInput) -> bytes:
+        """Encode a mouse input into a CH9329 relative movement packet.
+
+        Args:
+            input_data: The mouse input containing buttons, movement, and scroll.
+
+        Returns:
+            Mouse relative movement packet as bytes.
+
+        Raises:
+            UnsupportedEvdevCodeError: If a button is not supported.
+        """
+        return CH9329Protocol.build_mouse_rel_packet(
+            ProtocolEngine._button_byte(input_data),
+            input_data.x,
+            input_data.y,
+            input_data.scroll,
+        )
+
+    @staticmethod
+    def encode_media_key_input(input_data: MediaKeyInput) -> bytes:
+        """Encode a media key input into a CH9329 packet.
+
+        Args:
+            input_data: The media key input containing keys to press or release.
+
+        Returns:
+            Media key packet as bytes.
+        """
+        if not input_data.keys:
+            # Empty keys list means release all media keys
+            return CH9329Protocol.build_media_release_packet()
+
+        # Extract the 4-byte media key code from the enum value
+        data0, data1, data2, data3 = input_data.keys[0].value
+        return CH9329Protocol.build_media_press_packet(data0, data1, data2, data3)
+
+    @staticmethod
+    def _keyboard_report(input_data: KeyboardInput) -> tuple[int, bytes]:
+        """Convert a keyboard input into its USB HID modifier byte and keycodes.
+
+        Args:
+            input_data: The keyboard input containing modifiers and keys.
+
+        Returns:
+            The modifier bitmask and the USB HID keycodes of pressed keys.
+
+        Raises:
+            UnsupportedEvdevCodeError: If a key or modifier is not supported.
+        """
+        return evdev_to_usb_hid_keyboard_report(
+            {modifier_key.value for modifier_key in input_data.modifiers},
+            [key.value for key in input_data.keys],
+        )
+
+    @staticmethod
+    def _button_byte(input_data: MouseInput) -> int:
+        """Convert the pressed mouse buttons into a USB HID button byte.
+
+        Args:
+            input_data: The mouse input containing buttons.
+
+        Returns:
+            The button bitmask.
+
+        Raises:
+            UnsupportedEvdevCodeError: If a button is not supported.
+        """
+        return evdev_to_usb_hid_mouse_buttons(
+            {button.value for button in input_data.buttons}
+        )
+
+    @staticmethod
+    def first_failure(
+        packets: Sequence[PacketData], responses: Sequence[bytes], start: int = 0
+    ) -> tuple[int, ResponseError] | None:
+        """Find the first packet whose response is not a successful acknowledgement.
+
+        Args:
+            packets: Packets that were sent.
+            responses: Response bytes for each packet, in the same order.
+            start: Index of the first packet to check.
+
+        Returns:
+            The index of the failed packet and the error describing its
+            response, or None if every response is a successful acknowledgement.
+        """
+        for index in range(start, len(packets)):
+            error = ProtocolEngine._response_error(packets[index], responses[index])
+            if error is not None:
+                return index, error
+        return None
+
+    @staticmethod
+    def retransmission(
+        packets: Sequence[PacketData], responses: Sequence[bytes]
+    ) -> Retransmission:
+        """Plan how to resend the packets that were not acknowledged.
+
+        Only the failed packets are resent, so acknowledged packets are not
+        applied twice. A resent packet may be older than acknowledged
+        packets of the same device, so the last packet of that device is
+        sent again afterwards; for a relative mouse packet this repeats its
+        buttons without moving.
+
+        A packet answered with an error status was not executed by the chip
+        and can always be resent. A packet without a valid response may
+        have been executed, so it is only resent if that cannot repeat an
+        input: it must not be a relative movement, and no later packet of
+        the same device may have been executed either. Otherwise its error
+        is raised, as it is for an absolute position that would undo
+        acknowledged relative movements.
+
+        Args:
+            packets: Packets that were sent.
+            responses: Response bytes for each packet, in the same order.
+
+        Returns:
+            The failed packets to resend and the packets that follow them.
+
+        Raises:
+            ResponseError: If a failed packet cannot be resent safely.
+        """
+        errors = [
+            ProtocolEngine._response_error(packet, response)
+            for packet, response in zip(packets, responses, strict=True)
+        ]
+        last: dict[Hashable, int] = {}
+        first_failed: dict[Hashable, int] = {}
+        for index, (packet, error) in enumerate(zip(packets, errors, strict=True)):
+            device = _device(packet)
+            last[device] = index
+            if error is not None:
+                first_failed.setdefault(device, index)
+        # Devices with a later packet that the chip may have executed
+        executed_later: set[Hashable] = set()
+        unsafe: ResponseError | None = None
+        for packet, error in zip(reversed(packets), reversed(errors), strict=True):
+            if isinstance(error, DeviceStatusError):
+                continue
+            device = _device(packet)
+            if error is not None and (
+                device in executed_later or packet[_COMMAND_OFFSET] == _CMD_MOUSE_REL
+            ):
+                unsafe = error
+            executed_later.add(device)
+        if unsafe is not None:
+            raise unsafe
+        mouse_failed = first_failed.get(_CMD_MOUSE_REL)
+        if mouse_failed is not None:
+            mouse_error = errors[mouse_failed]
+            ends_relative = (
+                packets[last[_CMD_MOUSE_REL]][_COMMAND_OFFSET] == _CMD_MOUSE_REL
+            )
+            if (
+                mouse_error is not None
+                and ends_relative
+                and any(
+                    packet[_COMMAND_OFFSET] == _CMD_MOUSE_ABS
+                    for packet in packets[mouse_failed:]
+                )
+            ):
+                raise mouse_error
+        return Retransmission(
+            [index for index, error in enumerate(errors) if error is not None],
+            [
+                _restore_packet(packets[index])
+                for device, index in sorted(last.items(), key=lambda item: item[1])
+                if device is not None
+                and device in first_failed
+                and errors[index] is None
+            ],
+        )
+
+    @staticmethod
+    def _response_error(packet: PacketData, response: bytes) -> ResponseError | None:
+        """Validate the response to a packet.
+
+        Args:
+            packet: Packet that was sent.
+            response: Response bytes received for it.
+
+        Returns:
+            The error describing the failed response, or None if it succeeded.
+        """
+        try:
+            CH9329Protocol.decode_response(response, packet[3])
+        except ResponseError as e:
+            return e
+        return None
+
+
+class PacketCache:
+    """Bounded LRU cache of encoded packets keyed on the report contents.
+
+    Inputs with the same modifiers, keys, buttons, movement and scroll encode
+    to the same packet, so repeated states such as "all released" or a held
+    chord are looked up instead of encoded again. Keys keep the order of
+    pressed keys, since it determines the report bytes. The packets are
+    immutable bytes and can be buffered or sent as they are.
+
+    Args:
+        maxsize: Maximum number of packets kept (default: 256).
+
+    Raises:
+        ValueError: If maxsize is less than 1.
+
+    Examples:
+        >>> cache = PacketCache()
+        >>> packet = cache.encode(KeyboardInput())
+        >>> packet is cache.encode(KeyboardInput())
+        True
+        >>> (cache.hits, cache.misses)
+        (1, 1)
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of packets kept.
+
+        Raises:
+            ValueError: If maxsize is less than 1.
+        """
+        if maxsize < 1:
+            msg = f"maxsize must be at least 1, got {maxsize}"
+            raise ValueError(msg)
+        self._maxsize = maxsize
+        self._packets: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of inputs answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of inputs that had to be encoded."""
+        return self._misses
+
+    def encode(self, input_data: InputData) -> bytes:
+        """Return the packet for an input, encoding it on a cache miss.
+
+        Args:
+            input_data: Keyboard, mouse or media key input.
+
+        Returns:
+            Packet as bytes, identical to `ProtocolEngine.encode`.
+
+        Raises:
+            TypeError: If the input is not an input model or input state.
+            UnsupportedEvdevCodeError: If a key, modifier or button is not
+                supported.
+        """
+        key = self._key(input_data)
+        packet = self._packets.get(key)
+        if packet is not None:
+            self._packets.move_to_end(key)
+            self._hits += 1
+            return packet
+        packet = ProtocolEngine.encode(input_data)
+        self._misses += 1
+        self._packets[key] = packet
+        if len(self._packets) > self._maxsize:
+            self._packets.popitem(last=False)
+        return packet
+
+    def clear(self) -> None:
+        """Drop all cached packets and reset the hit and miss counters."""
+        self._packets.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached packets.
+
+        Returns:
+            Number of packets in the cache.
+        """
+        return len(self._packets)
+
+    @staticmethod
+    def _key(input_data: InputData) -> Hashable:
+        """Build the cache key for an input.
+
+        Args:
+            input_data: Keyboard, mouse or media key input.
+
+        Returns:
+            A hashable tuple of the input type and its report contents.
+
+        Raises:
+            TypeError: If the input is not an input model or input state.
+        """
+        types = _input_types()
+        if isinstance(
+            input_data,
+            (types.keyboard_state, types.mouse_state, types.media_key_state),
+        ):
+            # States are hashable tuples whose shapes never match a model key
+            return input_data
+        if isinstance(input_data, types.keyboard_input):
+            return (
+                types.keyboard_input,
+                frozenset(input_data.modifiers),
+                tuple(input_data.keys),
+            )
+        if isinstance(input_data, types.mouse_input):
+            return (
+                types.mouse_input,
+                frozenset(input_data.buttons),
+                input_data.x,
+                input_data.y,
+                input_data.scroll,
+            )
+        if isinstance(input_data, types.media_key_input):
+            return types.media_key_input, tuple(input_data.keys)
+        raise _unsupported(input_data)
+
+
+def _device(packet: PacketData) -> Hashable:
+    """Return what a packet changes the state of.
+
+    Args:
+        packet: Complete CH9329 packet.
+
+    Returns:
+        A key shared by all packets for the same device, or None for
+        packets that do not send input.
+    """
+    command = packet[_COMMAND_OFFSET]
+    if command in (_CMD_MOUSE_ABS, _CMD_MOUSE_REL):
+        return _CMD_MOUSE_REL
+    if command == _CMD_MEDIA:
+        # Multimedia and ACPI keys are separate reports
+        return command, packet[_DATA_OFFSET]
+    if command == _CMD_KEYBOARD:
+        return command
+    return None
+
+
+def _restore_packet(packet: PacketData) -> bytes:
+    """Return a packet that sets the device state a packet left behind.
+
+    Args:
+        packet: Acknowledged keyboard, mouse or media key packet.
+
+    Returns:
+        The packet itself, or for relative mouse packets a packet with the
+        same buttons that does not move.
+    """
+    if packet[_COMMAND_OFFSET] == _CMD_MOUSE_REL:
+        return CH9329Protocol.build_mouse_rel_packet(
+            packet[_MOUSE_BUTTON_OFFSET], 0, 0, 0
+        )
+    return bytes(packet)
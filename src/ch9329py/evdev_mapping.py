@@ -1,7 +1,9 @@
 """Mapping between evdev codes and USB HID codes for CH9329."""
 
-from evdev import ecodes
+from collections.abc import Collection
+from collections.abc import Set as AbstractSet
 
+from . import ecodes
 from .exceptions import UnsupportedEvdevCodeError
 
 # Mapping from evdev key codes to USB HID keyboard scan codes
@@ -51,6 +53,7 @@ _EVDEV_TO_USB_HID_KEYBOARD: dict[int, int] = {
     ecodes.KEY_TAB: 0x2B,
     ecodes.KEY_SPACE: 0x2C,
     ecodes.KEY_GRAVE: 0x35,  # ZENHAN key
+    ecodes.KEY_CAPSLOCK: 0x39,
     # Symbol keys
     ecodes.KEY_MINUS: 0x2D,
     ecodes.KEY_EQUAL: 0x2E,
@@ -90,6 +93,92 @@ _EVDEV_TO_USB_HID_MODIFIER: dict[int, int] = {
     ecodes.KEY_RIGHTMETA: 0x80,
 }
 
+# Reverse of _EVDEV_TO_USB_HID_KEYBOARD; every scan code is used only once
+_USB_HID_TO_EVDEV_KEYBOARD: dict[int, int] = {
+    hid_code: evdev_code for evdev_code, hid_code in _EVDEV_TO_USB_HID_KEYBOARD.items()
+}
+
+# Entry of the lookup tables for evdev codes that CH9329 cannot send. It is
+# neither a used keyboard scan code nor a single modifier or button bit.
+UNSUPPORTED = 0xFF
+
+# Number of evdev codes covered by each lookup table
+_TABLE_SIZE = 256
+
+
+def _compile_table(mapping: dict[int, int], base: int = 0) -> bytes:
+    """Compile a mapping dict into a table indexed by ``evdev_code - base``.
+
+    Args:
+        mapping: Mapping from evdev codes to USB HID values.
+        base: Lowest evdev code covered by the table.
+
+    Returns:
+        A 256-byte table with `UNSUPPORTED` for unmapped codes, usable with
+        `bytes.translate`.
+    """
+    table = bytearray([UNSUPPORTED]) * _TABLE_SIZE
+    for evdev_code, value in mapping.items():
+        table[evdev_code - base] = value
+    return bytes(table)
+
+
+# Lookup tables compiled from the dicts above. Mouse buttons lie beyond the
+# first 256 codes, so their table starts at BTN_MOUSE.
+_KEYBOARD_TABLE = _compile_table(_EVDEV_TO_USB_HID_KEYBOARD)
+_MODIFIER_TABLE = _compile_table(_EVDEV_TO_USB_HID_MODIFIER)
+_MOUSE_BASE = ecodes.BTN_MOUSE
+_MOUSE_TABLE = _compile_table(_EVDEV_TO_USB_HID_MOUSE, _MOUSE_BASE)
+
+
+def _lookup(table: bytes, evdev_code: int, base: int = 0) -> int:
+    """Look up one evdev code in a compiled table.
+
+    Args:
+        table: Table from `_compile_table`.
+        evdev_code: The evdev code.
+        base: Lowest evdev code covered by the table.
+
+    Returns:
+        The USB HID value, or `UNSUPPORTED`.
+    """
+    index = evdev_code - base
+    return table[index] if 0 <= index < _TABLE_SIZE else UNSUPPORTED
+
+
+def _lookup_all(table: bytes, evdev_codes: Collection[int], base: int = 0) -> bytes:
+    """Look up several evdev codes in a compiled table.
+
+    Args:
+        table: Table from `_compile_table`.
+        evdev_codes: The evdev codes.
+        base: Lowest evdev code covered by the table.
+
+    Returns:
+        One USB HID value or `UNSUPPORTED` per code, in iteration order.
+    """
+    if not base:
+        try:
+            return bytes(evdev_codes).translate(table)
+        except ValueError:
+            pass  # A code lies outside the table
+    return bytes([_lookup(table, evdev_code, base) for evdev_code in evdev_codes])
+
+
+def _raise_unsupported(evdev_codes: Collection[int], values: bytes) -> None:
+    """Raise for the first evdev code that was looked up as `UNSUPPORTED`.
+
+    Args:
+        evdev_codes: The evdev codes that were looked up.
+        values: The result of `_lookup_all` for them.
+
+    Raises:
+        UnsupportedEvdevCodeError: If a value is `UNSUPPORTED`.
+    """
+    for evdev_code, value in zip(evdev_codes, values, strict=True):
+        if value == UNSUPPORTED:
+            raise UnsupportedEvdevCodeError(evdev_code)
+
 
 def evdev_to_usb_hid_keyboard(evdev_code: int) -> int:
     """Convert evdev key code to USB HID keyboard scan code.
@@ -104,13 +193,36 @@ def evdev_to_usb_hid_keyboard(evdev_code: int) -> int:
         UnsupportedEvdevCodeError: If the evdev code is not supported.
 
     Examples:
-        >>> from evdev import ecodes
+        >>> from ch9329py import ecodes
         >>> evdev_to_usb_hid_keyboard(ecodes.KEY_A)
         4
     """
-    if evdev_code not in _EVDEV_TO_USB_HID_KEYBOARD:
+    value = _lookup(_KEYBOARD_TABLE, evdev_code)
+    if value == UNSUPPORTED:
         raise UnsupportedEvdevCodeError(evdev_code)
-    return _EVDEV_TO_USB_HID_KEYBOARD[evdev_code]
+    return value
+
+
+def usb_hid_to_evdev_keyboard(hid_code: int) -> int:
+    """Convert USB HID keyboard scan code to evdev key code.
+
+    Args:
+        hid_code: The USB HID keyboard scan code.
+
+    Returns:
+        The corresponding evdev key code.
+
+    Raises:
+        ValueError: If no supported evdev key maps to the scan code.
+
+    Examples:
+        >>> usb_hid_to_evdev_keyboard(0x04) == ecodes.KEY_A
+        True
+    """
+    if hid_code not in _USB_HID_TO_EVDEV_KEYBOARD:
+        msg = f"USB HID keyboard code 0x{hid_code:02X} is not supported by CH9329"
+        raise ValueError(msg)
+    return _USB_HID_TO_EVDEV_KEYBOARD[hid_code]
 
 
 def evdev_to_usb_hid_mouse(evdev_code: int) -> int:
@@ -126,13 +238,14 @@ def evdev_to_usb_hid_mouse(evdev_code: int) -> int:
         UnsupportedEvdevCodeError: If the evdev code is not supported.
 
     Examples:
-        >>> from evdev import ecodes
+        >>> from ch9329py import ecodes
         >>> evdev_to_usb_hid_mouse(ecodes.BTN_LEFT)
         1
     """
-    if evdev_code not in _EVDEV_TO_USB_HID_MOUSE:
+    value = _lookup(_MOUSE_TABLE, evdev_code, _MOUSE_BASE)
+    if value == UNSUPPORTED:
         raise UnsupportedEvdevCodeError(evdev_code)
-    return _EVDEV_TO_USB_HID_MOUSE[evdev_code]
+    return value
 
 
 def evdev_to_usb_hid_modifier(evdev_code: int) -> int:
@@ -148,13 +261,127 @@ def evdev_to_usb_hid_modifier(evdev_code: int) -> int:
         UnsupportedEvdevCodeError: If the evdev code is not supported.
 
     Examples:
-        >>> from evdev import ecodes
+        >>> from ch9329py import ecodes
         >>> evdev_to_usb_hid_modifier(ecodes.KEY_LEFTCTRL)
         1
     """
-    if evdev_code not in _EVDEV_TO_USB_HID_MODIFIER:
+    value = _lookup(_MODIFIER_TABLE, evdev_code)
+    if value == UNSUPPORTED:
         raise UnsupportedEvdevCodeError(evdev_code)
-    return _EVDEV_TO_USB_HID_MODIFIER[evdev_code]
+    return value
+
+
+def evdev_to_usb_hid_keyboard_codes(evdev_codes: Collection[int]) -> bytes:
+    r"""Convert several evdev key codes to USB HID keyboard scan codes at once.
+
+    Args:
+        evdev_codes: The evdev key codes, in report order.
+
+    Returns:
+        One scan code per key; codes that are not supported map to
+        `UNSUPPORTED` instead of raising.
+
+    Examples:
+        >>> from ch9329py import ecodes
+        >>> evdev_to_usb_hid_keyboard_codes([ecodes.KEY_A, 999])
+        b'\x04\xff'
+    """
+    return _lookup_all(_KEYBOARD_TABLE, evdev_codes)
+
+
+def evdev_to_usb_hid_modifier_bits(evdev_codes: Collection[int]) -> bytes:
+    r"""Convert several evdev modifier key codes to USB HID modifier bits at once.
+
+    Args:
+        evdev_codes: The evdev modifier key codes.
+
+    Returns:
+        One modifier bit per key; codes that are not supported map to
+        `UNSUPPORTED` instead of raising.
+
+    Examples:
+        >>> from ch9329py import ecodes
+        >>> evdev_to_usb_hid_modifier_bits([ecodes.KEY_LEFTCTRL, ecodes.KEY_A])
+        b'\x01\xff'
+    """
+    return _lookup_all(_MODIFIER_TABLE, evdev_codes)
+
+
+def evdev_to_usb_hid_mouse_bits(evdev_codes: Collection[int]) -> bytes:
+    r"""Convert several evdev mouse button codes to USB HID button bits at once.
+
+    Args:
+        evdev_codes: The evdev mouse button codes.
+
+    Returns:
+        One button bit per button; codes that are not supported map to
+        `UNSUPPORTED` instead of raising.
+
+    Examples:
+        >>> from ch9329py import ecodes
+        >>> evdev_to_usb_hid_mouse_bits([ecodes.BTN_LEFT, ecodes.BTN_MIDDLE])
+        b'\x01\x04'
+    """
+    return _lookup_all(_MOUSE_TABLE, evdev_codes, _MOUSE_BASE)
+
+
+def evdev_to_usb_hid_keyboard_report(
+    modifier_codes: AbstractSet[int], key_codes: Collection[int]
+) -> tuple[int, bytes]:
+    r"""Convert a keyboard state to its USB HID modifier byte and scan codes.
+
+    Args:
+        modifier_codes: The evdev codes of the pressed modifier keys.
+        key_codes: The evdev codes of the pressed keys, in report order.
+
+    Returns:
+        The modifier bitmask and the scan codes of the pressed keys.
+
+    Raises:
+        UnsupportedEvdevCodeError: If a key or modifier is not supported.
+
+    Examples:
+        >>> from ch9329py import ecodes
+        >>> evdev_to_usb_hid_keyboard_report({ecodes.KEY_LEFTSHIFT}, [ecodes.KEY_A])
+        (2, b'\x04')
+    """
+    try:
+        modifier_bits = bytes(modifier_codes).translate(_MODIFIER_TABLE)
+        scan_codes = bytes(key_codes).translate(_KEYBOARD_TABLE)
+    except ValueError:
+        modifier_bits = _lookup_all(_MODIFIER_TABLE, modifier_codes)
+        scan_codes = _lookup_all(_KEYBOARD_TABLE, key_codes)
+    if UNSUPPORTED in modifier_bits or UNSUPPORTED in scan_codes:
+        _raise_unsupported(modifier_codes, modifier_bits)
+        _raise_unsupported(key_codes, scan_codes)
+    # Distinct modifiers have distinct bits, so their sum is the bitmask
+    return sum(modifier_bits), scan_codes
+
+
+def evdev_to_usb_hid_mouse_buttons(evdev_codes: AbstractSet[int]) -> int:
+    """Convert pressed evdev mouse buttons to a USB HID button bitmask.
+
+    Args:
+        evdev_codes: The evdev codes of the pressed buttons.
+
+    Returns:
+        The button bitmask.
+
+    Raises:
+        UnsupportedEvdevCodeError: If a button is not supported.
+
+    Examples:
+        >>> from ch9329py import ecodes
+        >>> evdev_to_usb_hid_mouse_buttons([ecodes.BTN_LEFT, ecodes.BTN_RIGHT])
+        3
+    """
+    buttons = 0
+    for evdev_code in evdev_codes:
+        button_bit = _lookup(_MOUSE_TABLE, evdev_code, _MOUSE_BASE)
+        if button_bit == UNSUPPORTED:
+            raise UnsupportedEvdevCodeError(evdev_code)
+        buttons |= button_bit
+    return buttons
 
 
 def is_supported_evdev_code(evdev_code: int) -> bool:
@@ -167,7 +394,7 @@ def is_supported_evdev_code(evdev_code: int) -> bool:
         True if the code is supported, False otherwise.
 
     Examples:
-        >>> from evdev import ecodes
+        >>> from ch9329py import ecodes
         >>> is_supported_evdev_code(ecodes.KEY_A)
         True
         >>> is_supported_evdev_code(999)
@@ -1,5 +1,12 @@
 """Exceptions for ch9329py library."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ch9329py.protocol import ResponseStatus
+
 
 class CH9329PyError(Exception):
     """Base exception for ch9329py library."""
@@ -28,3 +35,74 @@ class UnsupportedEvdevCodeError(CH9329PyError):
         if message is None:
             message = f"Evdev code {code} is not supported by CH9329"
         super().__init__(message)
+
+
+class ResponseError(CH9329PyError):
+    """Raised when the device does not acknowledge a command.
+
+    Args:
+        command: The command byte of the request.
+        response: The bytes received from the device.
+        message: Error message.
+
+    Attributes:
+        command: The command byte of the request.
+        response: The bytes received from the device.
+    """
+
+    def __init__(self, command: int, response: bytes, message: str) -> None:
+        """Initialize the exception.
+
+        Args:
+            command: The command byte of the request.
+            response: The bytes received from the device.
+            message: Error message.
+        """
+        self.command = command
+        self.response = response
+        super().__init__(message)
+
+
+class InvalidResponseError(ResponseError):
+    """Raised when a response is missing or malformed.
+
+    This covers responses that did not arrive before the timeout, a wrong
+    header, a checksum mismatch and a command byte that does not echo the
+    request.
+
+    Examples:
+        >>> raise InvalidResponseError(0x02, b"", "No response to command 0x02")
+        InvalidResponseError: No response to command 0x02
+    """
+
+
+class DeviceStatusError(ResponseError):
+    """Raised when the device answers with an error status.
+
+    Args:
+        command: The command byte of the request.
+        response: The bytes received from the device.
+        status: The status reported by the device.
+
+    Attributes:
+        status: The status reported by the device.
+
+    Examples:
+        >>> raise DeviceStatusError(0x02, response, ResponseStatus.ERR_SUM)
+        DeviceStatusError: Device reported ERR_SUM (0xE4) for command 0x02
+    """
+
+    def __init__(self, command: int, response: bytes, status: ResponseStatus) -> None:
+        """Initialize the exception.
+
+        Args:
+            command: The command byte of the request.
+            response: The bytes received from the device.
+            status: The status reported by the device.
+        """
+        self.status = status
+        message = (
+            f"Device reported {status.name} (0x{status.value:02X}) "
+            f"for command 0x{command:02X}"
+        )
+        super().__init__(command, response, message)
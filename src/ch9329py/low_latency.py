@@ -0,0 +1,148 @@
+"""Low-latency tuning for USB-serial ttys on Linux.
+
+USB-serial bridges such as the CH340 or CP210x in front of the CH9329 hold
+received bytes in driver and tty buffers before handing them to user space.
+This module applies the tty settings that shorten that path and reports
+which of them the port actually accepted, since many drivers and
+pseudo-terminals support only some of them.
+"""
+
+from __future__ import annotations
+
+import array
+import fcntl
+import os
+import termios
+from pathlib import Path
+from typing import NamedTuple
+
+# serial_struct ioctls and flag from <linux/serial.h>
+_TIOCGSERIAL = 0x541E
+_TIOCSSERIAL = 0x541F
+_ASYNC_LOW_LATENCY = 1 << 13
+# serial_struct viewed as ints; flags is its fifth field
+_SERIAL_STRUCT_INTS = 32
+_SERIAL_FLAGS_INDEX = 4
+
+# Index of the control characters in the list returned by termios.tcgetattr
+_CC = 6
+
+# Length of an acknowledgement frame from CH9329
+_ACK_LENGTH = 7
+
+# Lowest latency timer in milliseconds accepted by USB-serial drivers
+_LATENCY_TIMER_MS = 1
+_USB_SERIAL_SYSFS = Path("/sys/bus/usb-serial/devices")
+
+
+class LowLatencyReport(NamedTuple):
+    """Low-latency optimizations that took effect on a port.
+
+    Attributes:
+        async_low_latency: The tty driver's ASYNC_LOW_LATENCY flag is set, so
+            received bytes are pushed to the reader without deferral.
+        read_threshold: VMIN is set to the acknowledgement length, so a
+            waiting reader is woken once per complete acknowledgement instead
+            of once per USB packet.
+        latency_timer: The USB-serial driver's latency timer was lowered to
+            1 ms (FTDI-style bridges only).
+    """
+
+    async_low_latency: bool
+    read_threshold: bool
+    latency_timer: bool
+
+    @property
+    def any_applied(self) -> bool:
+        """Whether at least one optimization took effect."""
+        return self.async_low_latency or self.read_threshold or self.latency_timer
+
+
+def enable_low_latency(fd: int, min_read: int = _ACK_LENGTH) -> LowLatencyReport:
+    """Apply every supported low-latency setting to an open tty.
+
+    Settings the port does not support are skipped. VMIN only affects when
+    ``select``/``poll`` report the port readable; reads still return as soon
+    as data is available. Responses whose length is not a multiple of
+    ``min_read`` can be delayed until the next bytes arrive or the reader
+    times out, which does not happen with the frames ch9329py sends and
+    receives.
+
+    Args:
+        fd: File descriptor of the open serial port.
+        min_read: Number of bytes that must be available before the port
+            is reported readable (default: 7, the acknowledgement length).
+
+    Returns:
+        Which optimizations took effect.
+
+    Examples:
+        >>> report = enable_low_latency(serial_port.fileno())
+        >>> report.async_low_latency
+        True
+    """
+    return LowLatencyReport(
+        async_low_latency=_set_async_low_latency(fd),
+        read_threshold=_set_read_threshold(fd, min_read),
+        latency_timer=_set_latency_timer(fd),
+    )
+
+
+def _set_async_low_latency(fd: int) -> bool:
+    """Set ASYNC_LOW_LATENCY through TIOCSSERIAL.
+
+    Args:
+        fd: File descriptor of the open serial port.
+
+    Returns:
+        True if the flag is set after the call.
+    """
+    serial_struct = array.array("i", [0] * _SERIAL_STRUCT_INTS)
+    try:
+        fcntl.ioctl(fd, _TIOCGSERIAL, serial_struct)
+        serial_struct[_SERIAL_FLAGS_INDEX] |= _ASYNC_LOW_LATENCY
+        fcntl.ioctl(fd, _TIOCSSERIAL, serial_struct)
+        # Drivers may silently ignore the flag; read it back
+        fcntl.ioctl(fd, _TIOCGSERIAL, serial_struct)
+    except OSError:
+        return False
+    return bool(serial_struct[_SERIAL_FLAGS_INDEX] & _ASYNC_LOW_LATENCY)
+
+
+def _set_read_threshold(fd: int, min_read: int) -> bool:
+    """Set VMIN to the given size with no inter-byte timer.
+
+    Args:
+        fd: File descriptor of the open serial port.
+        min_read: Value for VMIN.
+
+    Returns:
+        True if the setting was applied.
+    """
+    try:
+        attrs = termios.tcgetattr(fd)
+        attrs[_CC][termios.VMIN] = min_read
+        attrs[_CC][termios.VTIME] = 0
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    except (OSError, termios.error):
+        return False
+    return True
+
+
+def _set_latency_timer(fd: int) -> bool:
+    """Lower the USB-serial driver's latency timer through sysfs.
+
+    Args:
+        fd: File descriptor of the open serial port.
+
+    Returns:
+        True if the timer was written.
+    """
+    try:
+        device = Path(os.ttyname(fd)).resolve().name
+        (_USB_SERIAL_SYSFS / device / "latency_timer").write_text(
+            f"{_LATENCY_TIMER_MS}\n"
+        )
+    except OSError:
+        return False
+    return True
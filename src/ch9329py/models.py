@@ -1,18 +1,32 @@
 """Data models for CH9329 USB HID device.
 
 This module contains enums and functions for representing keyboard keys,
-mouse buttons, media keys, and character-to-keycode mappings.
+mouse buttons, media keys, character-to-keycode mappings, and the chip's
+information and parameter configuration.
 
 All key and button codes follow the Linux evdev naming convention.
 """
 
 from enum import Enum
+from typing import NamedTuple
 
-from evdev import ecodes
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ch9329py import ecodes
+from ch9329py.evdev_mapping import (
+    evdev_to_usb_hid_keyboard_report,
+    evdev_to_usb_hid_modifier,
+    evdev_to_usb_hid_mouse,
+    evdev_to_usb_hid_mouse_buttons,
+    usb_hid_to_evdev_keyboard,
+)
 
 MAX_ROLLOVER_KEYS = 6
 
+PARAMETER_CONFIG_LENGTH = 50
+
+CHIP_INFO_LENGTH = 8
+
 
 class MouseButton(Enum):
     """Mouse button constants for CH9329 device.
@@ -54,6 +68,7 @@ class KeyCode(Enum):
     KEY_TAB = ecodes.KEY_TAB
     KEY_SPACE = ecodes.KEY_SPACE
     KEY_GRAVE = ecodes.KEY_GRAVE  # ZENHAN key
+    KEY_CAPSLOCK = ecodes.KEY_CAPSLOCK
 
     # Digit keys
     KEY_0 = ecodes.KEY_0
@@ -243,3 +258,286 @@ class MediaKeyInput(BaseCh9329Model):
     """
 
     keys: list[MediaKey] = Field(default_factory=list, max_length=1)
+
+
+class KeyboardState(NamedTuple):
+    """Lightweight keyboard input holding USB HID values.
+
+    An immutable, hashable alternative to `KeyboardInput` for workloads that
+    create many inputs, such as replay or generated motion. The driver
+    accepts both. Values are trusted and not validated; convert with
+    `from_input` and `to_input` at API boundaries.
+
+    Attributes:
+        modifiers: USB HID modifier bitmask.
+        keys: USB HID keycodes of pressed keys (at most 6).
+
+    Examples:
+        >>> state = KeyboardState.from_input(
+        ...     KeyboardInput(
+        ...         modifiers={ModifierKey.KEY_LEFTSHIFT}, keys=[KeyCode.KEY_A]
+        ...     )
+        ... )
+        >>> state
+        KeyboardState(modifiers=2, keys=(4,))
+        >>> state.to_input().keys
+        [<KeyCode.KEY_A: 30>]
+    """
+
+    modifiers: int = 0
+    keys: tuple[int, ...] = ()
+
+    @classmethod
+    def from_input(cls, input_data: KeyboardInput) -> "KeyboardState":
+        """Convert a keyboard input model.
+
+        Args:
+            input_data: The keyboard input to convert.
+
+        Returns:
+            The equivalent keyboard state.
+
+        Raises:
+            UnsupportedEvdevCodeError: If a key or modifier is not supported.
+        """
+        modifiers, keys = evdev_to_usb_hid_keyboard_report(
+            {modifier_key.value for modifier_key in input_data.modifiers},
+            [key.value for key in input_data.keys],
+        )
+        return cls(modifiers, tuple(keys))
+
+    def to_input(self) -> KeyboardInput:
+        """Convert to a validated keyboard input model.
+
+        Returns:
+            The equivalent keyboard input.
+
+        Raises:
+            ValueError: If a keycode has no `KeyCode` or more than 6 keys are
+                pressed.
+        """
+        return KeyboardInput(
+            modifiers={
+                modifier_key
+                for modifier_key in ModifierKey
+                if self.modifiers & evdev_to_usb_hid_modifier(modifier_key.value)
+            },
+            keys=[KeyCode(usb_hid_to_evdev_keyboard(code)) for code in self.keys],
+        )
+
+
+class MouseState(NamedTuple):
+    """Lightweight mouse input holding USB HID values.
+
+    The `MouseInput` counterpart of `KeyboardState`.
+
+    Attributes:
+        buttons: USB HID button bitmask (0x01 left, 0x02 right, 0x04 middle).
+        x: Relative X movement (-128 to 127).
+        y: Relative Y movement (-128 to 127).
+        scroll: Scroll wheel movement (-127 to 127).
+
+    Examples:
+        >>> MouseState.from_input(MouseInput(buttons={MouseButton.BTN_LEFT}, x=5))
+        MouseState(buttons=1, x=5, y=0, scroll=0)
+    """
+
+    buttons: int = 0
+    x: int = 0
+    y: int = 0
+    scroll: int = 0
+
+    @classmethod
+    def from_input(cls, input_data: MouseInput) -> "MouseState":
+        """Convert a mouse input model.
+
+        Args:
+            input_data: The mouse input to convert.
+
+        Returns:
+            The equivalent mouse state.
+
+        Raises:
+            UnsupportedEvdevCodeError: If a button is not supported.
+        """
+        buttons = evdev_to_usb_hid_mouse_buttons(
+            {button.value for button in input_data.buttons}
+        )
+        return cls(buttons, input_data.x, input_data.y, input_data.scroll)
+
+    def to_input(self) -> MouseInput:
+        """Convert to a validated mouse input model.
+
+        Returns:
+            The equivalent mouse input.
+
+        Raises:
+            ValueError: If movement or scroll values are out of range.
+        """
+        return MouseInput(
+            buttons={
+                button
+                for button in MouseButton
+                if self.buttons & evdev_to_usb_hid_mouse(button.value)
+            },
+            x=self.x,
+            y=self.y,
+            scroll=self.scroll,
+        )
+
+
+class MediaKeyState(NamedTuple):
+    """Lightweight media key input holding the raw report.
+
+    The `MediaKeyInput` counterpart of `KeyboardState`.
+
+    Attributes:
+        data: The 4-byte media key report; the default releases all keys.
+
+    Examples:
+        >>> MediaKeyState.from_input(MediaKeyInput(keys=[MediaKey.KEY_MUTE]))
+        MediaKeyState(data=(2, 4, 0, 0))
+    """
+
+    data: tuple[int, int, int, int] = (0x02, 0x00, 0x00, 0x00)
+
+    @classmethod
+    def from_input(cls, input_data: MediaKeyInput) -> "MediaKeyState":
+        """Convert a media key input model.
+
+        Args:
+            input_data: The media key input to convert.
+
+        Returns:
+            The equivalent media key state.
+        """
+        if not input_data.keys:
+            return cls()
+        return cls(input_data.keys[0].value)
+
+    def to_input(self) -> MediaKeyInput:
+        """Convert to a validated media key input model.
+
+        Returns:
+            The equivalent media key input.
+
+        Raises:
+            ValueError: If the report matches no `MediaKey`.
+        """
+        if self == MediaKeyState():
+            return MediaKeyInput()
+        return MediaKeyInput(keys=[MediaKey(self.data)])
+
+
+class ChipInfo(NamedTuple):
+    """Version and status reported by the get info command (0x01).
+
+    Attributes:
+        version: Chip version byte; 0x30 is version 1.0, 0x31 version 1.1.
+        usb_connected: Whether the host has enumerated the chip.
+        num_lock: Whether the host's Num Lock LED is on.
+        caps_lock: Whether the host's Caps Lock LED is on.
+        scroll_lock: Whether the host's Scroll Lock LED is on.
+
+    Examples:
+        >>> info = ChipInfo.from_data(bytes([0x30, 0x01, 0x02, 0, 0, 0, 0, 0]))
+        >>> info.caps_lock, info.num_lock
+        (True, False)
+    """
+
+    version: int
+    usb_connected: bool
+    num_lock: bool
+    caps_lock: bool
+    scroll_lock: bool
+
+    @classmethod
+    def from_data(cls, data: bytes) -> "ChipInfo":
+        """Decode the data section of a get info response.
+
+        Args:
+            data: The 8 data bytes of the response.
+
+        Returns:
+            The decoded chip information.
+
+        Raises:
+            ValueError: If data is not exactly 8 bytes long.
+        """
+        if len(data) != CHIP_INFO_LENGTH:
+            msg = f"Chip info must be {CHIP_INFO_LENGTH} bytes, got {len(data)}"
+            raise ValueError(msg)
+        leds = data[2]
+        return cls(
+            version=data[0],
+            usb_connected=bool(data[1]),
+            num_lock=bool(leds & 0x01),
+            caps_lock=bool(leds & 0x02),
+            scroll_lock=bool(leds & 0x04),
+        )
+
+
+class ParameterConfig(BaseCh9329Model):
+    """Parameter configuration stored in the CH9329 chip.
+
+    This model wraps the 50-byte block read with the get parameter
+    configuration command (0x08) and written with the set parameter
+    configuration command (0x09). Fields that ch9329py does not interpret are
+    preserved unchanged, so a configuration can be read, modified and written
+    back without losing settings.
+
+    Attributes:
+        data: Raw 50-byte configuration block.
+
+    Raises:
+        ValueError: If data is not exactly 50 bytes long.
+
+    Examples:
+        >>> config = driver.get_parameter_config()
+        >>> config.baudrate
+        9600
+        >>> driver.set_parameter_config(config.with_baudrate(115200))
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    data: bytes = Field(
+        min_length=PARAMETER_CONFIG_LENGTH, max_length=PARAMETER_CONFIG_LENGTH
+    )
+
+    @property
+    def work_mode(self) -> int:
+        """Chip working mode (keyboard/mouse/custom HID combination)."""
+        return self.data[0]
+
+    @property
+    def serial_mode(self) -> int:
+        """Serial communication mode (0x00 is protocol transmission mode)."""
+        return self.data[1]
+
+    @property
+    def address(self) -> int:
+        """Serial address of the chip."""
+        return self.data[2]
+
+    @property
+    def baudrate(self) -> int:
+        """Serial baud rate in bits per second."""
+        return int.from_bytes(self.data[3:7], "big")
+
+    @property
+    def packet_interval(self) -> int:
+        """Serial packet interval in milliseconds."""
+        return int.from_bytes(self.data[9:11], "big")
+
+    def with_baudrate(self, baudrate: int) -> "ParameterConfig":
+        """Return a copy of this configuration with another baud rate.
+
+        Args:
+            baudrate: New serial baud rate in bits per second.
+
+        Returns:
+            Updated configuration.
+        """
+        data = self.data[:3] + baudrate.to_bytes(4, "big") + self.data[7:]
+        return ParameterConfig(data=data)
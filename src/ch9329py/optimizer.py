@@ -0,0 +1,184 @@
+"""Peephole optimization of input sequences.
+
+This module removes frames that the host cannot observe from a sequence of
+inputs before it is encoded. Generated scripts often repeat identical
+keyboard states, release all keys between characters typed with different
+keys, send mouse frames that neither move nor change buttons, or release
+media keys that are not pressed. Dropping those frames shortens
+transmission without changing what the host sees.
+
+Two sequences are considered equivalent when the host registers the same
+key and modifier presses in the same order, each with the same keys held,
+the same mouse movements, button and media key changes, and ends in the
+same state. Releases may move into the report that follows them. A
+modifier that is released and pressed again is pressed twice, so e.g. the
+release between Shift+A and Shift+B is kept.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple, TypeAlias
+
+from ch9329py.models import (
+    KeyboardInput,
+    KeyboardState,
+    MediaKeyInput,
+    MediaKeyState,
+    MouseInput,
+    MouseState,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ch9329py.engine import InputData
+
+_State: TypeAlias = KeyboardState | MouseState | MediaKeyState
+# Kept keyboard frames looked at besides the incoming one
+_WINDOW = 2
+
+
+class OptimizedInputs(NamedTuple):
+    """Result of `optimize_inputs`.
+
+    Attributes:
+        inputs: The remaining inputs, in their original order.
+        frames_saved: Number of inputs that were removed.
+    """
+
+    inputs: list[InputData]
+    frames_saved: int
+
+
+def optimize_inputs(inputs: Iterable[InputData]) -> OptimizedInputs:
+    """Remove the frames of an input sequence that the host cannot observe.
+
+    The first frame of each device kind is always kept, because the state
+    the host starts in is unknown. After that, a frame is dropped when
+
+    - it repeats the current keyboard or media key state, or is a mouse
+      frame without movement or scrolling that keeps the buttons;
+    - it is a keyboard frame between two other keyboard frames that presses
+      no key or modifier, as long as the next frame neither presses again
+      what it released nor presses a modifier while the released keys and
+      modifiers would still be held. A release of all keys between two characters
+      typed with different keys is such a frame.
+
+    Inputs are never merged or reordered, so movements and presses of
+    different devices keep their relative order.
+
+    Args:
+        inputs: Keyboard, mouse and media key inputs, in sending order.
+
+    Returns:
+        The optimized inputs and how many frames were saved.
+
+    Raises:
+        UnsupportedEvdevCodeError: If an input contains an unsupported code.
+
+    Examples:
+        >>> from ch9329py.models import KeyCode
+        >>> result = optimize_inputs([
+        ...     KeyboardInput(keys=[KeyCode.KEY_A]),
+        ...     KeyboardInput(),
+        ...     KeyboardInput(keys=[KeyCode.KEY_B]),
+        ...     KeyboardInput(keys=[KeyCode.KEY_B]),
+        ...     KeyboardInput(),
+        ... ])
+        >>> result.frames_saved
+        2
+    """
+    kept: list[InputData] = []
+    states: list[_State] = []
+    current: dict[type[_State], _State] = {}
+    saved = 0
+    for input_data in inputs:
+        state = _state(input_data)
+        while _can_drop_last_keyboard_frame(states, state):
+            kept.pop()
+            states.pop()
+            current[KeyboardState] = states[-1]
+            saved += 1
+        previous = current.get(type(state))
+        if previous is not None and _is_unchanged(previous, state):
+            saved += 1
+            continue
+        kept.append(input_data)
+        states.append(state)
+        current[type(state)] = state
+    return OptimizedInputs(kept, saved)
+
+
+def _state(input_data: InputData) -> _State:
+    """Convert an input to the lightweight state it sends.
+
+    Args:
+        input_data: Any input model or state.
+
+    Returns:
+        The equivalent lightweight state.
+    """
+    if isinstance(input_data, KeyboardInput):
+        return KeyboardState.from_input(input_data)
+    if isinstance(input_data, MouseInput):
+        return MouseState.from_input(input_data)
+    if isinstance(input_data, MediaKeyInput):
+        return MediaKeyState.from_input(input_data)
+    return input_data
+
+
+def _is_unchanged(previous: _State, state: _State) -> bool:
+    """Return whether a frame leaves the device state as it is.
+
+    Args:
+        previous: Last state sent for the device.
+        state: State of the new frame.
+
+    Returns:
+        True if the frame produces no host events.
+    """
+    if isinstance(state, MouseState) and isinstance(previous, MouseState):
+        return state == MouseState(buttons=previous.buttons)
+    return state == previous
+
+
+def _can_drop_last_keyboard_frame(states: list[_State], state: _State) -> bool:
+    """Return whether the last kept keyboard frame is invisible to the host.
+
+    The middle of three keyboard frames can go when it presses nothing and
+    the frame after it does not press again what it released. Its releases
+    then happen in the same report as the next frame's changes instead.
+    Hosts apply the modifier byte before the key array, so the release must
+    stay when the next frame presses a modifier: the released keys and
+    modifiers would still be held when it goes down, turning e.g. Ctrl+C
+    into Ctrl+A.
+
+    Args:
+        states: States of the kept frames.
+        state: State of the frame about to be kept.
+
+    Returns:
+        True if the last two kept frames and the new one are keyboard frames
+        and the middle one can be removed without changing the presses.
+    """
+    if len(states) < _WINDOW:
+        return False
+    before, middle = states[-_WINDOW:]
+    if not (
+        isinstance(before, KeyboardState)
+        and isinstance(middle, KeyboardState)
+        and isinstance(state, KeyboardState)
+    ):
+        return False
+    presses_nothing = not middle.modifiers & ~before.modifiers and set(
+        middle.keys
+    ) <= set(before.keys)
+    released_modifiers = before.modifiers & ~middle.modifiers
+    released_keys = set(before.keys) - set(middle.keys)
+    pressed_modifiers = state.modifiers & ~before.modifiers
+    return (
+        presses_nothing
+        and not released_modifiers & state.modifiers
+        and released_keys.isdisjoint(state.keys)
+        and not (pressed_modifiers and (released_keys or released_modifiers))
+    )
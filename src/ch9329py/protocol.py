@@ -1,10 +1,68 @@
-"""CH9329 protocol packet building.
+"""CH9329 protocol packet building and parsing.
 
 This module contains the protocol layer for building packets that the CH9329
-device understands. All packet building logic is isolated here for easier testing
-and maintenance.
+device understands and for parsing the frames it sends back. All packet building
+and parsing logic is isolated here for easier testing and maintenance.
 """
 
+import struct
+from collections.abc import Sequence
+from enum import Enum
+from typing import NamedTuple, TypeAlias
+
+from ch9329py.exceptions import DeviceStatusError, InvalidResponseError
+
+# Bytes before the data section: header(2) + address(1) + command(1) + length(1)
+_FRAME_PREFIX_LENGTH = 5
+# Bits set in the command byte of a successful and of an error response
+_RESPONSE_OK = 0x80
+_RESPONSE_ERROR = 0xC0
+# Header(2), address, command and length bytes of a frame
+_FRAME_PREFIX = struct.Struct("5B")
+
+PacketData: TypeAlias = bytes | memoryview
+"""An encoded packet, either as bytes or as a view into a `PacketEncoder` buffer."""
+
+
+class ResponseStatus(Enum):
+    """Status codes reported by the CH9329 device in its responses.
+
+    Attributes:
+        SUCCESS: Command executed successfully.
+        ERR_TIMEOUT: Serial receive of the command timed out.
+        ERR_HEAD: Packet header byte error.
+        ERR_CMD: Unknown command code.
+        ERR_SUM: Checksum mismatch.
+        ERR_PARA: Parameter error.
+        ERR_OPERATE: Command could not be executed.
+    """
+
+    SUCCESS = 0x00
+    ERR_TIMEOUT = 0xE1
+    ERR_HEAD = 0xE2
+    ERR_CMD = 0xE3
+    ERR_SUM = 0xE4
+    ERR_PARA = 0xE5
+    ERR_OPERATE = 0xE6
+
+
+_STATUS_CODES = frozenset(status.value for status in ResponseStatus)
+
+
+def _out_of_range(error: Exception) -> ValueError:
+    """Build the error for a report value that does not fit into its field.
+
+    `CH9329Protocol` and `PacketEncoder` detect such values in different
+    ways, so both report them through this error.
+
+    Args:
+        error: Error raised while packing the value.
+
+    Returns:
+        The error to raise.
+    """
+    return ValueError(f"Report value out of range: {error}")
+
 
 class CH9329Protocol:
     """Protocol handler for CH9329 USB HID device.
@@ -25,15 +83,21 @@ class CH9329Protocol:
     # Protocol constants
     _HEADER = (0x57, 0xAB)
     _ADDRESS = 0x00
+    # Maximum number of keys in a keyboard report
+    _KEYBOARD_KEY_SLOTS = 6
 
     # Command codes
+    _CMD_GET_INFO = 0x01
     _CMD_KEYBOARD = 0x02
     _CMD_MEDIA = 0x03
     _CMD_MOUSE_ABS = 0x04
     _CMD_MOUSE_REL = 0x05
+    _CMD_GET_PARA_CFG = 0x08
+    _CMD_SET_PARA_CFG = 0x09
+    _CMD_RESET = 0x0F
 
     @staticmethod
-    def _calculate_checksum(data: list[int]) -> int:
+    def _calculate_checksum(data: Sequence[int]) -> int:
         """Calculate checksum for a packet.
 
         Args:
@@ -55,15 +119,21 @@ class CH9329Protocol:
         Returns:
             Complete packet as bytes object.
         """
-        packet = [
+        packet = bytearray(_FRAME_PREFIX_LENGTH + len(data) + 1)
+        _FRAME_PREFIX.pack_into(
+            packet,
+            0,
             *CH9329Protocol._HEADER,
             CH9329Protocol._ADDRESS,
             command,
             len(data),
-            *data,
-        ]
-        checksum = CH9329Protocol._calculate_checksum(packet)
-        packet.append(checksum)
+        )
+        try:
+            packet[_FRAME_PREFIX_LENGTH:-1] = data
+        except ValueError as e:
+            raise _out_of_range(e) from e
+        # The checksum byte is still zero, so it does not affect the sum
+        packet[-1] = CH9329Protocol._calculate_checksum(packet)
         return bytes(packet)
 
     @staticmethod
@@ -78,6 +148,9 @@ class CH9329Protocol:
         Returns:
             Keyboard press packet as bytes.
 
+        Raises:
+            ValueError: If a value does not fit into its field.
+
         Examples:
             >>> CH9329Protocol.build_keyboard_press_packet(0x02, 0x04)
             b'W\xab\x00\x02\x08\x02\x00\x04\x00\x00\x00\x00\x00\x10'
@@ -85,6 +158,36 @@ class CH9329Protocol:
         data = [modifier, 0x00, keycode, 0x00, 0x00, 0x00, 0x00, 0x00]
         return CH9329Protocol._build_packet(CH9329Protocol._CMD_KEYBOARD, data)
 
+    @staticmethod
+    def build_keyboard_packet(modifier: int, keycodes: Sequence[int]) -> bytes:
+        r"""Build a keyboard packet with up to six simultaneous keys.
+
+        This directly corresponds to the USB HID keyboard report format:
+        modifier byte, reserved byte and six key slots.
+
+        Args:
+            modifier: Modifier key bitmask (USB HID modifier bits).
+            keycodes: USB HID keycodes of pressed keys (at most 6). Unused
+                slots are padded with 0x00.
+
+        Returns:
+            Keyboard packet as bytes.
+
+        Raises:
+            ValueError: If more than 6 keycodes are given or a value does not
+                fit into a byte.
+
+        Examples:
+            >>> CH9329Protocol.build_keyboard_packet(0x02, [0x04, 0x05])
+            b'W\xab\x00\x02\x08\x02\x00\x04\x05\x00\x00\x00\x00\x17'
+        """
+        padding = CH9329Protocol._KEYBOARD_KEY_SLOTS - len(keycodes)
+        if padding < 0:
+            msg = f"At most 6 keycodes are allowed, got {len(keycodes)}"
+            raise ValueError(msg)
+        data = [modifier, 0x00, *keycodes, *([0x00] * padding)]
+        return CH9329Protocol._build_packet(CH9329Protocol._CMD_KEYBOARD, data)
+
     @staticmethod
     def build_keyboard_release_packet() -> bytes:
         r"""Build a keyboard key release packet.
@@ -114,6 +217,9 @@ class CH9329Protocol:
         Returns:
             Mouse absolute position packet as bytes.
 
+        Raises:
+            ValueError: If a value does not fit into its field.
+
         Examples:
             >>> CH9329Protocol.build_mouse_abs_packet(0x00, 0, 0)
             b'W\xab\x00\x04\x07\x02\x00\x00\x00\x00\x00\x00\x10'
@@ -144,6 +250,9 @@ class CH9329Protocol:
         Returns:
             Mouse relative movement packet as bytes.
 
+        Raises:
+            ValueError: If a value does not fit into its field.
+
         Examples:
             >>> CH9329Protocol.build_mouse_rel_packet(0x00, 10, 20, 0)
             b'W\xab\x00\x05\x05\x01\x00\n\x14\x00+'
@@ -176,6 +285,9 @@ class CH9329Protocol:
         Returns:
             Media key press packet as bytes.
 
+        Raises:
+            ValueError: If a value does not fit into its field.
+
         Examples:
             >>> CH9329Protocol.build_media_press_packet(0x02, 0x04, 0x00, 0x00)
             b'W\xab\x00\x03\x04\x02\x04\x00\x00\x11'
@@ -198,3 +310,536 @@ class CH9329Protocol:
         """
         data = [0x02, 0x00, 0x00, 0x00]
         return CH9329Protocol._build_packet(CH9329Protocol._CMD_MEDIA, data)
+
+    @staticmethod
+    def build_get_info_packet() -> bytes:
+        r"""Build a packet that reads the chip's version and status.
+
+        The device answers with 8 bytes: the chip version, the USB
+        enumeration status, the host's keyboard LEDs and reserved bytes.
+
+        Returns:
+            Get info packet as bytes.
+
+        Examples:
+            >>> CH9329Protocol.build_get_info_packet()
+            b'W\xab\x00\x01\x00\x03'
+        """
+        return CH9329Protocol._build_packet(CH9329Protocol._CMD_GET_INFO, [])
+
+    @staticmethod
+    def build_get_parameter_config_packet() -> bytes:
+        r"""Build a packet that reads the chip's parameter configuration.
+
+        The device answers with the 50-byte configuration block.
+
+        Returns:
+            Get parameter configuration packet as bytes.
+
+        Examples:
+            >>> CH9329Protocol.build_get_parameter_config_packet()
+            b'W\xab\x00\x08\x00\n'
+        """
+        return CH9329Protocol._build_packet(CH9329Protocol._CMD_GET_PARA_CFG, [])
+
+    @staticmethod
+    def build_set_parameter_config_packet(config: bytes) -> bytes:
+        """Build a packet that writes the chip's parameter configuration.
+
+        The new configuration is stored by the chip and takes effect after
+        the next reset or power cycle.
+
+        Args:
+            config: The 50-byte configuration block.
+
+        Returns:
+            Set parameter configuration packet as bytes.
+        """
+        return CH9329Protocol._build_packet(
+            CH9329Protocol._CMD_SET_PARA_CFG, list(config)
+        )
+
+    @staticmethod
+    def build_reset_packet() -> bytes:
+        r"""Build a packet that performs a software reset of the chip.
+
+        Returns:
+            Reset packet as bytes.
+
+        Examples:
+            >>> CH9329Protocol.build_reset_packet()
+            b'W\xab\x00\x0f\x00\x11'
+        """
+        return CH9329Protocol._build_packet(CH9329Protocol._CMD_RESET, [])
+
+    @staticmethod
+    def build_response_packet(command: int, data: bytes) -> bytes:
+        r"""Build the successful response the device sends for a command.
+
+        Args:
+            command: Command byte of the request.
+            data: Data section of the response.
+
+        Returns:
+            Response packet as bytes.
+
+        Examples:
+            >>> CH9329Protocol.build_response_packet(0x01, bytes(8))
+            b'W\xab\x00\x81\x08\x00\x00\x00\x00\x00\x00\x00\x00\x8b'
+        """
+        return CH9329Protocol._build_packet(command | _RESPONSE_OK, list(data))
+
+    @staticmethod
+    def build_status_packet(command: int, status: ResponseStatus) -> bytes:
+        r"""Build the acknowledgement the device sends for a command.
+
+        Args:
+            command: Command byte of the request.
+            status: Status to report. Any status other than SUCCESS produces
+                an error response.
+
+        Returns:
+            Status packet as bytes.
+
+        Examples:
+            >>> CH9329Protocol.build_status_packet(0x02, ResponseStatus.SUCCESS)
+            b'W\xab\x00\x82\x01\x00\x85'
+        """
+        flags = _RESPONSE_OK if status is ResponseStatus.SUCCESS else _RESPONSE_ERROR
+        return CH9329Protocol._build_packet(command | flags, [status.value])
+
+    @staticmethod
+    def decode_response(response: bytes, command: int) -> "ResponseFrame":
+        r"""Validate a response to a command and return its frame.
+
+        The header, the length, the checksum and the echoed command byte are
+        checked. Responses that carry a status byte must report success.
+
+        Args:
+            response: Bytes received from the device.
+            command: Command byte of the request.
+
+        Returns:
+            The validated response frame.
+
+        Raises:
+            InvalidResponseError: If the response is missing or malformed.
+            DeviceStatusError: If the device reported an error status.
+
+        Examples:
+            >>> ack = b"\x57\xab\x00\x82\x01\x00\x85"
+            >>> CH9329Protocol.decode_response(ack, 0x02).status
+            <ResponseStatus.SUCCESS: 0>
+        """
+        problem = (
+            CH9329Protocol._response_problem(response, command)
+            if response
+            else "No response"
+        )
+        if problem is not None:
+            msg = f"{problem} for command 0x{command:02X}: {response.hex()}"
+            raise InvalidResponseError(command, response, msg)
+        frame = ResponseFrame(
+            address=response[2],
+            command=response[3],
+            data=response[_FRAME_PREFIX_LENGTH:-1],
+            raw=response,
+        )
+        if frame.status is not ResponseStatus.SUCCESS:
+            raise DeviceStatusError(command, response, frame.status)
+        return frame
+
+    @staticmethod
+    def _response_problem(response: bytes, command: int) -> str | None:
+        """Describe why a response to a command is malformed.
+
+        Args:
+            response: Non-empty bytes received from the device.
+            command: Command byte of the request.
+
+        Returns:
+            A short description of the problem, or None if the response is
+            well-formed.
+        """
+        if tuple(response[:2]) != CH9329Protocol._HEADER:
+            return "Invalid response header"
+        if CH9329Protocol.frame_length(response) != len(response):
+            return "Invalid response length"
+        if CH9329Protocol._calculate_checksum(list(response[:-1])) != response[-1]:
+            return "Response checksum mismatch"
+        if response[3] not in (command | _RESPONSE_OK, command | _RESPONSE_ERROR):
+            return "Unexpected response command"
+        is_error = response[3] & _RESPONSE_ERROR == _RESPONSE_ERROR
+        has_status = is_error or response[4] == 1
+        if has_status and (response[4] != 1 or response[5] not in _STATUS_CODES):
+            return "Unknown response status"
+        return None
+
+    @staticmethod
+    def frame_length(prefix: bytes | bytearray) -> int | None:
+        r"""Return the total length of the frame starting with the given bytes.
+
+        Args:
+            prefix: At least the first 5 bytes of a frame.
+
+        Returns:
+            Total frame length including header and checksum, or None if the
+            bytes do not start with a complete frame prefix.
+
+        Examples:
+            >>> CH9329Protocol.frame_length(b"\x57\xab\x00\x82\x01")
+            7
+        """
+        if (
+            len(prefix) < _FRAME_PREFIX_LENGTH
+            or tuple(prefix[:2]) != CH9329Protocol._HEADER
+        ):
+            return None
+        return _FRAME_PREFIX_LENGTH + prefix[4] + 1
+
+
+class _Region(NamedTuple):
+    """Fixed-size slot of one packet type in a `PacketEncoder` buffer."""
+
+    data_offset: int
+    checksum_offset: int
+    prefix_sum: int
+    view: memoryview
+
+
+class PacketEncoder:
+    r"""Encoder that writes report packets in place into a reusable buffer.
+
+    Each report type has its own slot in a buffer that is allocated once, and
+    the header, address, command and length bytes of every slot are written
+    up front. Encoding a report packs only its data bytes with
+    `struct.pack_into` and adds them to the precomputed prefix checksum, so
+    no packet objects are created while streaming.
+
+    The returned memoryview is overwritten by the next packet of the same
+    type. Pass it straight to an adapter, or copy it with ``bytes()`` to keep
+    it.
+
+    Examples:
+        >>> encoder = PacketEncoder()
+        >>> bytes(encoder.keyboard(0x02, [0x04, 0x05]))
+        b'W\xab\x00\x02\x08\x02\x00\x04\x05\x00\x00\x00\x00\x17'
+    """
+
+    _KEYBOARD_DATA = struct.Struct("8B")
+    _MEDIA_DATA = struct.Struct("4B")
+    # Mode, buttons, little-endian x and y, wheel
+    _MOUSE_ABS_DATA = struct.Struct("<2B2Hb")
+    # Mode, buttons, then signed x, y and wheel
+    _MOUSE_REL_DATA = struct.Struct("2B3b")
+    _HEADER = (*CH9329Protocol._HEADER, CH9329Protocol._ADDRESS)  # noqa: SLF001
+    _KEY_SLOTS = CH9329Protocol._KEYBOARD_KEY_SLOTS  # noqa: SLF001
+    # Zero padding for the unused keyboard key slots, indexed by their count
+    _KEY_PADDING = tuple((0,) * count for count in range(_KEY_SLOTS + 1))
+
+    def __init__(self) -> None:
+        """Allocate the buffer and write the fixed part of every packet."""
+        protocol = CH9329Protocol
+        layout = (
+            (protocol._CMD_KEYBOARD, self._KEYBOARD_DATA.size),  # noqa: SLF001
+            (protocol._CMD_MEDIA, self._MEDIA_DATA.size),  # noqa: SLF001
+            (protocol._CMD_MOUSE_ABS, self._MOUSE_ABS_DATA.size),  # noqa: SLF001
+            (protocol._CMD_MOUSE_REL, self._MOUSE_REL_DATA.size),  # noqa: SLF001
+        )
+        self._buffer = bytearray(
+            sum(_FRAME_PREFIX_LENGTH + length + 1 for _, length in layout)
+        )
+        view = memoryview(self._buffer)
+        regions = []
+        offset = 0
+        for command, length in layout:
+            prefix = (*self._HEADER, command, length)
+            _FRAME_PREFIX.pack_into(self._buffer, offset, *prefix)
+            end = offset + _FRAME_PREFIX_LENGTH + length + 1
+            regions.append(
+                _Region(
+                    data_offset=offset + _FRAME_PREFIX_LENGTH,
+                    checksum_offset=end - 1,
+                    prefix_sum=sum(prefix),
+                    view=view[offset:end],
+                )
+            )
+            offset = end
+        self._keyboard, self._media, self._mouse_abs, self._mouse_rel = regions
+
+    def keyboard(self, modifier: int, keycodes: Sequence[int]) -> memoryview:
+        """Encode a keyboard packet with up to six simultaneous keys.
+
+        Args:
+            modifier: Modifier key bitmask (USB HID modifier bits).
+            keycodes: USB HID keycodes of pressed keys (at most 6).
+
+        Returns:
+            View of the keyboard packet.
+
+        Raises:
+            ValueError: If more than 6 keycodes are given or a value does not
+                fit into a byte.
+        """
+        padding = self._KEY_SLOTS - len(keycodes)
+        if padding < 0:
+            msg = f"At most 6 keycodes are allowed, got {len(keycodes)}"
+            raise ValueError(msg)
+        region = self._keyboard
+        try:
+            self._KEYBOARD_DATA.pack_into(
+                self._buffer,
+                region.data_offset,
+                modifier,
+                0x00,
+                *keycodes,
+                *self._KEY_PADDING[padding],
+            )
+        except struct.error as e:
+            raise _out_of_range(e) from e
+        checksum = region.prefix_sum + modifier + sum(keycodes)
+        self._buffer[region.checksum_offset] = checksum & 0xFF
+        return region.view
+
+    def media(self, data0: int, data1: int, data2: int, data3: int) -> memoryview:
+        """Encode a media key packet.
+
+        Args:
+            data0: First data byte (0x02 for media keys).
+            data1: Second data byte.
+            data2: Third data byte.
+            data3: Fourth data byte.
+
+        Returns:
+            View of the media key packet.
+
+        Raises:
+            ValueError: If a value does not fit into its field.
+        """
+        region = self._media
+        try:
+            self._MEDIA_DATA.pack_into(
+                self._buffer, region.data_offset, data0, data1, data2, data3
+            )
+        except struct.error as e:
+            raise _out_of_range(e) from e
+        checksum = region.prefix_sum + data0 + data1 + data2 + data3
+        self._buffer[region.checksum_offset] = checksum & 0xFF
+        return region.view
+
+    def mouse_abs(self, button: int, x: int, y: int) -> memoryview:
+        """Encode a mouse absolute position packet.
+
+        Coordinates are clamped like in `CH9329Protocol.build_mouse_abs_packet`.
+
+        Args:
+            button: Button state byte.
+            x: Absolute X coordinate (0-4095).
+            y: Absolute Y coordinate (0-4095).
+
+        Returns:
+            View of the mouse absolute position packet.
+
+        Raises:
+            ValueError: If a value does not fit into its field.
+        """
+        x = max(0, min(4095, x))
+        y = max(0, min(4095, y))
+        region = self._mouse_abs
+        try:
+            self._MOUSE_ABS_DATA.pack_into(
+                self._buffer, region.data_offset, 0x02, button, x, y, 0
+            )
+        except struct.error as e:
+            raise _out_of_range(e) from e
+        checksum = region.prefix_sum + 0x02 + button + (x & 0xFF) + (x >> 8)
+        checksum += (y & 0xFF) + (y >> 8)
+        self._buffer[region.checksum_offset] = checksum & 0xFF
+        return region.view
+
+    def mouse_rel(self, button: int, x: int, y: int, scroll: int) -> memoryview:
+        """Encode a mouse relative movement packet.
+
+        Values are clamped like in `CH9329Protocol.build_mouse_rel_packet`.
+
+        Args:
+            button: Button state byte.
+            x: Relative X movement (-128 to 127).
+            y: Relative Y movement (-128 to 127).
+            scroll: Scroll wheel movement (-127 to 127).
+
+        Returns:
+            View of the mouse relative movement packet.
+
+        Raises:
+            ValueError: If a value does not fit into its field.
+        """
+        x = max(-128, min(127, x))
+        y = max(-128, min(127, y))
+        scroll = max(-127, min(127, scroll))
+        region = self._mouse_rel
+        try:
+            self._MOUSE_REL_DATA.pack_into(
+                self._buffer, region.data_offset, 0x01, button, x, y, scroll
+            )
+        except struct.error as e:
+            raise _out_of_range(e) from e
+        # Masking turns negative values into their two's complement bytes
+        checksum = region.prefix_sum + 0x01 + button + (x & 0xFF) + (y & 0xFF)
+        checksum += scroll & 0xFF
+        self._buffer[region.checksum_offset] = checksum & 0xFF
+        return region.view
+
+
+class ResponseFrame(NamedTuple):
+    """A frame received from the CH9329 device.
+
+    Attributes:
+        address: Address byte of the frame.
+        command: Command byte (the request command with the response bits set).
+        data: Data section of the frame.
+        raw: Complete frame as received, including header and checksum.
+    """
+
+    address: int
+    command: int
+    data: bytes
+    raw: bytes
+
+    @property
+    def status(self) -> ResponseStatus:
+        """Status reported by the device.
+
+        Error responses and acknowledgements carry a single status byte.
+        Responses that return data (e.g., the parameter configuration)
+        report SUCCESS.
+
+        Raises:
+            ValueError: If the status byte is not a known status code.
+            IndexError: If an error response has no status byte.
+        """
+        if self.command & _RESPONSE_ERROR == _RESPONSE_ERROR or len(self.data) == 1:
+            return ResponseStatus(self.data[0])
+        return ResponseStatus.SUCCESS
+
+
+class FrameParser:
+    r"""Incremental, resynchronizing parser for frames from the CH9329 device.
+
+    Bytes can be fed in arbitrary chunks; complete frames are returned in the
+    order they were received. The parser performs no I/O.
+
+    The parser scans for the 0x57 0xAB header and validates the command byte,
+    the length and the checksum of every frame. Bytes that cannot start a
+    valid frame (line noise, a dropped or duplicated byte, a truncated frame)
+    are discarded one at a time until the stream lines up with a header
+    again, so a single bad byte never shifts the responses that follow it.
+
+    Examples:
+        >>> parser = FrameParser()
+        >>> parser.feed(b"\x00\x57\xab\x00\x82")
+        >>> parser.next_frame() is None
+        True
+        >>> parser.feed(b"\x01\x00\x85")
+        >>> parser.next_frame().command
+        130
+        >>> parser.discarded
+        1
+    """
+
+    _HEADER = bytes(CH9329Protocol._HEADER)  # noqa: SLF001
+    # Every response has the response bit set in its command byte
+    _RESPONSE_BIT = 0x80
+    # Longest data section the chip sends
+    _MAX_DATA_LENGTH = 64
+    # Length of the shortest response frame (a status acknowledgement)
+    _MIN_FRAME_LENGTH = _FRAME_PREFIX_LENGTH + 1 + 1
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        # Consumed from the front; CPython trims a bytearray's head in O(1)
+        self._buffer = bytearray()
+        self._discarded = 0
+
+    @property
+    def discarded(self) -> int:
+        """Number of bytes dropped while resynchronizing."""
+        return self._discarded
+
+    @property
+    def bytes_needed(self) -> int:
+        """Minimum number of bytes needed before the next frame can complete.
+
+        Blocking readers can request exactly this many bytes without reading
+        past the end of the frame.
+        """
+        length = CH9329Protocol.frame_length(self._buffer)
+        if length is None:
+            length = self._MIN_FRAME_LENGTH
+        return max(length - len(self._buffer), 1)
+
+    def feed(self, data: bytes | bytearray | memoryview) -> None:
+        """Append received bytes to the parser.
+
+        Args:
+            data: Bytes read from the device.
+        """
+        self._buffer += data
+
+    def next_frame(self) -> ResponseFrame | None:
+        """Return the next valid frame, if any.
+
+        Returns:
+            The oldest complete, valid frame, or None if more bytes are needed.
+        """
+        buffer = self._buffer
+        while True:
+            if not self._align():
+                return None
+            if len(buffer) < _FRAME_PREFIX_LENGTH:
+                return None
+            if not buffer[3] & self._RESPONSE_BIT or buffer[4] > self._MAX_DATA_LENGTH:
+                self._discard(1)
+                continue
+            length = _FRAME_PREFIX_LENGTH + buffer[4] + 1
+            if len(buffer) < length:
+                return None
+            if sum(buffer[: length - 1]) & 0xFF != buffer[length - 1]:
+                self._discard(1)
+                continue
+            raw = bytes(buffer[:length])
+            del buffer[:length]
+            return ResponseFrame(
+                address=raw[2],
+                command=raw[3],
+                data=raw[_FRAME_PREFIX_LENGTH:-1],
+                raw=raw,
+            )
+
+    def clear(self) -> None:
+        """Discard any buffered bytes."""
+        self._buffer.clear()
+
+    def _align(self) -> bool:
+        """Drop bytes before the next frame header.
+
+        Returns:
+            True if the buffer now starts with a header.
+        """
+        start = self._buffer.find(self._HEADER)
+        if start < 0:
+            # A trailing first header byte may be completed by the next chunk
+            keep = 1 if self._buffer[-1:] == self._HEADER[:1] else 0
+            self._discard(len(self._buffer) - keep)
+            return False
+        self._discard(start)
+        return True
+
+    def _discard(self, count: int) -> None:
+        """Drop bytes from the front of the buffer.
+
+        Args:
+            count: Number of bytes to drop.
+        """
+        del self._buffer[:count]
+        self._discarded += count
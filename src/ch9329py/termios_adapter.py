@@ -0,0 +1,312 @@
+"""Raw file-descriptor communication adapter for CH9329 device.
+
+This module provides a Linux-only adapter that talks to the serial port
+through ``os.open``/``os.write``/``os.readv`` and configures it with
+``termios``, bypassing pyserial. It trades portability for less per-packet
+overhead at high packet rates.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import sys
+import termios
+import time
+from typing import TYPE_CHECKING
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+from ch9329py.adapter import CommunicationAdapter
+from ch9329py.engine import ProtocolEngine
+from ch9329py.low_latency import LowLatencyReport, enable_low_latency
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ch9329py.protocol import PacketData
+
+# Indices into the list returned by termios.tcgetattr
+_IFLAG, _OFLAG, _CFLAG, _LFLAG, _ISPEED, _OSPEED, _CC = range(7)
+
+
+def _baud_constant(baudrate: int) -> int:
+    """Return the termios speed constant for a baud rate.
+
+    Args:
+        baudrate: Baud rate in bits per second.
+
+    Returns:
+        The matching ``termios.B*`` constant.
+
+    Raises:
+        ValueError: If termios has no constant for the baud rate.
+    """
+    try:
+        return int(getattr(termios, f"B{baudrate}"))
+    except AttributeError:
+        msg = f"Unsupported baud rate: {baudrate}"
+        raise ValueError(msg) from None
+
+
+class TermiosAdapter(CommunicationAdapter):
+    r"""Serial adapter on a raw, non-blocking file descriptor.
+
+    The port is put into raw 8N1 mode with termios and read through a
+    preallocated buffer. Waiting for responses uses a ``poll`` object that is
+    registered once, so each exchange costs one write, one poll per chunk and
+    one read per chunk. Responses are returned as soon as they arrive.
+
+    Linux only.
+
+    Args:
+        port: Serial port path (e.g., "/dev/ttyUSB0").
+        baudrate: Communication speed in bits per second (default: 9600).
+        timeout: Time in seconds to wait for each response, and for the
+            port to accept more bytes while writing (default: 0.1).
+
+    Raises:
+        ValueError: If termios does not support the baud rate.
+        ConnectionError: If the serial port cannot be opened or configured.
+
+    Examples:
+        >>> with TermiosAdapter("/dev/ttyUSB0", 115200) as adapter:
+        ...     response = adapter.send(b"\x57\xAB\x00\x02\x08")
+    """
+
+    # Size of the preallocated read buffer
+    _READ_SIZE = 4096
+
+    def __init__(self, port: str, baudrate: int = 9600, timeout: float = 0.1) -> None:
+        """Open and configure the serial port.
+
+        Args:
+            port: Serial port path.
+            baudrate: Communication speed in bits per second.
+            timeout: Time in seconds to wait for each response, and for the
+                port to accept more bytes while writing.
+
+        Raises:
+            ValueError: If termios does not support the baud rate.
+            ConnectionError: If the serial port cannot be opened or configured.
+        """
+        speed = _baud_constant(baudrate)
+        self._timeout = timeout
+        self._engine = ProtocolEngine()
+        self._buffer = bytearray(self._READ_SIZE)
+        self._view = memoryview(self._buffer)
+        self._low_latency = False
+        self._fd = -1
+        try:
+            self._fd = os.open(port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+            self._configure(speed)
+        except (OSError, termios.error) as e:
+            self.close()
+            msg = f"Failed to open serial port {port}: {e}"
+            raise ConnectionError(msg) from e
+        self._poll = select.poll()
+        self._poll.register(self._fd, select.POLLIN)
+
+    def send(self, data: PacketData) -> bytes:
+        """Send data to the device and receive response.
+
+        Args:
+            data: Bytes to send to the device.
+
+        Returns:
+            Response frame from the device, or empty bytes if the timeout
+            expired before a complete frame arrived.
+
+        Raises:
+            ConnectionError: If the port is closed or communication fails.
+        """
+        return self.send_many((data,))[0]
+
+    def send_many(self, packets: Sequence[PacketData]) -> list[bytes]:
+        """Send several packets with a single write and collect their responses.
+
+        Args:
+            packets: Packets to send, in order.
+
+        Returns:
+            Response frame for each packet, in the same order. Responses that
+            did not arrive in time are empty bytes.
+
+        Raises:
+            ConnectionError: If the port is closed or communication fails.
+        """
+        if not packets:
+            return []
+        if self._fd < 0:
+            msg = "Serial port is not open"
+            raise ConnectionError(msg)
+        for packet in packets:
+            self._engine.send_packet(packet)
+        try:
+            self._write(self._engine.data_to_send())
+            return self._wait_for_responses(len(packets))
+        except OSError as e:
+            self._engine.clear()
+            msg = f"Serial communication failed: {e}"
+            raise ConnectionError(msg) from e
+
+    def set_baudrate(self, baudrate: int) -> None:
+        """Change the baud rate of the open serial port.
+
+        Any bytes received at the old baud rate are discarded.
+
+        Args:
+            baudrate: New baud rate in bits per second.
+
+        Raises:
+            ValueError: If termios does not support the baud rate.
+            ConnectionError: If the port cannot be reconfigured.
+        """
+        speed = _baud_constant(baudrate)
+        try:
+            self._configure(speed)
+        except (OSError, termios.error) as e:
+            msg = f"Failed to set baud rate {baudrate}: {e}"
+            raise ConnectionError(msg) from e
+        self._engine.clear()
+        if self._low_latency:
+            enable_low_latency(self._fd)
+
+    def enable_low_latency(self) -> LowLatencyReport:
+        """Tune the port for the lowest response latency.
+
+        See `SerialAdapter.enable_low_latency`. The settings are reapplied
+        after `set_baudrate`.
+
+        Returns:
+            Which optimizations took effect.
+
+        Raises:
+            ConnectionError: If the serial port is not open.
+        """
+        if self._fd < 0:
+            msg = "Serial port is not open"
+            raise ConnectionError(msg)
+        self._low_latency = True
+        return enable_low_latency(self._fd)
+
+    def close(self) -> None:
+        """Close the serial port."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> Self:
+        """Enter context manager.
+
+        Returns:
+            Self for use in with statement.
+        """
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        """Exit context manager and close serial port.
+
+        Args:
+            exc_type: Exception type if an exception was raised.
+            exc_val: Exception value if an exception was raised.
+            exc_tb: Exception traceback if an exception was raised.
+        """
+        self.close()
+
+    def _configure(self, speed: int) -> None:
+        """Put the port into raw 8N1 mode at the given speed.
+
+        Pending input is discarded.
+
+        Args:
+            speed: termios speed constant.
+        """
+        attrs = termios.tcgetattr(self._fd)
+        attrs[_IFLAG] &= ~(
+            termios.IGNBRK
+            | termios.BRKINT
+            | termios.PARMRK
+            | termios.ISTRIP
+            | termios.INLCR
+            | termios.IGNCR
+            | termios.ICRNL
+            | termios.IXON
+            | termios.IXOFF
+        )
+        attrs[_OFLAG] &= ~termios.OPOST
+        attrs[_LFLAG] &= ~(
+            termios.ECHO
+            | termios.ECHONL
+            | termios.ICANON
+            | termios.ISIG
+            | termios.IEXTEN
+        )
+        attrs[_CFLAG] &= ~(termios.CSIZE | termios.PARENB | termios.CSTOPB)
+        attrs[_CFLAG] |= termios.CS8 | termios.CREAD | termios.CLOCAL
+        attrs[_ISPEED] = attrs[_OSPEED] = speed
+        attrs[_CC][termios.VMIN] = 0
+        attrs[_CC][termios.VTIME] = 0
+        termios.tcsetattr(self._fd, termios.TCSANOW, attrs)
+        termios.tcflush(self._fd, termios.TCIFLUSH)
+
+    def _write(self, data: PacketData) -> None:
+        """Write all bytes, waiting while the output buffer is full.
+
+        Args:
+            data: Bytes to write.
+
+        Raises:
+            TimeoutError: If no byte could be written for ``timeout`` seconds.
+        """
+        view = memoryview(data)
+        deadline = time.monotonic() + self._timeout
+        while view:
+            try:
+                written = os.write(self._fd, view)
+            except BlockingIOError:
+                written = 0
+            if written:
+                view = view[written:]
+                deadline = time.monotonic() + self._timeout
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([], [self._fd], [], remaining)[1]:
+                msg = f"Timed out writing {len(view)} bytes to the serial port"
+                raise TimeoutError(msg)
+
+    def _wait_for_responses(self, count: int) -> list[bytes]:
+        """Read responses as soon as they become available.
+
+        Args:
+            count: Number of responses to collect.
+
+        Returns:
+            Response frames from the device. Responses that did not arrive
+            before the deadline are empty bytes.
+        """
+        responses: list[bytes] = []
+        deadline = time.monotonic() + self._timeout
+        while len(responses) < count:
+            frame = self._engine.next_response()
+            if frame is not None:
+                responses.append(frame.raw)
+                deadline = time.monotonic() + self._timeout
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._poll.poll(remaining * 1000):
+                break
+            try:
+                size = os.readv(self._fd, (self._buffer,))
+            except BlockingIOError:
+                continue
+            self._engine.receive_data(self._view[:size])
+        if len(responses) < count:
+            # Give up on the remaining packets and drop the incomplete frame
+            # so it cannot corrupt the next response
+            self._engine.clear()
+            responses.extend(b"" for _ in range(count - len(responses)))
+        return responses
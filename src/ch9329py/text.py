@@ -0,0 +1,342 @@
+"""Compilation of text into keyboard report packets.
+
+This module turns a string into the sequence of keyboard packets that types
+it on a host with a given keyboard layout. Each character is looked up in a
+per-layout table of keys and shift states, and the packets for all
+characters are precompiled at import, so compiling text only concatenates
+ready-made bytes.
+
+The sequence relies on the host applying the modifier byte of a report
+before its key array, as USB HID keyboards are decoded on Linux and Windows.
+Caps Lock is assumed to invert the case of letters only, and shift to invert
+it back, as on Linux and Windows.
+"""
+
+from __future__ import annotations
+
+import string
+from enum import Enum
+from functools import lru_cache
+from typing import NamedTuple
+
+from ch9329py.evdev_mapping import evdev_to_usb_hid_keyboard
+from ch9329py.models import MAX_ROLLOVER_KEYS, KeyCode
+from ch9329py.protocol import CH9329Protocol
+
+# Modifier bit that every shifted character is typed with (left shift)
+_SHIFT_MODIFIER = 0x02
+# Number of compiled texts kept by compile_text
+_CACHE_SIZE = 256
+_CAPS_LOCK_KEYCODE = evdev_to_usb_hid_keyboard(KeyCode.KEY_CAPSLOCK.value)
+# Caps Lock reports sent around text typed with Caps Lock toggled
+_CAPS_LOCK_TOGGLES = 2
+
+
+class KeyboardLayout(Enum):
+    """Keyboard layout configured on the host.
+
+    The layout decides which key and shift state produce a character. Pick
+    the layout of the host, not of any physical keyboard.
+    """
+
+    US = "us"
+    JIS = "jis"
+
+
+class Keystroke(NamedTuple):
+    """Key press that types one character.
+
+    Attributes:
+        modifier: USB HID modifier bitmask held while the key is pressed.
+        keycode: USB HID keycode of the key.
+        packet: Keyboard packet that presses the key.
+    """
+
+    modifier: int
+    keycode: int
+    packet: bytes
+
+
+# Keys of the main block that type the same characters on every layout
+_LETTER_KEYS = [KeyCode[f"KEY_{letter}"] for letter in string.ascii_uppercase]
+_WHITESPACE_KEYS = {
+    " ": KeyCode.KEY_SPACE,
+    "\n": KeyCode.KEY_ENTER,
+    "\t": KeyCode.KEY_TAB,
+}
+
+# Characters of the remaining keys as (key, unshifted, shifted); an empty
+# string marks a shift state that types no character
+_US_SYMBOLS: list[tuple[KeyCode, str, str]] = [
+    (KeyCode.KEY_1, "1", "!"),
+    (KeyCode.KEY_2, "2", "@"),
+    (KeyCode.KEY_3, "3", "#"),
+    (KeyCode.KEY_4, "4", "$"),
+    (KeyCode.KEY_5, "5", "%"),
+    (KeyCode.KEY_6, "6", "^"),
+    (KeyCode.KEY_7, "7", "&"),
+    (KeyCode.KEY_8, "8", "*"),
+    (KeyCode.KEY_9, "9", "("),
+    (KeyCode.KEY_0, "0", ")"),
+    (KeyCode.KEY_MINUS, "-", "_"),
+    (KeyCode.KEY_EQUAL, "=", "+"),
+    (KeyCode.KEY_LEFTBRACE, "[", "{"),
+    (KeyCode.KEY_RIGHTBRACE, "]", "}"),
+    (KeyCode.KEY_BACKSLASH, "\\", "|"),
+    (KeyCode.KEY_SEMICOLON, ";", ":"),
+    (KeyCode.KEY_APOSTROPHE, "'", '"'),
+    (KeyCode.KEY_GRAVE, "`", "~"),
+    (KeyCode.KEY_COMMA, ",", "<"),
+    (KeyCode.KEY_DOT, ".", ">"),
+    (KeyCode.KEY_SLASH, "/", "?"),
+]
+_JIS_SYMBOLS: list[tuple[KeyCode, str, str]] = [
+    (KeyCode.KEY_1, "1", "!"),
+    (KeyCode.KEY_2, "2", '"'),
+    (KeyCode.KEY_3, "3", "#"),
+    (KeyCode.KEY_4, "4", "$"),
+    (KeyCode.KEY_5, "5", "%"),
+    (KeyCode.KEY_6, "6", "&"),
+    (KeyCode.KEY_7, "7", "'"),
+    (KeyCode.KEY_8, "8", "("),
+    (KeyCode.KEY_9, "9", ")"),
+    (KeyCode.KEY_0, "0", ""),
+    (KeyCode.KEY_MINUS, "-", "="),
+    (KeyCode.KEY_EQUAL, "^", "~"),
+    (KeyCode.KEY_YEN, "¥", "|"),
+    (KeyCode.KEY_LEFTBRACE, "@", "`"),
+    (KeyCode.KEY_RIGHTBRACE, "[", "{"),
+    (KeyCode.KEY_BACKSLASH, "]", "}"),
+    (KeyCode.KEY_SEMICOLON, ";", "+"),
+    (KeyCode.KEY_APOSTROPHE, ":", "*"),
+    (KeyCode.KEY_COMMA, ",", "<"),
+    (KeyCode.KEY_DOT, ".", ">"),
+    (KeyCode.KEY_SLASH, "/", "?"),
+    (KeyCode.KEY_RO, "\\", "_"),
+]
+
+
+def _keystroke(key: KeyCode, *, shifted: bool) -> Keystroke:
+    """Precompile the press of a key.
+
+    Args:
+        key: The key to press.
+        shifted: Whether shift is held.
+
+    Returns:
+        The keystroke with its packet.
+    """
+    modifier = _SHIFT_MODIFIER if shifted else 0x00
+    keycode = evdev_to_usb_hid_keyboard(key.value)
+    packet = CH9329Protocol.build_keyboard_packet(modifier, [keycode])
+    return Keystroke(modifier, keycode, packet)
+
+
+def _layout_table(symbols: list[tuple[KeyCode, str, str]]) -> dict[str, Keystroke]:
+    """Build the character table of a layout.
+
+    Args:
+        symbols: Characters of the keys besides letters and whitespace.
+
+    Returns:
+        Keystroke for each character the layout can type.
+    """
+    table = {
+        char: _keystroke(key, shifted=False) for char, key in _WHITESPACE_KEYS.items()
+    }
+    for key in _LETTER_KEYS:
+        letter = key.name.removeprefix("KEY_")
+        table[letter.lower()] = _keystroke(key, shifted=False)
+        table[letter] = _keystroke(key, shifted=True)
+    for key, unshifted, shifted in symbols:
+        table[unshifted] = _keystroke(key, shifted=False)
+        if shifted:
+            table[shifted] = _keystroke(key, shifted=True)
+    return table
+
+
+_LAYOUT_TABLES: dict[KeyboardLayout, dict[str, Keystroke]] = {
+    KeyboardLayout.US: _layout_table(_US_SYMBOLS),
+    KeyboardLayout.JIS: _layout_table(_JIS_SYMBOLS),
+}
+_RELEASE_PACKET = CH9329Protocol.build_keyboard_release_packet()
+# Report that toggles Caps Lock; JIS hosts toggle it with shift and the
+# Eisu key, which shares the Caps Lock usage
+_CAPS_LOCK_PACKETS: dict[KeyboardLayout, bytes] = {
+    KeyboardLayout.US: CH9329Protocol.build_keyboard_packet(0x00, [_CAPS_LOCK_KEYCODE]),
+    KeyboardLayout.JIS: CH9329Protocol.build_keyboard_packet(
+        _SHIFT_MODIFIER, [_CAPS_LOCK_KEYCODE]
+    ),
+}
+
+
+def keystroke(char: str, layout: KeyboardLayout = KeyboardLayout.US) -> Keystroke:
+    """Look up the key press that types a character.
+
+    Args:
+        char: A single character.
+        layout: Keyboard layout of the host.
+
+    Returns:
+        The keystroke for the character.
+
+    Raises:
+        ValueError: If the layout cannot type the character.
+
+    Examples:
+        >>> keystroke("A")[:2]
+        (2, 4)
+        >>> keystroke("_", KeyboardLayout.JIS)[:2]
+        (2, 135)
+    """
+    try:
+        return _LAYOUT_TABLES[layout][char]
+    except KeyError:
+        msg = f"Character {char!r} cannot be typed with the {layout.name} layout"
+        raise ValueError(msg) from None
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def compile_text(
+    text: str,
+    layout: KeyboardLayout = KeyboardLayout.US,
+    *,
+    rollover: bool = False,
+    caps_lock: bool | None = None,
+) -> tuple[bytes, ...]:
+    """Compile text into the keyboard packets that type it.
+
+    By default every character is one report that presses its key with the
+    right shift state. Moving from one key to another needs no release in
+    between, so a release report is only inserted before a key that is
+    pressed again and after the last character.
+
+    With ``rollover``, consecutive characters that share a shift state are
+    pressed together in one report of up to 6 keys. The host registers the
+    newly pressed keys of a report in key array order, so the characters
+    still arrive in sequence while most of the text needs well under one
+    report per character. A report never contains a key of the report
+    before it, because a key that stays held is not pressed again.
+
+    Given the host's ``caps_lock`` state, letters are typed with the shift
+    state that gives the right case under it. The text is also compiled
+    with Caps Lock toggled before it and back after it, and whichever needs
+    fewer reports is returned. Toggling pays off for upper case text with
+    rollover, where shift no longer splits reports at spaces and digits.
+
+    Results are cached, so typing the same text again costs no encoding.
+
+    Args:
+        text: Text to type.
+        layout: Keyboard layout of the host.
+        rollover: Whether to press several keys per report.
+        caps_lock: Whether Caps Lock is on at the host, e.g. from
+            `CH9329Driver.get_info`. None assumes it is off and never
+            toggles it.
+
+    Returns:
+        Keyboard packets in sending order; empty for empty text.
+
+    Raises:
+        ValueError: If the layout cannot type a character of the text.
+
+    Examples:
+        >>> len(compile_text("Hello"))  # H, e, l, release, l, o, release
+        7
+        >>> len(compile_text("Hello", rollover=True))  # H, el, release, lo, release
+        5
+        >>> query = "SELECT 1, 2, 3 FROM T1;"
+        >>> len(compile_text(query, rollover=True))
+        15
+        >>> len(compile_text(query, rollover=True, caps_lock=False))  # toggles
+        14
+    """
+    compile_strokes = _compile_rollover if rollover else _compile_single
+    packets = compile_strokes(_keystrokes(text, layout, caps_lock=bool(caps_lock)))
+    if caps_lock is not None and packets:
+        toggle = _CAPS_LOCK_PACKETS[layout]
+        toggled = compile_strokes(_keystrokes(text, layout, caps_lock=not caps_lock))
+        if len(toggled) + _CAPS_LOCK_TOGGLES < len(packets):
+            packets = [toggle, *toggled, toggle]
+    if packets:
+        packets.append(_RELEASE_PACKET)
+    return tuple(packets)
+
+
+def _keystrokes(
+    text: str, layout: KeyboardLayout, *, caps_lock: bool
+) -> list[Keystroke]:
+    """Look up the keystrokes of a text.
+
+    Args:
+        text: Text to type.
+        layout: Keyboard layout of the host.
+        caps_lock: Whether Caps Lock is on while the text is typed.
+
+    Returns:
+        Keystroke of each character, in order.
+
+    Raises:
+        ValueError: If the layout cannot type a character of the text.
+    """
+    if caps_lock:
+        # Caps Lock inverts the case that the shift state of a letter types
+        return [
+            keystroke(char.swapcase() if char in string.ascii_letters else char, layout)
+            for char in text
+        ]
+    return [keystroke(char, layout) for char in text]
+
+
+def _compile_single(strokes: list[Keystroke]) -> list[bytes]:
+    """Press one key per report.
+
+    Args:
+        strokes: Keystrokes of the characters, in order.
+
+    Returns:
+        Packets without the final release.
+    """
+    packets: list[bytes] = []
+    previous = -1
+    for stroke in strokes:
+        if stroke.keycode == previous:
+            # A key that is still held must be released before it types again
+            packets.append(_RELEASE_PACKET)
+        packets.append(stroke.packet)
+        previous = stroke.keycode
+    return packets
+
+
+def _compile_rollover(strokes: list[Keystroke]) -> list[bytes]:
+    """Press up to 6 keys per report.
+
+    Args:
+        strokes: Keystrokes of the characters, in order.
+
+    Returns:
+        Packets without the final release.
+    """
+    packets: list[bytes] = []
+    # Keys of the last report sent, and the report being filled
+    held: list[int] = []
+    pressed: list[int] = []
+    modifier = 0x00
+    for stroke in strokes:
+        if pressed and (
+            stroke.modifier != modifier
+            or stroke.keycode in pressed
+            or stroke.keycode in held
+            or len(pressed) == MAX_ROLLOVER_KEYS
+        ):
+            packets.append(CH9329Protocol.build_keyboard_packet(modifier, pressed))
+            held, pressed = pressed, []
+        if stroke.keycode in held:
+            packets.append(_RELEASE_PACKET)
+            held = []
+        if not pressed:
+            modifier = stroke.modifier
+        pressed.append(stroke.keycode)
+    if pressed:
+        packets.append(CH9329Protocol.build_keyboard_packet(modifier, pressed))
+    return packets
@@ -0,0 +1,108 @@
+"""Timing helpers for CH9329 serial communication.
+
+This module derives the time a frame spends on the wire from the baud rate
+and estimates how long the device takes to answer from measured latencies.
+The adapters use both to wait no longer than the hardware requires.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+# UART 8N1 framing: start bit + 8 data bits + stop bit
+_BITS_PER_BYTE = 10
+
+_MAX_PERCENTILE = 100.0
+
+
+def wire_time(byte_count: int, baudrate: int) -> float:
+    """Return the time needed to transmit bytes over a UART link.
+
+    Args:
+        byte_count: Number of bytes to transmit.
+        baudrate: Link speed in bits per second.
+
+    Returns:
+        Transmission time in seconds, assuming 8N1 framing.
+
+    Examples:
+        >>> wire_time(14, 9600)
+        0.014583333333333334
+    """
+    return byte_count * _BITS_PER_BYTE / baudrate
+
+
+class LatencyEstimator:
+    """Sliding-window percentile estimator for response latencies.
+
+    The most recent ``window`` samples are kept, so the estimate follows
+    changes in the device's behavior while ignoring single outliers.
+
+    Args:
+        percentile: Percentile of the samples to report, between 0 and 100
+            (default: 10.0).
+        window: Number of recent samples to keep (default: 64).
+
+    Raises:
+        ValueError: If percentile is out of range or window is less than 1.
+
+    Examples:
+        >>> estimator = LatencyEstimator(percentile=50.0)
+        >>> for sample in (0.003, 0.001, 0.002):
+        ...     estimator.add(sample)
+        >>> estimator.estimate()
+        0.002
+    """
+
+    def __init__(self, percentile: float = 10.0, window: int = 64) -> None:
+        """Initialize an estimator without samples.
+
+        Args:
+            percentile: Percentile of the samples to report.
+            window: Number of recent samples to keep.
+
+        Raises:
+            ValueError: If percentile is out of range or window is less than 1.
+        """
+        if not 0.0 <= percentile <= _MAX_PERCENTILE:
+            msg = f"percentile must be between 0 and 100, got {percentile}"
+            raise ValueError(msg)
+        if window < 1:
+            msg = f"window must be at least 1, got {window}"
+            raise ValueError(msg)
+        self._percentile = percentile
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def add(self, sample: float) -> None:
+        """Record a measured latency.
+
+        Args:
+            sample: Latency in seconds.
+        """
+        self._samples.append(sample)
+
+    def estimate(self) -> float | None:
+        """Return the configured percentile of the recorded latencies.
+
+        Returns:
+            Latency in seconds (nearest-rank percentile), or None if no
+            samples have been recorded.
+        """
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = math.ceil(self._percentile / _MAX_PERCENTILE * len(ordered))
+        return ordered[max(rank, 1) - 1]
+
+    def clear(self) -> None:
+        """Forget all recorded latencies."""
+        self._samples.clear()
+
+    def __len__(self) -> int:
+        """Return the number of recorded latencies.
+
+        Returns:
+            Number of samples in the window.
+        """
+        return len(self._samples)
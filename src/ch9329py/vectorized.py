@@ -0,0 +1,240 @@
+"""Vectorized packet encoding for large input traces.
+
+This module encodes whole recorded traces of mouse or keyboard reports with
+NumPy instead of building one packet per Python call. Clamping, two's
+complement conversion and checksums are computed on arrays, and the packets
+are returned as a single contiguous buffer ready for bulk transmission.
+
+Requires NumPy, which is installed with the ``numpy`` extra::
+
+    pip install "ch9329py[numpy]"
+"""
+
+from __future__ import annotations
+
+from itertools import pairwise
+from typing import TYPE_CHECKING, NamedTuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    msg = 'ch9329py.vectorized requires NumPy; install "ch9329py[numpy]"'
+    raise ImportError(msg) from e
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# Header, address, command and length of each packet type
+_MOUSE_REL_PREFIX = (0x57, 0xAB, 0x00, 0x05, 0x05)
+_KEYBOARD_PREFIX = (0x57, 0xAB, 0x00, 0x02, 0x08)
+_PREFIX_LENGTH = 5
+# Mode byte of a relative mouse report
+_MOUSE_REL_MODE = 0x01
+# Maximum number of keys in a keyboard report
+_KEYBOARD_KEY_SLOTS = 6
+_BYTE_MAX = 0xFF
+
+
+class EncodedBatch(NamedTuple):
+    r"""Packets encoded into one contiguous buffer.
+
+    Attributes:
+        data: All packets back to back.
+        offsets: Frame boundaries with one more entry than there are packets;
+            packet ``i`` is ``data[offsets[i]:offsets[i + 1]]``.
+
+    Examples:
+        >>> batch = encode_mouse_rel(0, [10, -10], 0, 0)
+        >>> batch.packets()[1].tobytes()
+        b'W\xab\x00\x05\x05\x01\x00\xf6\x00\x00\x13'
+    """
+
+    data: bytes
+    offsets: npt.NDArray[np.intp]
+
+    def packets(self) -> list[memoryview]:
+        """Return a view of each packet, e.g. for `CommunicationAdapter.send_many`.
+
+        Returns:
+            Views into `data`, in order.
+        """
+        view = memoryview(self.data)
+        bounds = self.offsets.tolist()
+        return [view[start:end] for start, end in pairwise(bounds)]
+
+    def __len__(self) -> int:
+        """Return the number of packets.
+
+        Returns:
+            Number of encoded packets.
+        """
+        return len(self.offsets) - 1
+
+
+def encode_mouse_rel(
+    buttons: npt.ArrayLike,
+    dx: npt.ArrayLike,
+    dy: npt.ArrayLike,
+    scroll: npt.ArrayLike,
+) -> EncodedBatch:
+    r"""Encode a trace of relative mouse reports.
+
+    The arguments are broadcast against each other, so constant columns can be
+    given as scalars. Values are clamped like in
+    `CH9329Protocol.build_mouse_rel_packet`.
+
+    Args:
+        buttons: Button state byte of each report.
+        dx: Relative X movement of each report (-128 to 127).
+        dy: Relative Y movement of each report (-128 to 127).
+        scroll: Scroll wheel movement of each report (-127 to 127).
+
+    Returns:
+        The packets, identical to calling `build_mouse_rel_packet` per report.
+
+    Raises:
+        ValueError: If the arguments cannot be broadcast to one dimension or
+            a button state is not a byte.
+
+    Examples:
+        >>> batch = encode_mouse_rel(0, np.array([10, 20]), 0, 0)
+        >>> len(batch), batch.offsets.tolist()
+        (2, [0, 11, 22])
+    """
+    buttons_, dx_, dy_, scroll_ = _columns(buttons, dx, dy, scroll)
+    _check_bytes(buttons_, "buttons")
+    frames = _frames(_MOUSE_REL_PREFIX, len(buttons_))
+    frames[:, 5] = _MOUSE_REL_MODE
+    frames[:, 6] = buttons_
+    # Casting the clamped values to int8 and viewing them as uint8 yields
+    # their two's complement bytes
+    frames[:, 7] = _signed_bytes(dx_, -128, 127)
+    frames[:, 8] = _signed_bytes(dy_, -128, 127)
+    frames[:, 9] = _signed_bytes(scroll_, -127, 127)
+    return _finish(frames)
+
+
+def encode_keyboard(modifiers: npt.ArrayLike, keycodes: npt.ArrayLike) -> EncodedBatch:
+    r"""Encode a trace of keyboard reports.
+
+    Args:
+        modifiers: Modifier bitmask of each report, shape ``(n,)``.
+        keycodes: USB HID keycodes of each report, shape ``(n, k)`` with
+            ``k`` at most 6. Unused slots must be 0; missing slots are padded
+            with 0.
+
+    Returns:
+        The packets, identical to calling `build_keyboard_packet` per report.
+
+    Raises:
+        ValueError: If the shapes do not match, more than 6 key slots are
+            given or a value is not a byte.
+
+    Examples:
+        >>> batch = encode_keyboard([0x02, 0x00], [[0x04], [0x00]])
+        >>> batch.packets()[0].tobytes()
+        b'W\xab\x00\x02\x08\x02\x00\x04\x00\x00\x00\x00\x00\x10'
+    """
+    modifiers_ = np.asarray(modifiers, dtype=np.int64)
+    keycodes_ = np.asarray(keycodes, dtype=np.int64)
+    if modifiers_.ndim != 1 or keycodes_.ndim != modifiers_.ndim + 1:
+        msg = (
+            "modifiers must be one- and keycodes two-dimensional, got shapes "
+            f"{modifiers_.shape} and {keycodes_.shape}"
+        )
+        raise ValueError(msg)
+    if keycodes_.shape[0] != len(modifiers_):
+        msg = f"Got {len(modifiers_)} modifiers but {keycodes_.shape[0]} keycode rows"
+        raise ValueError(msg)
+    if keycodes_.shape[1] > _KEYBOARD_KEY_SLOTS:
+        msg = f"At most 6 keycodes are allowed, got {keycodes_.shape[1]}"
+        raise ValueError(msg)
+    _check_bytes(modifiers_, "modifiers")
+    _check_bytes(keycodes_, "keycodes")
+    frames = _frames(_KEYBOARD_PREFIX, len(modifiers_))
+    frames[:, 5] = modifiers_
+    frames[:, 6] = 0x00
+    first_key = _PREFIX_LENGTH + 2
+    frames[:, first_key : first_key + keycodes_.shape[1]] = keycodes_
+    frames[:, first_key + keycodes_.shape[1] : -1] = 0x00
+    return _finish(frames)
+
+
+def _columns(*values: npt.ArrayLike) -> tuple[npt.NDArray[np.int64], ...]:
+    """Broadcast report columns to one common one-dimensional shape.
+
+    Args:
+        *values: Scalars or one-dimensional arrays.
+
+    Returns:
+        The columns as int64 arrays of equal length.
+
+    Raises:
+        ValueError: If the columns cannot be broadcast to one dimension.
+    """
+    columns = np.broadcast_arrays(*(np.asarray(v, dtype=np.int64) for v in values))
+    if columns[0].ndim != 1:
+        msg = f"Expected one-dimensional columns, got shape {columns[0].shape}"
+        raise ValueError(msg)
+    return columns
+
+
+def _check_bytes(values: npt.NDArray[np.int64], name: str) -> None:
+    """Check that every value fits into an unsigned byte.
+
+    Args:
+        values: Values to check.
+        name: Argument name for the error message.
+
+    Raises:
+        ValueError: If a value is outside 0-255.
+    """
+    if np.any((values < 0) | (values > _BYTE_MAX)):
+        msg = f"{name} must be between 0 and 255"
+        raise ValueError(msg)
+
+
+def _signed_bytes(
+    values: npt.NDArray[np.int64], low: int, high: int
+) -> npt.NDArray[np.uint8]:
+    """Clamp signed values and return their two's complement bytes.
+
+    Args:
+        values: Signed values.
+        low: Lower clamp bound.
+        high: Upper clamp bound.
+
+    Returns:
+        The clamped values as unsigned bytes.
+    """
+    return np.clip(values, low, high).astype(np.int8).view(np.uint8)
+
+
+def _frames(prefix: tuple[int, ...], count: int) -> npt.NDArray[np.uint8]:
+    """Allocate packet rows with the fixed prefix filled in.
+
+    Args:
+        prefix: Header, address, command and length bytes.
+        count: Number of packets.
+
+    Returns:
+        Array of shape ``(count, packet length)``.
+    """
+    frames = np.empty((count, len(prefix) + prefix[-1] + 1), dtype=np.uint8)
+    frames[:, : len(prefix)] = prefix
+    return frames
+
+
+def _finish(frames: npt.NDArray[np.uint8]) -> EncodedBatch:
+    """Fill in the checksum column and flatten the packets.
+
+    Args:
+        frames: Packet rows with everything but the checksum filled in.
+
+    Returns:
+        The encoded batch.
+    """
+    frames[:, -1] = frames[:, :-1].sum(axis=1, dtype=np.uint32) & 0xFF
+    count, length = frames.shape
+    offsets = np.arange(count + 1, dtype=np.intp) * length
+    return EncodedBatch(frames.tobytes(), offsets)
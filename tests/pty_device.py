@@ -0,0 +1,72 @@
+"""Pty-backed stand-in for a CH9329 device used by transport tests."""
+
+import os
+import threading
+import tty
+
+import pytest
+
+FRAME_OVERHEAD = 6  # header(2) + address(1) + command(1) + length(1) + checksum(1)
+
+
+def frame_length(buffer: bytearray) -> int:
+    """Return the total length of the frame at the start of the buffer."""
+    return buffer[4] + FRAME_OVERHEAD
+
+
+requires_pty = pytest.mark.skipif(not hasattr(os, "openpty"), reason="requires a pty")
+
+
+class StandInDevice:
+    """Pty-backed stand-in that acknowledges every frame it receives.
+
+    If ``unsolicited`` is set, it is written before every acknowledgement.
+    """
+
+    def __init__(self, *, respond: bool = True, unsolicited: bytes = b"") -> None:
+        """Open the pty pair and start answering frames."""
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._master)
+        self.port = os.ttyname(self._slave)
+        self.received: list[bytes] = []
+        self._respond = respond
+        self._unsolicited = unsolicited
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        buffer = bytearray()
+        while True:
+            try:
+                chunk = os.read(self._master, 256)
+            except OSError:
+                return
+            if not chunk:
+                return
+            buffer += chunk
+            while len(buffer) > FRAME_OVERHEAD and len(buffer) >= frame_length(buffer):
+                frame = bytes(buffer[: frame_length(buffer)])
+                del buffer[: len(frame)]
+                self.received.append(frame)
+                if self._respond:
+                    self._acknowledge(frame[3])
+
+    def _acknowledge(self, command: int) -> None:
+        os.write(self._master, self._unsolicited + ack(command))
+
+    def close(self) -> None:
+        """Close both ends of the pty."""
+        os.close(self._slave)
+        os.close(self._master)
+        self._thread.join(timeout=1)
+
+
+KEYBOARD_RELEASE = bytes.fromhex("57ab00020800000000000000000c")
+MOUSE_RELEASE = bytes.fromhex("57ab00050501000000000d")
+MEDIA_RELEASE = bytes.fromhex("57ab000304020000000b")
+
+
+def ack(command: int) -> bytes:
+    """Build the success response the device sends for a command."""
+    reply = [0x57, 0xAB, 0x00, command | 0x80, 0x01, 0x00]
+    return bytes([*reply, sum(reply) & 0xFF])
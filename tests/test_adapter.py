@@ -1,10 +1,28 @@
 """Tests for CH9329 communication adapters."""
 
+import itertools
+import threading
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-
-from ch9329py.adapter import CommunicationAdapter, SerialAdapter
+import serial
+
+from ch9329py.adapter import (
+    CommunicationAdapter,
+    PipelinedSerialAdapter,
+    SerialAdapter,
+)
+from ch9329py.timing import wire_time
+from tests.pty_device import (
+    KEYBOARD_RELEASE,
+    MEDIA_RELEASE,
+    MOUSE_RELEASE,
+    StandInDevice,
+    ack,
+    requires_pty,
+)
+
+FAST_BAUDRATE = 115200
 
 
 class TestCommunicationAdapter:
@@ -70,7 +88,7 @@ class TestSerialAdapter:
         """Test that send() writes data and reads response."""
         mock_serial = MagicMock()
         mock_serial.is_open = True
-        mock_serial.read.return_value = b"\x00\x01\x02\x03\x04\x05\x06"
+        mock_serial.read.return_value = b"\x57\xab\x00\x82\x01\x00\x85"
         mock_serial_class.return_value = mock_serial
 
         adapter = SerialAdapter("/dev/ttyUSB0", 9600)
@@ -80,7 +98,7 @@ class TestSerialAdapter:
 
         mock_serial.write.assert_called_once_with(test_data)
         mock_serial.read.assert_called_once_with(7)
-        assert response == b"\x00\x01\x02\x03\x04\x05\x06"
+        assert response == b"\x57\xab\x00\x82\x01\x00\x85"
 
     @patch("ch9329py.adapter.serial.Serial")
     @patch("ch9329py.adapter.time.sleep")
@@ -90,7 +108,7 @@ class TestSerialAdapter:
         """Test that send() includes a delay between write and read."""
         mock_serial = MagicMock()
         mock_serial.is_open = True
-        mock_serial.read.return_value = b"\x00\x01\x02\x03\x04\x05\x06"
+        mock_serial.read.return_value = b"\x57\xab\x00\x82\x01\x00\x85"
         mock_serial_class.return_value = mock_serial
 
         adapter = SerialAdapter("/dev/ttyUSB0", 9600)
@@ -142,3 +160,603 @@ class TestSerialAdapter:
 
         with pytest.raises(ConnectionError, match="Serial port is not open"):
             adapter.send(b"\x57\xab\x00\x02\x08")
+
+    @patch("ch9329py.adapter.serial.Serial")
+    def test_set_baudrate(self, mock_serial_class: Mock) -> None:
+        """Test that set_baudrate() reconfigures the port and drops input."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600)
+        adapter.set_baudrate(FAST_BAUDRATE)
+
+        assert mock_serial.baudrate == FAST_BAUDRATE
+        mock_serial.reset_input_buffer.assert_called_once()
+
+    @patch("ch9329py.adapter.serial.Serial")
+    def test_set_baudrate_raises_connection_error(
+        self, mock_serial_class: Mock
+    ) -> None:
+        """Test that a failing reconfiguration raises ConnectionError."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.reset_input_buffer.side_effect = OSError("gone")
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600)
+
+        with pytest.raises(ConnectionError):
+            adapter.set_baudrate(115200)
+
+
+class TestSerialAdapterEventDriven:
+    """Tests for SerialAdapter event-driven response waiting."""
+
+    @patch("ch9329py.adapter.serial.Serial")
+    @patch("ch9329py.adapter.select.select")
+    @patch("ch9329py.adapter.time.sleep")
+    def test_send_does_not_sleep(
+        self, mock_sleep: Mock, mock_select: Mock, mock_serial_class: Mock
+    ) -> None:
+        """Test that send() returns the response without a fixed delay."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.fileno.return_value = 3
+        mock_serial.in_waiting = 7
+        mock_serial.read.return_value = b"\x57\xab\x00\x82\x01\x00\x85"
+        mock_serial_class.return_value = mock_serial
+        mock_select.return_value = ([3], [], [])
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600, event_driven=True)
+        response = adapter.send(b"\x57\xab\x00\x02\x08")
+
+        assert response == b"\x57\xab\x00\x82\x01\x00\x85"
+        mock_sleep.assert_not_called()
+        mock_serial.read.assert_called_once_with(7)
+
+    @patch("ch9329py.adapter.serial.Serial")
+    @patch("ch9329py.adapter.select.select")
+    def test_send_collects_partial_reads(
+        self, mock_select: Mock, mock_serial_class: Mock
+    ) -> None:
+        """Test that send() keeps waiting until the full response arrives."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.fileno.return_value = 3
+        mock_serial.in_waiting = 3
+        mock_serial.read.side_effect = [b"\x57\xab\x00", b"\x82\x01\x00", b"\x85"]
+        mock_serial_class.return_value = mock_serial
+        mock_select.return_value = ([3], [], [])
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600, event_driven=True)
+        response = adapter.send(b"\x57\xab\x00\x02\x08")
+
+        expected_reads = 3
+        assert response == b"\x57\xab\x00\x82\x01\x00\x85"
+        assert mock_serial.read.call_count == expected_reads
+
+    @patch("ch9329py.adapter.serial.Serial")
+    @patch("ch9329py.adapter.select.select")
+    def test_send_returns_partial_response_on_timeout(
+        self, mock_select: Mock, mock_serial_class: Mock
+    ) -> None:
+        """Test that send() gives up when the fd never becomes readable."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.fileno.return_value = 3
+        mock_serial_class.return_value = mock_serial
+        mock_select.return_value = ([], [], [])
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600, event_driven=True)
+        response = adapter.send(b"\x57\xab\x00\x02\x08")
+
+        assert response == b""
+        mock_serial.read.assert_not_called()
+
+    @requires_pty
+    def test_send_over_pty(self) -> None:
+        """Test event-driven send() against a pty-backed stand-in device."""
+        device = StandInDevice()
+        with SerialAdapter(device.port, 9600, event_driven=True) as adapter:
+            response = adapter.send(KEYBOARD_RELEASE)
+        device.close()
+
+        assert response == ack(0x02)
+
+
+@requires_pty
+class TestPipelinedSerialAdapter:
+    """Tests for PipelinedSerialAdapter against a pty-backed stand-in."""
+
+    def test_send_returns_response(self) -> None:
+        """Test that send() blocks until the packet's response arrives."""
+        device = StandInDevice()
+        with PipelinedSerialAdapter(device.port, 9600) as adapter:
+            response = adapter.send(KEYBOARD_RELEASE)
+        device.close()
+
+        assert response == ack(0x02)
+
+    def test_submit_matches_responses_in_fifo_order(self) -> None:
+        """Test that each future receives the response to its own packet."""
+        device = StandInDevice()
+        packets = [KEYBOARD_RELEASE, MOUSE_RELEASE, MEDIA_RELEASE] * 10
+        with PipelinedSerialAdapter(device.port, 9600, window=4) as adapter:
+            futures = [adapter.submit(packet) for packet in packets]
+            responses = [future.result(timeout=1) for future in futures]
+        device.close()
+
+        assert responses == [ack(packet[3]) for packet in packets]
+        assert device.received == packets
+
+    def test_unsolicited_frames_are_not_responses(self) -> None:
+        """Test that frames for other commands do not resolve packets."""
+        device = StandInDevice(unsolicited=ack(0x01))
+        packets = [KEYBOARD_RELEASE, MOUSE_RELEASE] * 5
+        with PipelinedSerialAdapter(device.port, 9600, window=3) as adapter:
+            responses = adapter.send_many(packets)
+        device.close()
+
+        assert responses == [ack(packet[3]) for packet in packets]
+
+    def test_missing_response_times_out(self) -> None:
+        """Test that a packet without a response fails with ConnectionError."""
+        device = StandInDevice(respond=False)
+        with PipelinedSerialAdapter(device.port, 9600, timeout=0.05) as adapter:
+            future = adapter.submit(KEYBOARD_RELEASE)
+            with pytest.raises(ConnectionError, match="Timed out"):
+                future.result(timeout=1)
+        device.close()
+
+    def test_flush_waits_for_outstanding_packets(self) -> None:
+        """Test that flush() returns once every future is resolved."""
+        device = StandInDevice()
+        with PipelinedSerialAdapter(device.port, 9600) as adapter:
+            futures = [adapter.submit(KEYBOARD_RELEASE) for _ in range(5)]
+            adapter.flush()
+            assert all(future.done() for future in futures)
+        device.close()
+
+    def test_close_fails_pending_packets(self) -> None:
+        """Test that closing the adapter fails packets still in flight."""
+        device = StandInDevice(respond=False)
+        adapter = PipelinedSerialAdapter(device.port, 9600, timeout=10)
+        future = adapter.submit(KEYBOARD_RELEASE)
+        adapter.close()
+        device.close()
+
+        with pytest.raises(ConnectionError, match="closed"):
+            future.result(timeout=1)
+
+    def test_submit_after_close_raises_error(self) -> None:
+        """Test that submit() on a closed adapter raises ConnectionError."""
+        device = StandInDevice()
+        adapter = PipelinedSerialAdapter(device.port, 9600)
+        adapter.close()
+        device.close()
+
+        with pytest.raises(ConnectionError, match="not open"):
+            adapter.submit(KEYBOARD_RELEASE)
+
+    @patch("ch9329py.adapter.serial.Serial")
+    def test_reader_failure_fails_pending_and_later_packets(
+        self, mock_serial_class: Mock
+    ) -> None:
+        """Test that a failed read stops the adapter instead of hanging."""
+        written = threading.Event()
+
+        def read(_size: int) -> bytes:
+            written.wait(timeout=1)
+            msg = "device disconnected"
+            raise serial.SerialException(msg)
+
+        mock_serial = MagicMock(is_open=True, in_waiting=0)
+        mock_serial.read.side_effect = read
+        mock_serial.write.side_effect = lambda _data: written.set()
+        mock_serial_class.return_value = mock_serial
+        adapter = PipelinedSerialAdapter("/dev/ttyUSB0", 9600, timeout=10)
+
+        future = adapter.submit(KEYBOARD_RELEASE)
+
+        with pytest.raises(ConnectionError, match="device disconnected"):
+            future.result(timeout=1)
+        with pytest.raises(ConnectionError, match="reader stopped"):
+            adapter.submit(KEYBOARD_RELEASE)
+        with pytest.raises(ConnectionError, match="reader stopped"):
+            adapter.send(KEYBOARD_RELEASE)
+        adapter.close()
+
+    def test_submitted_packet_cannot_be_cancelled(self) -> None:
+        """Test that cancelling a future does not stop the reader."""
+        device = StandInDevice()
+        with PipelinedSerialAdapter(device.port, 9600) as adapter:
+            future = adapter.submit(KEYBOARD_RELEASE)
+            assert not future.cancel()
+            assert future.result(timeout=1) == ack(0x02)
+            assert adapter.send(MOUSE_RELEASE) == ack(0x05)
+        device.close()
+
+    @patch("ch9329py.adapter.serial.Serial")
+    def test_unexpected_reader_error_fails_pending_packets(
+        self, mock_serial_class: Mock
+    ) -> None:
+        """Test that any error in the reader stops the adapter."""
+        written = threading.Event()
+
+        def read(_size: int) -> bytes:
+            written.wait(timeout=1)
+            msg = "unexpected"
+            raise RuntimeError(msg)
+
+        mock_serial = MagicMock(is_open=True, in_waiting=0)
+        mock_serial.read.side_effect = read
+        mock_serial.write.side_effect = lambda _data: written.set()
+        mock_serial_class.return_value = mock_serial
+        adapter = PipelinedSerialAdapter("/dev/ttyUSB0", 9600, timeout=10)
+
+        future = adapter.submit(KEYBOARD_RELEASE)
+
+        with pytest.raises(ConnectionError, match="unexpected"):
+            future.result(timeout=1)
+        with pytest.raises(ConnectionError, match="reader stopped"):
+            adapter.send(KEYBOARD_RELEASE)
+        adapter.close()
+
+    @patch("ch9329py.adapter.serial.Serial")
+    def test_failed_write_stops_adapter(self, mock_serial_class: Mock) -> None:
+        """Test that a partly written packet cannot desync later responses."""
+        mock_serial = MagicMock(is_open=True, in_waiting=0)
+        mock_serial.read.side_effect = lambda _size: b""
+        mock_serial.write.side_effect = OSError("gone")
+        mock_serial_class.return_value = mock_serial
+        adapter = PipelinedSerialAdapter("/dev/ttyUSB0", 9600)
+
+        with pytest.raises(ConnectionError, match="gone"):
+            adapter.submit(KEYBOARD_RELEASE)
+        with pytest.raises(ConnectionError, match="reader stopped"):
+            adapter.submit(KEYBOARD_RELEASE)
+        adapter.close()
+
+    @patch("ch9329py.adapter.serial.Serial")
+    def test_set_baudrate_runs_on_reader_thread(self, mock_serial_class: Mock) -> None:
+        """Test that the port is reconfigured by the thread that reads it."""
+        threads: list[str] = []
+        mock_serial = MagicMock(is_open=True, in_waiting=0)
+        mock_serial.read.side_effect = lambda _size: b""
+        mock_serial.reset_input_buffer.side_effect = lambda: threads.append(
+            threading.current_thread().name
+        )
+        mock_serial_class.return_value = mock_serial
+        adapter = PipelinedSerialAdapter("/dev/ttyUSB0", 9600)
+
+        adapter.set_baudrate(FAST_BAUDRATE)
+        adapter.close()
+
+        assert threads == ["ch9329py-reader-/dev/ttyUSB0"]
+        assert mock_serial.baudrate == FAST_BAUDRATE
+
+    def test_set_baudrate_keeps_packets_in_flight(self) -> None:
+        """Test that the change waits for responses to earlier packets."""
+        device = StandInDevice()
+        with PipelinedSerialAdapter(device.port, 9600) as adapter:
+            futures = [adapter.submit(KEYBOARD_RELEASE) for _ in range(4)]
+            adapter.set_baudrate(FAST_BAUDRATE)
+            responses = [future.result(timeout=1) for future in futures]
+            assert adapter.send(MOUSE_RELEASE) == ack(0x05)
+        device.close()
+
+        assert responses == [ack(0x02)] * 4
+
+    def test_invalid_window_raises_error(self) -> None:
+        """Test that a window smaller than one is rejected."""
+        with pytest.raises(ValueError, match="window"):
+            PipelinedSerialAdapter("/dev/ttyUSB0", 9600, window=0)
+
+
+class TestSerialAdapterLongResponses:
+    """Tests for responses longer than an input acknowledgement."""
+
+    @patch("ch9329py.adapter.serial.Serial")
+    @patch("ch9329py.adapter.time.sleep")
+    def test_send_reads_rest_of_long_frame(
+        self, mock_sleep: Mock, mock_serial_class: Mock
+    ) -> None:
+        """Test that send() reads the remainder announced by the length field."""
+        frame = [0x57, 0xAB, 0x00, 0x81, 0x08, *range(8)]
+        response = bytes([*frame, sum(frame) & 0xFF])
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.read.side_effect = [response[:7], response[7:]]
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600)
+
+        assert adapter.send(b"\x57\xab\x00\x01\x00\x03") == response
+        mock_serial.read.assert_called_with(len(response) - 7)
+        mock_sleep.assert_called_once()
+
+    @patch("ch9329py.adapter.serial.Serial")
+    @patch("ch9329py.adapter.time.sleep")
+    def test_send_skips_garbage_before_frame(
+        self, mock_sleep: Mock, mock_serial_class: Mock
+    ) -> None:
+        """Test that stray bytes do not shift the response frame."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.read.side_effect = [b"\x00\x00" + ack(0x02)[:5], ack(0x02)[5:]]
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600)
+
+        assert adapter.send(KEYBOARD_RELEASE) == ack(0x02)
+        mock_sleep.assert_called_once()
+
+    @patch("ch9329py.adapter.serial.Serial")
+    @patch("ch9329py.adapter.time.sleep")
+    def test_send_skips_unsolicited_frame(
+        self, mock_sleep: Mock, mock_serial_class: Mock
+    ) -> None:
+        """Test that a frame for another command is not taken as the response."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.read.side_effect = [ack(0x05), ack(0x02)]
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600)
+
+        assert adapter.send(KEYBOARD_RELEASE) == ack(0x02)
+        mock_sleep.assert_called_once()
+
+    @patch("ch9329py.adapter.serial.Serial")
+    @patch("ch9329py.adapter.time.sleep")
+    def test_send_returns_empty_on_timeout(
+        self, mock_sleep: Mock, mock_serial_class: Mock
+    ) -> None:
+        """Test that a partial frame is dropped when the read times out."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.read.side_effect = [ack(0x02)[:3], b"", ack(0x05)]
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600)
+
+        assert adapter.send(KEYBOARD_RELEASE) == b""
+        assert adapter.send(MOUSE_RELEASE) == ack(0x05)
+        assert mock_sleep.call_count == len([KEYBOARD_RELEASE, MOUSE_RELEASE])
+
+
+LATENCY_PROBE_INTERVAL = 8
+DEVICE_LATENCY = 0.001
+READ_OVERHEAD = 0.0001
+STABILITY_SENDS = 200
+
+
+class _DeviceClock:
+    """Fake time for a device that answers after a fixed processing latency.
+
+    Every read also takes ``READ_OVERHEAD``, like a system call would.
+    """
+
+    def __init__(self, latency: float) -> None:
+        self.now = 0.0
+        self.latency = latency
+        self.answered_at = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    def write(self, data: bytes) -> int:
+        self.answered_at = (
+            self.now
+            + wire_time(len(data) + len(ack(0x02)), FAST_BAUDRATE)
+            + self.latency
+        )
+        return len(data)
+
+    def read(self, _size: int) -> bytes:
+        self.now = max(self.now, self.answered_at) + READ_OVERHEAD
+        return ack(0x02)
+
+
+class TestSerialAdapterAdaptiveTiming:
+    """Tests for deriving the write-read delay from the link and device."""
+
+    @patch("ch9329py.adapter.serial.Serial")
+    @patch("ch9329py.adapter.time.sleep")
+    def test_initial_delay_is_wire_time(
+        self, mock_sleep: Mock, mock_serial_class: Mock
+    ) -> None:
+        """Test that the first delay covers only request and response on the wire."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.read.return_value = ack(0x02)
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", FAST_BAUDRATE, write_read_delay=None)
+        assert adapter.response_latency == pytest.approx(
+            wire_time(len(ack(0x02)), FAST_BAUDRATE)
+        )
+        adapter.send(KEYBOARD_RELEASE)
+
+        mock_sleep.assert_called_once_with(
+            pytest.approx(
+                wire_time(len(KEYBOARD_RELEASE) + len(ack(0x02)), FAST_BAUDRATE)
+            )
+        )
+
+    @patch("ch9329py.adapter.serial.Serial")
+    @patch("ch9329py.adapter.time.sleep")
+    @patch("ch9329py.adapter.time.monotonic")
+    def test_latency_is_learned(
+        self, mock_monotonic: Mock, mock_sleep: Mock, mock_serial_class: Mock
+    ) -> None:
+        """Test that measured latencies raise the delay above the wire time."""
+        clock = itertools.count(step=0.01)
+        mock_monotonic.side_effect = lambda: next(clock)
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.read.return_value = ack(0x02)
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", FAST_BAUDRATE, write_read_delay=None)
+        for _ in range(LATENCY_PROBE_INTERVAL):
+            adapter.send(KEYBOARD_RELEASE)
+
+        assert mock_sleep.call_count == LATENCY_PROBE_INTERVAL - 1
+        measured = adapter.response_latency
+        assert measured > wire_time(len(ack(0x02)), FAST_BAUDRATE)
+        adapter.send(KEYBOARD_RELEASE)
+        assert mock_sleep.call_args.args[0] == pytest.approx(
+            wire_time(len(KEYBOARD_RELEASE), FAST_BAUDRATE) + measured
+        )
+
+    @patch("ch9329py.adapter.serial.Serial")
+    def test_latency_estimate_is_stable(self, mock_serial_class: Mock) -> None:
+        """Test that the sleep before a read does not inflate the estimate."""
+        clock = _DeviceClock(DEVICE_LATENCY)
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.write.side_effect = clock.write
+        mock_serial.read.side_effect = clock.read
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", FAST_BAUDRATE, write_read_delay=None)
+        estimates = []
+        with (
+            patch("ch9329py.adapter.time.monotonic", clock.monotonic),
+            patch("ch9329py.adapter.time.sleep", clock.sleep),
+        ):
+            for _ in range(STABILITY_SENDS):
+                adapter.send(KEYBOARD_RELEASE)
+                estimates.append(adapter.response_latency)
+
+        learned = estimates[LATENCY_PROBE_INTERVAL - 1 :]
+        expected = (
+            wire_time(len(ack(0x02)), FAST_BAUDRATE) + DEVICE_LATENCY + READ_OVERHEAD
+        )
+        assert learned == pytest.approx([expected] * len(learned))
+
+    @patch("ch9329py.adapter.serial.Serial")
+    @patch("ch9329py.adapter.time.monotonic")
+    def test_set_baudrate_forgets_latencies(
+        self, mock_monotonic: Mock, mock_serial_class: Mock
+    ) -> None:
+        """Test that changing the baud rate restarts from the wire time."""
+        clock = itertools.count(step=0.01)
+        mock_monotonic.side_effect = lambda: next(clock)
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.read.return_value = ack(0x02)
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600, write_read_delay=None)
+        with patch("ch9329py.adapter.time.sleep"):
+            adapter.send(KEYBOARD_RELEASE)
+        adapter.set_baudrate(FAST_BAUDRATE)
+
+        assert adapter.response_latency == pytest.approx(
+            wire_time(len(ack(0x02)), FAST_BAUDRATE)
+        )
+
+    @patch("ch9329py.adapter.serial.Serial")
+    def test_fixed_delay_is_reported(self, mock_serial_class: Mock) -> None:
+        """Test that a fixed delay is reported unchanged."""
+        mock_serial_class.return_value = MagicMock()
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600, write_read_delay=0.05)
+
+        assert adapter.response_latency == pytest.approx(0.05)
+
+
+class TestSendMany:
+    """Tests for batch sending through send_many()."""
+
+    def test_default_implementation_calls_send(self) -> None:
+        """Test that the ABC default sends packets one by one."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send.side_effect = lambda data: data[:2]
+
+        responses = CommunicationAdapter.send_many(mock_adapter, [b"ab1", b"cd2"])
+
+        assert responses == [b"ab", b"cd"]
+        assert mock_adapter.send.call_count == len(responses)
+
+    @patch("ch9329py.adapter.serial.Serial")
+    @patch("ch9329py.adapter.time.sleep")
+    def test_serial_adapter_writes_once(
+        self, mock_sleep: Mock, mock_serial_class: Mock
+    ) -> None:
+        """Test that SerialAdapter writes all packets in a single call."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial.read.side_effect = [ack(0x02), ack(0x05)]
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600)
+        responses = adapter.send_many([KEYBOARD_RELEASE, MOUSE_RELEASE])
+
+        mock_serial.write.assert_called_once_with(KEYBOARD_RELEASE + MOUSE_RELEASE)
+        mock_sleep.assert_called_once()
+        assert responses == [ack(0x02), ack(0x05)]
+
+    @patch("ch9329py.adapter.serial.Serial")
+    def test_serial_adapter_empty_batch(self, mock_serial_class: Mock) -> None:
+        """Test that an empty batch does not touch the port."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial_class.return_value = mock_serial
+
+        adapter = SerialAdapter("/dev/ttyUSB0", 9600)
+
+        assert adapter.send_many([]) == []
+        mock_serial.write.assert_not_called()
+
+    @requires_pty
+    def test_event_driven_collects_all_responses(self) -> None:
+        """Test that event-driven send_many() returns every response in order."""
+        device = StandInDevice()
+        packets = [KEYBOARD_RELEASE, MOUSE_RELEASE, MEDIA_RELEASE] * 20
+        with SerialAdapter(device.port, 9600, event_driven=True) as adapter:
+            responses = adapter.send_many(packets)
+        device.close()
+
+        assert responses == [ack(packet[3]) for packet in packets]
+        assert device.received == packets
+
+    @requires_pty
+    def test_event_driven_skips_unsolicited_frames(self) -> None:
+        """Test that frames for other commands are not taken as responses."""
+        device = StandInDevice(unsolicited=ack(0x01))
+        packets = [KEYBOARD_RELEASE, MOUSE_RELEASE] * 5
+        with SerialAdapter(device.port, 9600, event_driven=True) as adapter:
+            responses = adapter.send_many(packets)
+        device.close()
+
+        assert responses == [ack(packet[3]) for packet in packets]
+
+    @requires_pty
+    def test_event_driven_pads_missing_responses(self) -> None:
+        """Test that responses that never arrive are returned as empty bytes."""
+        device = StandInDevice(respond=False)
+        with SerialAdapter(
+            device.port, 9600, timeout=0.05, event_driven=True
+        ) as adapter:
+            responses = adapter.send_many([KEYBOARD_RELEASE, MOUSE_RELEASE])
+        device.close()
+
+        assert responses == [b"", b""]
+
+    @requires_pty
+    def test_pipelined_adapter_send_many(self) -> None:
+        """Test that PipelinedSerialAdapter returns responses in order."""
+        device = StandInDevice()
+        packets = [KEYBOARD_RELEASE, MOUSE_RELEASE] * 10
+        with PipelinedSerialAdapter(device.port, 9600, window=3) as adapter:
+            responses = adapter.send_many(packets)
+        device.close()
+
+        assert responses == [ack(packet[3]) for packet in packets]
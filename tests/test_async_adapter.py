@@ -0,0 +1,154 @@
+"""Tests for CH9329 asynchronous communication adapters."""
+
+import asyncio
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from ch9329py.async_adapter import AsyncCommunicationAdapter, AsyncSerialAdapter
+from tests.pty_device import (
+    KEYBOARD_RELEASE,
+    MEDIA_RELEASE,
+    MOUSE_RELEASE,
+    StandInDevice,
+    ack,
+    requires_pty,
+)
+
+
+class TestAsyncCommunicationAdapter:
+    """Tests for AsyncCommunicationAdapter abstract base class."""
+
+    def test_cannot_instantiate_abstract_class(self) -> None:
+        """Test that AsyncCommunicationAdapter cannot be instantiated directly."""
+        with pytest.raises(TypeError):
+            AsyncCommunicationAdapter()  # type: ignore[abstract]
+
+
+class TestAsyncSerialAdapter:
+    """Tests for AsyncSerialAdapter implementation."""
+
+    @patch("ch9329py.async_adapter.serial.Serial")
+    def test_init_opens_port_non_blocking(self, mock_serial_class: Mock) -> None:
+        """Test that the port is opened with a zero read timeout."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = True
+        mock_serial_class.return_value = mock_serial
+
+        AsyncSerialAdapter("/dev/ttyUSB0", 9600)
+
+        mock_serial_class.assert_called_once_with(
+            port="/dev/ttyUSB0", baudrate=9600, timeout=0
+        )
+
+    @patch("ch9329py.async_adapter.serial.Serial")
+    def test_init_raises_error_for_invalid_port(self, mock_serial_class: Mock) -> None:
+        """Test that initializing with invalid port raises an error."""
+        mock_serial_class.side_effect = OSError("Port not found")
+
+        with pytest.raises(ConnectionError, match="Failed to open serial port"):
+            AsyncSerialAdapter("/dev/invalid", 9600)
+
+    @patch("ch9329py.async_adapter.serial.Serial")
+    def test_send_raises_error_if_port_closed(self, mock_serial_class: Mock) -> None:
+        """Test that send() raises an error if port is closed."""
+        mock_serial = MagicMock()
+        mock_serial.is_open = False
+        mock_serial_class.return_value = mock_serial
+        adapter = AsyncSerialAdapter("/dev/ttyUSB0", 9600)
+
+        with pytest.raises(ConnectionError, match="Serial port is not open"):
+            asyncio.run(adapter.send(KEYBOARD_RELEASE))
+
+
+@requires_pty
+class TestAsyncSerialAdapterOverPty:
+    """Tests for AsyncSerialAdapter against a pty-backed stand-in."""
+
+    def test_send_returns_response(self) -> None:
+        """Test that send() resolves with the device response."""
+        device = StandInDevice()
+
+        async def run() -> bytes:
+            async with AsyncSerialAdapter(device.port, 9600) as adapter:
+                return await adapter.send(KEYBOARD_RELEASE)
+
+        response = asyncio.run(run())
+        device.close()
+
+        assert response == ack(0x02)
+
+    def test_concurrent_sends_are_serialized(self) -> None:
+        """Test that concurrent tasks each receive their own response."""
+        device = StandInDevice()
+        packets = [KEYBOARD_RELEASE, MOUSE_RELEASE, MEDIA_RELEASE] * 5
+
+        async def run() -> list[bytes]:
+            async with AsyncSerialAdapter(device.port, 9600) as adapter:
+                return list(await asyncio.gather(*(adapter.send(p) for p in packets)))
+
+        responses = asyncio.run(run())
+        device.close()
+
+        assert responses == [ack(packet[3]) for packet in packets]
+
+    def test_send_returns_partial_response_on_timeout(self) -> None:
+        """Test that send() returns what arrived when the device is silent."""
+        device = StandInDevice(respond=False)
+
+        async def run() -> bytes:
+            async with AsyncSerialAdapter(device.port, 9600, timeout=0.05) as adapter:
+                return await adapter.send(KEYBOARD_RELEASE)
+
+        response = asyncio.run(run())
+        device.close()
+
+        assert response == b""
+
+    def test_event_loop_is_not_blocked(self) -> None:
+        """Test that other tasks run while a response is awaited."""
+        device = StandInDevice(respond=False)
+        ticks: list[int] = []
+
+        async def ticker() -> None:
+            for i in range(3):
+                ticks.append(i)
+                await asyncio.sleep(0.01)
+
+        async def run() -> None:
+            async with AsyncSerialAdapter(device.port, 9600, timeout=0.1) as adapter:
+                await asyncio.gather(adapter.send(KEYBOARD_RELEASE), ticker())
+
+        asyncio.run(run())
+        device.close()
+
+        assert ticks == [0, 1, 2]
+
+    def test_send_many_collects_all_responses(self) -> None:
+        """Test that send_many() writes once and returns every response."""
+        device = StandInDevice()
+        packets = [KEYBOARD_RELEASE, MOUSE_RELEASE, MEDIA_RELEASE] * 10
+
+        async def run() -> list[bytes]:
+            async with AsyncSerialAdapter(device.port, 9600) as adapter:
+                return await adapter.send_many(packets)
+
+        responses = asyncio.run(run())
+        device.close()
+
+        assert responses == [ack(packet[3]) for packet in packets]
+        assert device.received == packets
+
+    def test_send_many_skips_unsolicited_frames(self) -> None:
+        """Test that frames for other commands are not taken as responses."""
+        device = StandInDevice(unsolicited=ack(0x01))
+        packets = [KEYBOARD_RELEASE, MOUSE_RELEASE] * 5
+
+        async def run() -> list[bytes]:
+            async with AsyncSerialAdapter(device.port, 9600) as adapter:
+                return await adapter.send_many(packets)
+
+        responses = asyncio.run(run())
+        device.close()
+
+        assert responses == [ack(packet[3]) for packet in packets]
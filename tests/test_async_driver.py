@@ -0,0 +1,256 @@
+"""Tests for CH9329 asynchronous driver class."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ch9329py.async_adapter import AsyncCommunicationAdapter
+from ch9329py.async_driver import AsyncCH9329Driver
+from ch9329py.engine import PacketCache, ProtocolEngine
+from ch9329py.exceptions import DeviceStatusError
+from ch9329py.models import (
+    KeyboardInput,
+    KeyCode,
+    MediaKey,
+    MediaKeyInput,
+    ModifierKey,
+    MouseButton,
+    MouseInput,
+)
+from ch9329py.protocol import CH9329Protocol
+from ch9329py.text import compile_text
+
+
+class TestAsyncCH9329Driver:
+    """Tests for AsyncCH9329Driver."""
+
+    def test_send_keyboard_input(self) -> None:
+        """Test that keyboard input is encoded like the sync driver."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        driver = AsyncCH9329Driver(mock_adapter)
+        state = KeyboardInput(
+            modifiers={ModifierKey.KEY_LEFTSHIFT}, keys=[KeyCode.KEY_A]
+        )
+
+        asyncio.run(driver.send_keyboard_input(state))
+
+        mock_adapter.send.assert_awaited_once_with(
+            ProtocolEngine.encode_keyboard_input(state)
+        )
+
+    def test_send_mouse_input(self) -> None:
+        """Test that mouse input is encoded like the sync driver."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        driver = AsyncCH9329Driver(mock_adapter)
+        state = MouseInput(buttons={MouseButton.BTN_LEFT}, x=-5, y=5, scroll=1)
+
+        asyncio.run(driver.send_mouse_input(state))
+
+        mock_adapter.send.assert_awaited_once_with(
+            ProtocolEngine.encode_mouse_input(state)
+        )
+
+    def test_send_media_key_input(self) -> None:
+        """Test that media key input is encoded like the sync driver."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        driver = AsyncCH9329Driver(mock_adapter)
+        state = MediaKeyInput(keys=[MediaKey.KEY_MUTE])
+
+        asyncio.run(driver.send_media_key_input(state))
+
+        mock_adapter.send.assert_awaited_once_with(
+            ProtocolEngine.encode_media_key_input(state)
+        )
+
+    def test_context_manager_closes_adapter(self) -> None:
+        """Test that async context manager closes adapter on exit."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+
+        async def run() -> None:
+            async with AsyncCH9329Driver(mock_adapter) as driver:
+                assert driver is not None
+
+        asyncio.run(run())
+
+        mock_adapter.close.assert_awaited_once()
+
+    def test_send_batch_uses_send_many(self) -> None:
+        """Test that all inputs are passed to send_many() at once."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        mock_adapter.send_many.return_value = [b"ack1", b"ack2"]
+        driver = AsyncCH9329Driver(mock_adapter)
+        inputs = [KeyboardInput(keys=[KeyCode.KEY_H]), KeyboardInput()]
+
+        responses = asyncio.run(driver.send_batch(inputs))
+
+        mock_adapter.send_many.assert_awaited_once_with(
+            [ProtocolEngine.encode(input_data) for input_data in inputs]
+        )
+        assert responses == [b"ack1", b"ack2"]
+
+    def test_batch_flushes_in_one_call(self) -> None:
+        """Test that inputs inside the async block are sent together."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        mock_adapter.send_many.return_value = [b"ack1", b"ack2"]
+        driver = AsyncCH9329Driver(mock_adapter)
+
+        async def run() -> list[bytes]:
+            async with driver.batch() as batch:
+                await driver.send_keyboard_input(KeyboardInput(keys=[KeyCode.KEY_A]))
+                await driver.send_keyboard_input(KeyboardInput())
+                mock_adapter.send_many.assert_not_awaited()
+            return batch.responses
+
+        responses = asyncio.run(run())
+
+        mock_adapter.send.assert_not_awaited()
+        mock_adapter.send_many.assert_awaited_once_with(
+            [
+                ProtocolEngine.encode(KeyboardInput(keys=[KeyCode.KEY_A])),
+                ProtocolEngine.encode(KeyboardInput()),
+            ]
+        )
+        assert responses == [b"ack1", b"ack2"]
+
+    def test_raw_reports_match_protocol_packets(self) -> None:
+        """Test that the raw report methods send the protocol's packets."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        driver = AsyncCH9329Driver(mock_adapter)
+
+        asyncio.run(driver.send_keyboard_report(0x02, [0x04]))
+        mock_adapter.send.assert_awaited_with(
+            CH9329Protocol.build_keyboard_packet(0x02, [0x04])
+        )
+        asyncio.run(driver.send_mouse_report(0x04, 1, -1))
+        mock_adapter.send.assert_awaited_with(
+            CH9329Protocol.build_mouse_rel_packet(0x04, 1, -1, 0)
+        )
+
+    @pytest.mark.parametrize(("modifier", "hid_codes"), [(0x100, []), (0x00, [-1])])
+    def test_raw_keyboard_report_rejects_values_outside_a_byte(
+        self, modifier: int, hid_codes: list[int]
+    ) -> None:
+        """Test that keyboard report values outside a byte raise ValueError."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        driver = AsyncCH9329Driver(mock_adapter)
+
+        with pytest.raises(ValueError, match="out of range"):
+            asyncio.run(driver.send_keyboard_report(modifier, hid_codes))
+        mock_adapter.send.assert_not_awaited()
+
+    def test_raw_mouse_report_rejects_buttons_outside_a_byte(self) -> None:
+        """Test that a button byte outside a byte raises ValueError."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        driver = AsyncCH9329Driver(mock_adapter)
+
+        with pytest.raises(ValueError, match="out of range"):
+            asyncio.run(driver.send_mouse_report(0x100, 0, 0))
+        mock_adapter.send.assert_not_awaited()
+
+    def test_type_text_sends_compiled_text(self) -> None:
+        """Test that typed text is sent with one send_many() call."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        driver = AsyncCH9329Driver(mock_adapter)
+
+        asyncio.run(driver.type_text("Hey"))
+
+        mock_adapter.send_many.assert_awaited_once_with(list(compile_text("Hey")))
+
+    def test_get_info_reads_caps_lock(self) -> None:
+        """Test that get_info() decodes the Caps Lock LED."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        mock_adapter.send.return_value = CH9329Protocol.build_response_packet(
+            0x01, bytes([0x30, 0x01, 0x02, 0, 0, 0, 0, 0])
+        )
+        driver = AsyncCH9329Driver(mock_adapter)
+
+        assert asyncio.run(driver.get_info()).caps_lock
+        mock_adapter.send.assert_awaited_once_with(
+            CH9329Protocol.build_get_info_packet()
+        )
+
+    def test_type_text_checks_caps_lock(self) -> None:
+        """Test that type_text() compiles for the host's Caps Lock state."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        mock_adapter.send.return_value = CH9329Protocol.build_response_packet(
+            0x01, bytes([0x30, 0x01, 0x02, 0, 0, 0, 0, 0])
+        )
+        driver = AsyncCH9329Driver(mock_adapter)
+
+        asyncio.run(driver.type_text("Hi", check_caps_lock=True))
+
+        mock_adapter.send_many.assert_awaited_once_with(
+            list(compile_text("Hi", caps_lock=True))
+        )
+
+    def test_packet_cache_serves_repeated_inputs(self) -> None:
+        """Test that a configured cache supplies the packets."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        cache = PacketCache()
+        driver = AsyncCH9329Driver(mock_adapter, packet_cache=cache)
+
+        async def send_twice() -> None:
+            await driver.send_media_key_input(MediaKeyInput())
+            await driver.send_media_key_input(MediaKeyInput())
+
+        asyncio.run(send_twice())
+
+        mock_adapter.send.assert_awaited_with(ProtocolEngine.encode(MediaKeyInput()))
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+ERR_SUM = bytes([0x57, 0xAB, 0x00, 0xC2, 0x01, 0xE4, 0xA9])
+KEYBOARD_ACK = bytes([0x57, 0xAB, 0x00, 0x82, 0x01, 0x00, 0x85])
+MOUSE_ACK = bytes([0x57, 0xAB, 0x00, 0x85, 0x01, 0x00, 0x88])
+MOUSE_ERR_TIMEOUT = bytes([0x57, 0xAB, 0x00, 0xC5, 0x01, 0xE1, 0xA9])
+# Total X movement of three moves by 10
+MOVEMENT = 30
+
+
+class TestAsyncCH9329DriverCheckResponses:
+    """Tests for response checking and fast retries in the async driver."""
+
+    def test_error_response_is_retried(self) -> None:
+        """Test that a failed packet is resent immediately."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        mock_adapter.send.side_effect = [ERR_SUM, KEYBOARD_ACK]
+        driver = AsyncCH9329Driver(mock_adapter, check_responses=True, max_retries=1)
+
+        asyncio.run(driver.send_keyboard_input(KeyboardInput()))
+
+        packet = ProtocolEngine.encode_keyboard_input(KeyboardInput())
+        assert mock_adapter.send.await_args_list == [((packet,),), ((packet,),)]
+
+    def test_error_response_raises(self) -> None:
+        """Test that an error status raises DeviceStatusError."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        mock_adapter.send.return_value = ERR_SUM
+        driver = AsyncCH9329Driver(mock_adapter, check_responses=True)
+
+        with pytest.raises(DeviceStatusError):
+            asyncio.run(driver.send_keyboard_input(KeyboardInput()))
+
+    def test_send_batch_does_not_repeat_acknowledged_moves(self) -> None:
+        """Test that only the failed movement is resent, then the buttons."""
+        mock_adapter = AsyncMock(spec=AsyncCommunicationAdapter)
+        replies = [
+            [MOUSE_ERR_TIMEOUT, MOUSE_ACK, MOUSE_ACK],
+            [MOUSE_ACK, MOUSE_ACK],
+        ]
+        mock_adapter.send_many.side_effect = [list(reply) for reply in replies]
+        driver = AsyncCH9329Driver(mock_adapter, check_responses=True, max_retries=1)
+
+        responses = asyncio.run(driver.send_batch([MouseInput(x=10)] * 3))
+
+        applied = [
+            packet
+            for call, answers in zip(
+                mock_adapter.send_many.await_args_list, replies, strict=True
+            )
+            for packet, answer in zip(call.args[0], answers, strict=True)
+            if answer == MOUSE_ACK
+        ]
+        # Byte 7 is the relative X movement
+        assert sum(packet[7] for packet in applied) == MOVEMENT
+        assert responses == [MOUSE_ACK] * 3
@@ -1,11 +1,75 @@
 """Tests for ch9329py package."""
 
 import re
+import subprocess
+import sys
+
+import pytest
 
 import ch9329py
+from ch9329py.models import KeyCode
+
+# Dependencies that the lightweight import paths must not load
+HEAVY_MODULES = frozenset({"asyncio", "evdev", "pydantic", "serial"})
 
 
 def test_version() -> None:
     """Test that the version is correctly set."""
     version_pattern = r"^\d+\.\d+\.\d+$"
     assert re.match(version_pattern, ch9329py.__version__) is not None
+
+
+def test_public_names_resolve_lazily() -> None:
+    """Test that every exported name is the object of its defining module."""
+    for name in ch9329py.__all__:
+        assert getattr(ch9329py, name) is not None
+    assert ch9329py.KeyCode is KeyCode
+    assert set(ch9329py.__all__) <= set(dir(ch9329py))
+
+
+def test_unknown_attribute_raises() -> None:
+    """Test that names outside the public API raise AttributeError."""
+    with pytest.raises(AttributeError, match="no_such_name"):
+        _ = ch9329py.no_such_name
+
+
+def _heavy_modules_loaded(statement: str) -> set[str]:
+    """Run an import statement in a fresh interpreter.
+
+    Args:
+        statement: Import statement to run.
+
+    Returns:
+        The heavy dependencies it loaded.
+    """
+    script = (
+        "import sys\n"
+        f"{statement}\n"
+        f"print(*(m for m in {sorted(HEAVY_MODULES)!r} if m in sys.modules))"
+    )
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    ).stdout.split()
+    return set(output)
+
+
+@pytest.mark.parametrize(
+    ("statement", "allowed"),
+    [
+        ("import ch9329py", set()),
+        ("from ch9329py.protocol import CH9329Protocol, PacketEncoder", set()),
+        ("from ch9329py.termios_adapter import TermiosAdapter", {"serial"}),
+    ],
+)
+def test_light_imports_skip_heavy_dependencies(
+    statement: str, allowed: set[str]
+) -> None:
+    """Test that the encoder and raw transport paths skip heavy imports."""
+    assert _heavy_modules_loaded(statement) <= allowed
+
+
+def test_full_import_loads_heavy_dependencies() -> None:
+    """Test that the check above would notice an eager import."""
+    loaded = _heavy_modules_loaded("from ch9329py import CH9329Driver")
+
+    assert "pydantic" in loaded
@@ -1,14 +1,24 @@
 """Tests for CH9329 main driver class."""
 
+import sys
 from unittest.mock import Mock
 
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+import pytest
+
 from ch9329py.adapter import CommunicationAdapter
 from ch9329py.driver import CH9329Driver
+from ch9329py.engine import InputData, PacketCache, ProtocolEngine
 from ch9329py.evdev_mapping import (
     evdev_to_usb_hid_keyboard,
     evdev_to_usb_hid_modifier,
     evdev_to_usb_hid_mouse,
 )
+from ch9329py.exceptions import CH9329PyError, DeviceStatusError
 from ch9329py.models import (
     KeyboardInput,
     KeyCode,
@@ -17,7 +27,10 @@ from ch9329py.models import (
     ModifierKey,
     MouseButton,
     MouseInput,
+    MouseState,
 )
+from ch9329py.protocol import CH9329Protocol, PacketData
+from ch9329py.text import KeyboardLayout, compile_text
 
 # Protocol constants
 PACKET_HEADER = b"\x57\xab"
@@ -494,3 +507,602 @@ class TestCH9329DriverSendMediaKeyInput:
         expected_data = MediaKey.KEY_PREVIOUSSONG.value
         assert packet[MEDIA_DATA0_OFFSET] == expected_data[0]
         assert packet[MEDIA_DATA1_OFFSET] == expected_data[1]
+
+
+class TestCH9329DriverUsesEngine:
+    """Tests that the driver sends packets encoded by ProtocolEngine."""
+
+    def test_sent_packets_match_engine_encoding(self) -> None:
+        """Test that send_* transmits exactly what ProtocolEngine encodes."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+        keyboard = KeyboardInput(keys=[KeyCode.KEY_A])
+        mouse = MouseInput(x=3, y=-3)
+        media = MediaKeyInput(keys=[MediaKey.KEY_MUTE])
+
+        driver.send_keyboard_input(keyboard)
+        driver.send_mouse_input(mouse)
+        driver.send_media_key_input(media)
+
+        sent = [call.args[0] for call in mock_adapter.send.call_args_list]
+        assert sent == [
+            ProtocolEngine.encode_keyboard_input(keyboard),
+            ProtocolEngine.encode_mouse_input(mouse),
+            ProtocolEngine.encode_media_key_input(media),
+        ]
+
+    def test_packets_are_encoded_in_place(self) -> None:
+        """Test that repeated sends hand the adapter the same reused buffer."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+
+        driver.send_keyboard_input(KeyboardInput(keys=[KeyCode.KEY_A]))
+        first = mock_adapter.send.call_args.args[0]
+        driver.send_keyboard_input(KeyboardInput())
+        second = mock_adapter.send.call_args.args[0]
+
+        assert isinstance(first, memoryview)
+        assert second is first
+        assert second == ProtocolEngine.encode_keyboard_input(KeyboardInput())
+
+    def test_packet_cache_serves_repeated_inputs(self) -> None:
+        """Test that a configured cache supplies the packets for send_* calls."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        cache = PacketCache()
+        driver = CH9329Driver(mock_adapter, packet_cache=cache)
+
+        driver.send_keyboard_input(KeyboardInput())
+        driver.send_keyboard_input(KeyboardInput())
+        driver.send_batch([KeyboardInput(), MouseInput()])
+
+        sent = [call.args[0] for call in mock_adapter.send.call_args_list]
+        assert sent == [ProtocolEngine.encode(KeyboardInput())] * 2
+        mock_adapter.send_many.assert_called_once_with(
+            [
+                ProtocolEngine.encode(KeyboardInput()),
+                ProtocolEngine.encode(MouseInput()),
+            ]
+        )
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    def test_accepts_input_states(self) -> None:
+        """Test that input states are sent like the equivalent models."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+        model = MouseInput(buttons={MouseButton.BTN_LEFT}, x=2)
+
+        driver.send_mouse_input(MouseState.from_input(model))
+
+        assert mock_adapter.send.call_args.args[0] == ProtocolEngine.encode(model)
+
+    def test_raw_reports_match_protocol_packets(self) -> None:
+        """Test that the raw report methods send the protocol's packets."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+
+        driver.send_keyboard_report(0x02, [0x04, 0x05])
+        keyboard = bytes(mock_adapter.send.call_args.args[0])
+        driver.send_mouse_report(0x01, -300, 5, wheel=-1)
+        mouse = bytes(mock_adapter.send.call_args.args[0])
+
+        assert keyboard == CH9329Protocol.build_keyboard_packet(0x02, [0x04, 0x05])
+        assert mouse == CH9329Protocol.build_mouse_rel_packet(0x01, -300, 5, -1)
+
+    def test_raw_keyboard_report_rejects_too_many_keys(self) -> None:
+        """Test that more than six keycodes raise ValueError."""
+        driver = CH9329Driver(Mock(spec=CommunicationAdapter))
+
+        with pytest.raises(ValueError, match="At most 6"):
+            driver.send_keyboard_report(0x00, [0x04] * 7)
+
+    @pytest.mark.parametrize(("modifier", "hid_codes"), [(0x100, []), (0x00, [-1])])
+    def test_raw_keyboard_report_rejects_values_outside_a_byte(
+        self, modifier: int, hid_codes: list[int]
+    ) -> None:
+        """Test that keyboard report values outside a byte raise ValueError."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+
+        with pytest.raises(ValueError, match="out of range"):
+            driver.send_keyboard_report(modifier, hid_codes)
+        mock_adapter.send.assert_not_called()
+
+    def test_raw_mouse_report_rejects_buttons_outside_a_byte(self) -> None:
+        """Test that a button byte outside a byte raises ValueError."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+
+        with pytest.raises(ValueError, match="out of range"):
+            driver.send_mouse_report(0x100, 0, 0)
+        mock_adapter.send.assert_not_called()
+
+
+class TestCH9329DriverSendBatch:
+    """Tests for send_batch()."""
+
+    def test_send_batch_uses_send_many(self) -> None:
+        """Test that all inputs are encoded and passed to send_many() at once."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send_many.return_value = [b"ack1", b"ack2", b"ack3"]
+        driver = CH9329Driver(mock_adapter)
+        inputs: list[InputData] = [
+            KeyboardInput(keys=[KeyCode.KEY_H]),
+            MouseInput(x=1),
+            MediaKeyInput(),
+        ]
+
+        responses = driver.send_batch(inputs)
+
+        mock_adapter.send_many.assert_called_once_with(
+            [ProtocolEngine.encode(input_data) for input_data in inputs]
+        )
+        mock_adapter.send.assert_not_called()
+        assert responses == [b"ack1", b"ack2", b"ack3"]
+
+
+class TestCH9329DriverTypeText:
+    """Tests for type_text()."""
+
+    def test_sends_compiled_text_at_once(self) -> None:
+        """Test that the compiled packets are passed to send_many()."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+
+        driver.type_text("a_b", layout=KeyboardLayout.JIS)
+
+        mock_adapter.send_many.assert_called_once_with(
+            compile_text("a_b", KeyboardLayout.JIS)
+        )
+
+    def test_inside_batch_is_buffered(self) -> None:
+        """Test that typed text joins the surrounding batch."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+
+        with driver.batch() as batch:
+            assert driver.type_text("hi") == []
+
+        assert len(batch) == len(compile_text("hi"))
+        mock_adapter.send_many.assert_called_once()
+
+    def test_check_caps_lock_reads_led_state(self) -> None:
+        """Test that the Caps Lock state from get_info() shapes the text."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send.return_value = CH9329Protocol.build_response_packet(
+            0x01, bytes([0x30, 0x01, 0x02, 0, 0, 0, 0, 0])
+        )
+        driver = CH9329Driver(mock_adapter)
+
+        driver.type_text("Hi", check_caps_lock=True)
+
+        mock_adapter.send.assert_called_once_with(
+            CH9329Protocol.build_get_info_packet()
+        )
+        mock_adapter.send_many.assert_called_once_with(
+            compile_text("Hi", caps_lock=True)
+        )
+
+
+class TestCH9329DriverBatchContext:
+    """Tests for the batch() context manager."""
+
+    def test_inputs_are_flushed_in_one_call(self) -> None:
+        """Test that inputs inside the block are sent with one send_many()."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send_many.return_value = [b"ack1", b"ack2", b"ack3"]
+        driver = CH9329Driver(mock_adapter)
+        press = KeyboardInput(
+            modifiers={ModifierKey.KEY_LEFTCTRL}, keys=[KeyCode.KEY_C]
+        )
+
+        with driver.batch() as batch:
+            driver.send_keyboard_input(press)
+            driver.send_mouse_input(MouseInput(x=1))
+            driver.send_keyboard_input(KeyboardInput())
+            mock_adapter.send_many.assert_not_called()
+
+        mock_adapter.send.assert_not_called()
+        mock_adapter.send_many.assert_called_once_with(
+            [
+                ProtocolEngine.encode(press),
+                ProtocolEngine.encode(MouseInput(x=1)),
+                ProtocolEngine.encode(KeyboardInput()),
+            ]
+        )
+        assert batch.responses == [b"ack1", b"ack2", b"ack3"]
+        assert len(batch) == len(batch.responses)
+
+    def test_send_batch_inside_block_is_buffered(self) -> None:
+        """Test that send_batch() joins the surrounding batch."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+
+        with driver.batch() as batch:
+            assert driver.send_batch([KeyboardInput(), MouseInput()]) == []
+            driver.send_media_key_input(MediaKeyInput())
+
+        expected_packets = 3
+        assert len(batch) == expected_packets
+        mock_adapter.send_many.assert_called_once()
+
+    def test_nested_batches_join_outer(self) -> None:
+        """Test that nested blocks flush once with the outermost one."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+
+        with driver.batch() as outer:
+            driver.send_keyboard_input(KeyboardInput())
+            with driver.batch() as inner:
+                driver.send_keyboard_input(KeyboardInput())
+            mock_adapter.send_many.assert_not_called()
+
+        assert inner is outer
+        mock_adapter.send_many.assert_called_once()
+
+    def test_exception_discards_batch(self) -> None:
+        """Test that nothing is sent if the block raises."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+
+        def send_then_fail() -> None:
+            with driver.batch():
+                driver.send_keyboard_input(KeyboardInput())
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            send_then_fail()
+
+        mock_adapter.send_many.assert_not_called()
+        driver.send_keyboard_input(KeyboardInput())
+        mock_adapter.send.assert_called_once()
+
+    def test_empty_batch_sends_nothing(self) -> None:
+        """Test that an empty block does not touch the adapter."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        driver = CH9329Driver(mock_adapter)
+
+        with driver.batch() as batch:
+            pass
+
+        mock_adapter.send_many.assert_not_called()
+        assert batch.responses == []
+
+
+CMD_GET_PARA_CFG = 0x08
+CMD_SET_PARA_CFG = 0x09
+CMD_RESET = 0x0F
+FAST_BAUDRATE = 115200
+SLOW_BAUDRATE = 9600
+
+
+def _response(command: int, data: bytes) -> bytes:
+    """Build a response frame the way the device would."""
+    return CH9329Protocol._build_packet(command | 0x80, list(data))  # noqa: SLF001
+
+
+class _FakeChip:
+    """Answer parameter configuration commands like a CH9329 chip.
+
+    The chip only answers while the adapter's baud rate matches the baud rate
+    it is running at, and applies a stored configuration on reset.
+    """
+
+    def __init__(self, adapter: Mock, *, apply_on_reset: bool = True) -> None:
+        self.stored = bytes([0x00, 0x00, 0x00]) + (9600).to_bytes(4, "big") + bytes(43)
+        self.running_baudrate = 9600
+        self.adapter_baudrate = 9600
+        self.apply_on_reset = apply_on_reset
+        adapter.send.side_effect = self.send
+        adapter.set_baudrate.side_effect = self.set_baudrate
+
+    def set_baudrate(self, baudrate: int) -> None:
+        self.adapter_baudrate = baudrate
+
+    def send(self, packet: bytes) -> bytes:
+        if self.adapter_baudrate != self.running_baudrate:
+            return b""
+        command = packet[3]
+        if command == CMD_GET_PARA_CFG:
+            return _response(command, self.stored)
+        if command == CMD_SET_PARA_CFG:
+            self.stored = packet[5:-1]
+        elif command == CMD_RESET and self.apply_on_reset:
+            self.running_baudrate = int.from_bytes(self.stored[3:7], "big")
+        return _response(command, b"\x00")
+
+
+class _FixedRateAdapter(CommunicationAdapter):
+    """Talk to a fake chip through an adapter that cannot change its baud rate."""
+
+    def __init__(self, chip: _FakeChip) -> None:
+        self.chip = chip
+
+    def send(self, data: PacketData) -> bytes:
+        return self.chip.send(bytes(data))
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
+
+
+class TestCH9329DriverParameterConfig:
+    """Tests for parameter configuration commands and baud-rate changes."""
+
+    def test_get_parameter_config(self) -> None:
+        """Test that the configuration is parsed from the response."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        _FakeChip(mock_adapter)
+        driver = CH9329Driver(mock_adapter)
+
+        config = driver.get_parameter_config()
+
+        assert config.baudrate == SLOW_BAUDRATE
+        mock_adapter.send.assert_called_once_with(
+            CH9329Protocol.build_get_parameter_config_packet()
+        )
+
+    def test_get_parameter_config_raises_on_no_response(self) -> None:
+        """Test that a missing response raises CH9329PyError."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send.return_value = b""
+        driver = CH9329Driver(mock_adapter)
+
+        with pytest.raises(CH9329PyError, match="0x08"):
+            driver.get_parameter_config()
+
+    def test_get_info(self) -> None:
+        """Test that the chip info is decoded from the response."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send.return_value = CH9329Protocol.build_response_packet(
+            0x01, bytes([0x30, 0x01, 0x01, 0, 0, 0, 0, 0])
+        )
+        driver = CH9329Driver(mock_adapter)
+
+        info = driver.get_info()
+
+        assert (info.usb_connected, info.num_lock, info.caps_lock) == (
+            True,
+            True,
+            False,
+        )
+        mock_adapter.send.assert_called_once_with(
+            CH9329Protocol.build_get_info_packet()
+        )
+
+    def test_get_info_raises_on_short_data(self) -> None:
+        """Test that a response with the wrong length raises CH9329PyError."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send.return_value = CH9329Protocol.build_response_packet(
+            0x01, bytes(3)
+        )
+        driver = CH9329Driver(mock_adapter)
+
+        with pytest.raises(CH9329PyError, match="Invalid chip info"):
+            driver.get_info()
+
+    def test_error_response_raises(self) -> None:
+        """Test that an error response (cmd | 0xC0) raises CH9329PyError."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send.return_value = CH9329Protocol._build_packet(  # noqa: SLF001
+            CMD_RESET | 0xC0, [0xE5]
+        )
+        driver = CH9329Driver(mock_adapter)
+
+        with pytest.raises(CH9329PyError):
+            driver.reset()
+
+    def test_commands_bypass_batch(self) -> None:
+        """Test that commands are sent immediately inside a batch."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        _FakeChip(mock_adapter)
+        driver = CH9329Driver(mock_adapter)
+
+        with driver.batch() as batch:
+            driver.get_parameter_config()
+
+        assert len(batch) == 0
+        mock_adapter.send.assert_called_once()
+
+    def test_change_baudrate(self) -> None:
+        """Test that the chip and adapter are moved to the new baud rate."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        chip = _FakeChip(mock_adapter)
+        driver = CH9329Driver(mock_adapter)
+
+        driver.change_baudrate(FAST_BAUDRATE, settle_time=0)
+
+        assert chip.running_baudrate == FAST_BAUDRATE
+        assert chip.adapter_baudrate == FAST_BAUDRATE
+
+    def test_change_baudrate_to_current_rate_does_nothing(self) -> None:
+        """Test that no configuration is written if the rate already matches."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        _FakeChip(mock_adapter)
+        driver = CH9329Driver(mock_adapter)
+
+        driver.change_baudrate(SLOW_BAUDRATE, settle_time=0)
+
+        mock_adapter.send.assert_called_once()
+        mock_adapter.set_baudrate.assert_not_called()
+
+    def test_change_baudrate_falls_back(self) -> None:
+        """Test that the old rate and configuration are restored on failure."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        chip = _FakeChip(mock_adapter, apply_on_reset=False)
+        driver = CH9329Driver(mock_adapter)
+
+        with pytest.raises(CH9329PyError, match="remains at 9600"):
+            driver.change_baudrate(FAST_BAUDRATE, attempts=2, settle_time=0)
+
+        assert chip.adapter_baudrate == SLOW_BAUDRATE
+        assert int.from_bytes(chip.stored[3:7], "big") == SLOW_BAUDRATE
+
+    def test_change_baudrate_reports_lost_device(self) -> None:
+        """Test the error when the device answers at neither rate."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        chip = _FakeChip(mock_adapter)
+        chip.apply_on_reset = False
+        driver = CH9329Driver(mock_adapter)
+        # The chip goes silent after the reset
+        mock_adapter.send.side_effect = [
+            _response(CMD_GET_PARA_CFG, chip.stored),
+            _response(CMD_SET_PARA_CFG, b"\x00"),
+            _response(CMD_RESET, b"\x00"),
+        ] + [b""] * 4
+
+        with pytest.raises(CH9329PyError, match="does not respond"):
+            driver.change_baudrate(FAST_BAUDRATE, attempts=2, settle_time=0)
+
+    def test_change_baudrate_needs_capable_adapter(self) -> None:
+        """Test that the chip is left alone if the adapter is stuck at one rate."""
+        chip = _FakeChip(Mock(spec=CommunicationAdapter))
+        stored = chip.stored
+        adapter = _FixedRateAdapter(chip)
+        driver = CH9329Driver(adapter)
+
+        assert not adapter.supports_set_baudrate
+        with pytest.raises(NotImplementedError, match="_FixedRateAdapter"):
+            driver.change_baudrate(FAST_BAUDRATE, settle_time=0)
+
+        assert chip.stored == stored
+        assert chip.running_baudrate == SLOW_BAUDRATE
+
+    def test_change_baudrate_rejects_non_positive(self) -> None:
+        """Test that a non-positive baud rate raises ValueError."""
+        driver = CH9329Driver(Mock(spec=CommunicationAdapter))
+
+        with pytest.raises(ValueError, match="positive"):
+            driver.change_baudrate(0)
+
+
+ERR_SUM = CH9329Protocol._build_packet(0xC2, [0xE4])  # noqa: SLF001
+KEYBOARD_ACK = _response(0x02, b"\x00")
+MAX_RETRIES = 2
+MOUSE_ACK = _response(0x05, b"\x00")
+MOUSE_ERR_TIMEOUT = CH9329Protocol._build_packet(0xC5, [0xE1])  # noqa: SLF001
+# Total X movement of three moves by 10
+MOVEMENT = 30
+
+
+class TestCH9329DriverCheckResponses:
+    """Tests for response checking and fast retries."""
+
+    def test_responses_ignored_by_default(self) -> None:
+        """Test that error responses are ignored unless checking is enabled."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send.return_value = ERR_SUM
+        driver = CH9329Driver(mock_adapter)
+
+        driver.send_keyboard_input(KeyboardInput())
+
+        mock_adapter.send.assert_called_once()
+
+    def test_error_response_raises(self) -> None:
+        """Test that an error status raises DeviceStatusError."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send.return_value = ERR_SUM
+        driver = CH9329Driver(mock_adapter, check_responses=True)
+
+        with pytest.raises(DeviceStatusError):
+            driver.send_keyboard_input(KeyboardInput())
+
+    def test_error_response_is_retried(self) -> None:
+        """Test that a failed packet is resent immediately."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send.side_effect = [ERR_SUM, KEYBOARD_ACK]
+        driver = CH9329Driver(mock_adapter, check_responses=True, max_retries=1)
+
+        driver.send_keyboard_input(KeyboardInput())
+
+        packet = ProtocolEngine.encode_keyboard_input(KeyboardInput())
+        assert mock_adapter.send.call_args_list == [((packet,),), ((packet,),)]
+
+    def test_retries_are_limited(self) -> None:
+        """Test that the error is raised once the retries are used up."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send.return_value = b""
+        driver = CH9329Driver(
+            mock_adapter, check_responses=True, max_retries=MAX_RETRIES
+        )
+
+        with pytest.raises(CH9329PyError, match="No response"):
+            driver.send_keyboard_input(KeyboardInput())
+
+        assert mock_adapter.send.call_count == MAX_RETRIES + 1
+
+    def test_send_batch_resends_from_first_failure(self) -> None:
+        """Test that a batch is resent in order from the failed packet."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send_many.side_effect = [
+            [KEYBOARD_ACK, ERR_SUM, KEYBOARD_ACK],
+            [KEYBOARD_ACK, KEYBOARD_ACK],
+        ]
+        driver = CH9329Driver(mock_adapter, check_responses=True, max_retries=1)
+        inputs: list[InputData] = [
+            KeyboardInput(keys=[KeyCode.KEY_A]),
+            KeyboardInput(keys=[KeyCode.KEY_B]),
+            KeyboardInput(),
+        ]
+
+        responses = driver.send_batch(inputs)
+
+        packets = [ProtocolEngine.encode(i) for i in inputs]
+        mock_adapter.send_many.assert_called_with(packets[1:])
+        assert responses == [KEYBOARD_ACK] * 3
+
+    def test_send_batch_does_not_repeat_acknowledged_moves(self) -> None:
+        """Test that only the failed movement is resent, then the buttons."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        replies = [
+            [MOUSE_ACK, MOUSE_ERR_TIMEOUT, MOUSE_ACK],
+            [MOUSE_ACK, MOUSE_ACK],
+        ]
+        mock_adapter.send_many.side_effect = [list(reply) for reply in replies]
+        driver = CH9329Driver(mock_adapter, check_responses=True, max_retries=1)
+        inputs: list[InputData] = [MouseInput(x=10)] * 3
+
+        responses = driver.send_batch(inputs)
+
+        applied = [
+            packet
+            for call, answers in zip(
+                mock_adapter.send_many.call_args_list, replies, strict=True
+            )
+            for packet, answer in zip(call.args[0], answers, strict=True)
+            if answer == MOUSE_ACK
+        ]
+        # Byte 7 is the relative X movement
+        assert sum(packet[7] for packet in applied) == MOVEMENT
+        assert responses == [MOUSE_ACK] * 3
+
+    def test_send_batch_does_not_repeat_unanswered_keys(self) -> None:
+        """Test that a press without response is not resent after its release."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send_many.return_value = [b"", KEYBOARD_ACK]
+        driver = CH9329Driver(mock_adapter, check_responses=True, max_retries=1)
+
+        with pytest.raises(CH9329PyError, match="No response"):
+            driver.send_batch([KeyboardInput(keys=[KeyCode.KEY_A]), KeyboardInput()])
+
+        mock_adapter.send_many.assert_called_once()
+
+    def test_relative_move_without_response_is_not_resent(self) -> None:
+        """Test that a movement that may have been applied is not repeated."""
+        mock_adapter = Mock(spec=CommunicationAdapter)
+        mock_adapter.send.return_value = b""
+        driver = CH9329Driver(mock_adapter, check_responses=True, max_retries=1)
+
+        with pytest.raises(CH9329PyError, match="No response"):
+            driver.send_mouse_input(MouseInput(x=10))
+
+        mock_adapter.send.assert_called_once()
+
+    def test_rejects_negative_retries(self) -> None:
+        """Test that a negative max_retries raises ValueError."""
+        with pytest.raises(ValueError, match="max_retries"):
+            CH9329Driver(Mock(spec=CommunicationAdapter), max_retries=-1)
@@ -0,0 +1,31 @@
+"""Tests for the vendored evdev event codes."""
+
+import subprocess
+import sys
+
+import pytest
+
+from ch9329py import ecodes
+
+
+def test_codes_match_evdev() -> None:
+    """Test that every vendored constant equals its evdev.ecodes value."""
+    evdev_ecodes = pytest.importorskip("evdev.ecodes")
+    vendored = {name: value for name, value in vars(ecodes).items() if name.isupper()}
+    expected = {
+        name: value
+        for name, value in vars(evdev_ecodes).items()
+        if name.startswith(("KEY_", "BTN_")) and isinstance(value, int)
+    }
+
+    assert vendored == expected
+
+
+def test_models_import_without_evdev() -> None:
+    """Test that the models and mapping tables do not load evdev."""
+    script = "import sys\nimport ch9329py.models\nprint('evdev' in sys.modules)"
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    ).stdout
+
+    assert output.strip() == "False"
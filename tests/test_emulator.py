@@ -0,0 +1,209 @@
+"""Tests for the pty-backed CH9329 emulator."""
+
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from ch9329py.adapter import SerialAdapter
+from ch9329py.driver import CH9329Driver
+from ch9329py.emulator import (
+    CH9329Emulator,
+    KeyboardReport,
+    KeyPress,
+    MediaReport,
+    MouseReport,
+    key_presses,
+)
+from ch9329py.exceptions import DeviceStatusError
+from ch9329py.models import (
+    KeyboardInput,
+    KeyCode,
+    MediaKey,
+    MediaKeyInput,
+    ModifierKey,
+    MouseButton,
+    MouseInput,
+)
+from ch9329py.protocol import CH9329Protocol, ResponseStatus
+from tests.pty_device import KEYBOARD_RELEASE, ack, requires_pty
+
+FAST_BAUDRATE = 115200
+CAPS_LOCK = 0x39
+# Upper case text that needs fewer reports with Caps Lock on
+QUERY = "SELECT 1, 2, 3 FROM T1;"
+SLOW_BAUDRATE = 9600
+# Total X movement of three moves by 10
+MOVEMENT = 30
+
+pytestmark = requires_pty
+
+
+@pytest.fixture
+def emulator() -> Iterator[CH9329Emulator]:
+    """Provide an emulator at a fast baud rate without processing latency."""
+    with CH9329Emulator(baudrate=FAST_BAUDRATE, processing_latency=0.0) as device:
+        yield device
+
+
+@pytest.fixture
+def driver(emulator: CH9329Emulator) -> Iterator[CH9329Driver]:
+    """Provide a response-checking driver connected to the emulator."""
+    adapter = SerialAdapter(emulator.port, FAST_BAUDRATE, event_driven=True)
+    with CH9329Driver(adapter, check_responses=True) as device_driver:
+        yield device_driver
+
+
+class TestCH9329Emulator:
+    """Tests for CH9329Emulator."""
+
+    def test_acknowledges_and_logs_keyboard_report(
+        self, emulator: CH9329Emulator, driver: CH9329Driver
+    ) -> None:
+        """Test that keyboard reports are acknowledged and decoded."""
+        driver.send_keyboard_input(
+            KeyboardInput(modifiers={ModifierKey.KEY_LEFTSHIFT}, keys=[KeyCode.KEY_A])
+        )
+
+        assert [logged.report for logged in emulator.reports] == [
+            KeyboardReport(modifier=0x02, keycodes=(0x04,))
+        ]
+
+    def test_typed_text_reaches_host_in_order(
+        self, emulator: CH9329Emulator, driver: CH9329Driver
+    ) -> None:
+        """Test that type_text() presses every key once, in order."""
+        driver.type_text("Add")
+
+        assert key_presses(logged.report for logged in emulator.reports) == [
+            KeyPress(0x02, 0x04),
+            KeyPress(0x00, 0x07),
+            KeyPress(0x00, 0x07),
+        ]
+
+    def test_rollover_text_reaches_host_in_order(
+        self, emulator: CH9329Emulator, driver: CH9329Driver
+    ) -> None:
+        """Test that keys pressed in one report arrive in array order."""
+        driver.type_text("abc", rollover=True)
+
+        assert len(emulator.reports) == len(["abc", "release"])
+        assert key_presses(logged.report for logged in emulator.reports) == [
+            KeyPress(0x00, 0x04),
+            KeyPress(0x00, 0x05),
+            KeyPress(0x00, 0x06),
+        ]
+
+    def test_caps_lock_aware_text_restores_caps_lock(
+        self, emulator: CH9329Emulator, driver: CH9329Driver
+    ) -> None:
+        """Test that Caps Lock is toggled for upper case text and back."""
+        driver.type_text(QUERY, rollover=True, check_caps_lock=True)
+
+        presses = key_presses(logged.report for logged in emulator.reports)
+        assert presses[0] == presses[-1] == KeyPress(0x00, CAPS_LOCK)
+        assert not emulator.caps_lock
+        assert not driver.get_info().caps_lock
+
+    def test_info_reports_caps_lock(self) -> None:
+        """Test that the chip info carries the emulated Caps Lock LED."""
+        with (
+            CH9329Emulator(baudrate=FAST_BAUDRATE, caps_lock=True) as emulator,
+            SerialAdapter(emulator.port, FAST_BAUDRATE) as adapter,
+        ):
+            driver = CH9329Driver(adapter)
+            assert driver.get_info().caps_lock
+
+            driver.send_keyboard_report(0x00, [CAPS_LOCK])
+            driver.send_keyboard_report(0x00, [CAPS_LOCK])
+
+            assert not driver.get_info().caps_lock
+
+    def test_logs_mouse_and_media_reports(
+        self, emulator: CH9329Emulator, driver: CH9329Driver
+    ) -> None:
+        """Test that mouse and media reports are decoded."""
+        driver.send_mouse_input(
+            MouseInput(buttons={MouseButton.BTN_LEFT}, x=-5, y=7, scroll=-1)
+        )
+        driver.send_media_key_input(MediaKeyInput(keys=[MediaKey.KEY_MUTE]))
+
+        reports = [logged.report for logged in emulator.reports]
+        assert reports[0] == MouseReport(
+            buttons=0x01, x=-5, y=7, scroll=-1, absolute=False
+        )
+        assert isinstance(reports[1], MediaReport)
+
+    def test_answers_parameter_configuration(self, driver: CH9329Driver) -> None:
+        """Test that the parameter configuration can be read."""
+        assert driver.get_parameter_config().baudrate == FAST_BAUDRATE
+
+    def test_change_baudrate(self) -> None:
+        """Test that the baud rate change sequence takes effect on reset."""
+        with CH9329Emulator(baudrate=SLOW_BAUDRATE, processing_latency=0.0) as device:
+            adapter = SerialAdapter(device.port, SLOW_BAUDRATE, event_driven=True)
+            with CH9329Driver(adapter) as device_driver:
+                device_driver.change_baudrate(FAST_BAUDRATE, settle_time=0)
+
+            assert device.baudrate == FAST_BAUDRATE
+
+    def test_injected_failure_is_reported(
+        self, emulator: CH9329Emulator, driver: CH9329Driver
+    ) -> None:
+        """Test that fail_next() answers with an error status."""
+        emulator.fail_next(ResponseStatus.ERR_OPERATE)
+
+        with pytest.raises(DeviceStatusError) as exc_info:
+            driver.send_keyboard_input(KeyboardInput())
+
+        assert exc_info.value.status is ResponseStatus.ERR_OPERATE
+        assert emulator.reports == []
+
+    def test_retried_moves_are_applied_once(self, emulator: CH9329Emulator) -> None:
+        """Test that a failed move is retried without repeating the others."""
+        emulator.fail_next(ResponseStatus.ERR_TIMEOUT)
+        adapter = SerialAdapter(emulator.port, FAST_BAUDRATE, event_driven=True)
+        with CH9329Driver(adapter, check_responses=True, max_retries=1) as driver:
+            driver.send_batch([MouseInput(x=10)] * 3)
+
+        moves = [
+            logged.report
+            for logged in emulator.reports
+            if isinstance(logged.report, MouseReport)
+        ]
+        assert sum(report.x for report in moves) == MOVEMENT
+        assert moves[-1] == MouseReport(0, 0, 0, 0, absolute=False)
+
+    def test_bad_checksum_gets_error_response(self, emulator: CH9329Emulator) -> None:
+        """Test that a corrupted frame is answered with ERR_SUM."""
+        with SerialAdapter(emulator.port, FAST_BAUDRATE, event_driven=True) as adapter:
+            response = adapter.send(KEYBOARD_RELEASE[:-1] + b"\x00")
+
+        assert response == CH9329Protocol.build_status_packet(
+            0x02, ResponseStatus.ERR_SUM
+        )
+
+    def test_unknown_command_gets_error_response(
+        self, emulator: CH9329Emulator
+    ) -> None:
+        """Test that an unknown command is answered with ERR_CMD."""
+        packet = bytes([0x57, 0xAB, 0x00, 0x06, 0x00, 0x08])
+        with SerialAdapter(emulator.port, FAST_BAUDRATE, event_driven=True) as adapter:
+            response = adapter.send(packet)
+
+        assert response == CH9329Protocol.build_status_packet(
+            0x06, ResponseStatus.ERR_CMD
+        )
+
+    def test_models_wire_time(self) -> None:
+        """Test that responses are not faster than the emulated link."""
+        with CH9329Emulator(baudrate=SLOW_BAUDRATE, processing_latency=0.0) as device:
+            adapter = SerialAdapter(device.port, SLOW_BAUDRATE, event_driven=True)
+            with adapter:
+                started = time.perf_counter()
+                response = adapter.send(KEYBOARD_RELEASE)
+                elapsed = time.perf_counter() - started
+
+        assert response == ack(0x02)
+        # 21 bytes at 9600 baud take about 22 ms on the wire
+        assert elapsed >= (len(KEYBOARD_RELEASE) + len(ack(0x02))) * 10 / SLOW_BAUDRATE
@@ -0,0 +1,421 @@
+"""Tests for the sans-IO protocol engine."""
+
+import pytest
+
+from ch9329py.engine import (
+    InputData,
+    PacketCache,
+    ProtocolEngine,
+    ResponseReceived,
+    UnsolicitedFrame,
+)
+from ch9329py.evdev_mapping import evdev_to_usb_hid_keyboard
+from ch9329py.exceptions import (
+    InvalidResponseError,
+    ResponseError,
+    UnsupportedEvdevCodeError,
+)
+from ch9329py.models import (
+    KeyboardInput,
+    KeyboardState,
+    KeyCode,
+    MediaKey,
+    MediaKeyInput,
+    MediaKeyState,
+    ModifierKey,
+    MouseButton,
+    MouseInput,
+    MouseState,
+)
+from ch9329py.protocol import CH9329Protocol, PacketEncoder, ResponseStatus
+
+KEYBOARD_ACK = b"\x57\xab\x00\x82\x01\x00\x85"
+MOUSE_ACK = b"\x57\xab\x00\x85\x01\x00\x88"
+MOUSE_ERR_TIMEOUT = CH9329Protocol.build_status_packet(0x05, ResponseStatus.ERR_TIMEOUT)
+INFO_RESPONSE = b"\x57\xab\x00\x81\x08\x30\x01\x01\x00\x00\x00\x00\x00\xbd"
+
+
+class TestProtocolEngineEncode:
+    """Tests for encoding input models into packets."""
+
+    def test_encode_keyboard_input(self) -> None:
+        """Test that keyboard input maps modifiers and keys to HID codes."""
+        state = KeyboardInput(
+            modifiers={ModifierKey.KEY_LEFTCTRL, ModifierKey.KEY_LEFTSHIFT},
+            keys=[KeyCode.KEY_A, KeyCode.KEY_B],
+        )
+
+        packet = ProtocolEngine.encode_keyboard_input(state)
+
+        assert packet == CH9329Protocol.build_keyboard_packet(
+            0x03,
+            [
+                evdev_to_usb_hid_keyboard(KeyCode.KEY_A.value),
+                evdev_to_usb_hid_keyboard(KeyCode.KEY_B.value),
+            ],
+        )
+
+    def test_encode_mouse_input(self) -> None:
+        """Test that mouse input maps buttons and keeps movement."""
+        state = MouseInput(buttons={MouseButton.BTN_RIGHT}, x=-1, y=2, scroll=-3)
+
+        packet = ProtocolEngine.encode_mouse_input(state)
+
+        assert packet == CH9329Protocol.build_mouse_rel_packet(0x02, -1, 2, -3)
+
+    def test_encode_media_key_press_and_release(self) -> None:
+        """Test that media keys encode to press and release packets."""
+        press = ProtocolEngine.encode_media_key_input(
+            MediaKeyInput(keys=[MediaKey.KEY_MUTE])
+        )
+        release = ProtocolEngine.encode_media_key_input(MediaKeyInput())
+
+        assert press == CH9329Protocol.build_media_press_packet(0x02, 0x04, 0, 0)
+        assert release == CH9329Protocol.build_media_release_packet()
+
+    def test_encode_dispatches_on_input_type(self) -> None:
+        """Test that encode() picks the encoder matching the input type."""
+        keyboard = KeyboardInput(keys=[KeyCode.KEY_Z])
+        mouse = MouseInput(x=1)
+        media = MediaKeyInput()
+
+        assert ProtocolEngine.encode(keyboard) == (
+            ProtocolEngine.encode_keyboard_input(keyboard)
+        )
+        assert ProtocolEngine.encode(mouse) == ProtocolEngine.encode_mouse_input(mouse)
+        assert ProtocolEngine.encode(media) == (
+            ProtocolEngine.encode_media_key_input(media)
+        )
+
+    @pytest.mark.parametrize(
+        "input_data",
+        [
+            KeyboardInput(modifiers={ModifierKey.KEY_RIGHTALT}, keys=[KeyCode.KEY_Q]),
+            KeyboardInput(),
+            MouseInput(buttons={MouseButton.BTN_MIDDLE}, x=-7, y=3, scroll=-1),
+            MediaKeyInput(keys=[MediaKey.KEY_VOLUMEUP]),
+            MediaKeyInput(),
+        ],
+    )
+    def test_encode_into_matches_encode(
+        self, input_data: KeyboardInput | MouseInput | MediaKeyInput
+    ) -> None:
+        """Test that encode_into() writes the packet that encode() returns."""
+        packet = ProtocolEngine.encode_into(PacketEncoder(), input_data)
+
+        assert packet == ProtocolEngine.encode(input_data)
+
+    @pytest.mark.parametrize(
+        ("state", "model"),
+        [
+            (
+                KeyboardState(0x02, (0x04, 0x05)),
+                KeyboardInput(
+                    modifiers={ModifierKey.KEY_LEFTSHIFT},
+                    keys=[KeyCode.KEY_A, KeyCode.KEY_B],
+                ),
+            ),
+            (
+                MouseState(0x02, -4, 4, 1),
+                MouseInput(buttons={MouseButton.BTN_RIGHT}, x=-4, y=4, scroll=1),
+            ),
+            (MediaKeyState(), MediaKeyInput()),
+            (
+                MediaKeyState((0x02, 0x08, 0, 0)),
+                MediaKeyInput(keys=[MediaKey.KEY_PLAYPAUSE]),
+            ),
+        ],
+    )
+    def test_states_encode_like_models(
+        self, state: InputData, model: InputData
+    ) -> None:
+        """Test that input states encode to the same packets as the models."""
+        expected = ProtocolEngine.encode(model)
+
+        assert ProtocolEngine.encode(state) == expected
+        assert ProtocolEngine.encode_into(PacketEncoder(), state) == expected
+        assert PacketCache().encode(state) == expected
+
+    def test_encode_rejects_unsupported_code(self) -> None:
+        """Test that unsupported evdev codes raise UnsupportedEvdevCodeError."""
+        state = KeyboardInput.model_construct(
+            modifiers=set(), keys=[ModifierKey.KEY_LEFTCTRL]
+        )
+
+        with pytest.raises(UnsupportedEvdevCodeError):
+            ProtocolEngine.encode_keyboard_input(state)
+
+    def test_encode_rejects_unknown_type(self) -> None:
+        """Test that objects other than inputs raise TypeError."""
+        with pytest.raises(TypeError, match="str"):
+            ProtocolEngine.encode("a")  # type: ignore[arg-type]
+        with pytest.raises(TypeError, match="str"):
+            ProtocolEngine.encode_into(PacketEncoder(), "a")  # type: ignore[arg-type]
+
+
+class TestProtocolEngineRetransmission:
+    """Tests for planning the retransmission of failed packets."""
+
+    def test_only_failed_packets_are_resent(self) -> None:
+        """Test that acknowledged relative movements are not resent."""
+        packets = [ProtocolEngine.encode(MouseInput(x=10))] * 3
+
+        plan = ProtocolEngine.retransmission(
+            packets, [MOUSE_ACK, MOUSE_ERR_TIMEOUT, MOUSE_ACK]
+        )
+
+        assert plan.indices == [1]
+        assert plan.restore == [ProtocolEngine.encode(MouseInput())]
+
+    def test_last_acknowledged_state_is_restored(self) -> None:
+        """Test that a resent keyboard state is followed by the current one."""
+        packets = [
+            ProtocolEngine.encode(KeyboardInput(keys=[KeyCode.KEY_A])),
+            ProtocolEngine.encode(KeyboardInput()),
+            ProtocolEngine.encode(MouseInput(x=1)),
+        ]
+        err_sum = CH9329Protocol.build_status_packet(0x02, ResponseStatus.ERR_SUM)
+
+        plan = ProtocolEngine.retransmission(
+            packets, [err_sum, KEYBOARD_ACK, MOUSE_ACK]
+        )
+
+        assert plan == ([0], [packets[1]])
+
+    def test_relative_move_without_status_is_not_resent(self) -> None:
+        """Test that a movement the device may have applied is raised."""
+        packets = [ProtocolEngine.encode(MouseInput(x=10))]
+
+        with pytest.raises(InvalidResponseError, match="No response"):
+            ProtocolEngine.retransmission(packets, [b""])
+
+    def test_unanswered_key_before_executed_release_is_not_resent(self) -> None:
+        """Test that a key press the chip may have executed is not repeated."""
+        packets = [
+            ProtocolEngine.encode(KeyboardInput(keys=[KeyCode.KEY_A])),
+            ProtocolEngine.encode(KeyboardInput()),
+        ]
+
+        with pytest.raises(InvalidResponseError, match="No response"):
+            ProtocolEngine.retransmission(packets, [b"", KEYBOARD_ACK])
+
+    def test_unanswered_last_key_is_resent(self) -> None:
+        """Test that resending the latest keyboard state cannot repeat a press."""
+        packets = [
+            ProtocolEngine.encode(KeyboardInput(keys=[KeyCode.KEY_A])),
+            ProtocolEngine.encode(KeyboardInput()),
+        ]
+
+        plan = ProtocolEngine.retransmission(packets, [KEYBOARD_ACK, b""])
+
+        assert plan == ([1], [])
+
+    def test_absolute_position_before_relative_moves_is_not_resent(self) -> None:
+        """Test that resending a position cannot undo later movements."""
+        packets = [
+            CH9329Protocol.build_mouse_abs_packet(0x00, 100, 100),
+            ProtocolEngine.encode(MouseInput(x=10)),
+        ]
+        err_timeout = CH9329Protocol.build_status_packet(
+            0x04, ResponseStatus.ERR_TIMEOUT
+        )
+
+        with pytest.raises(ResponseError, match="ERR_TIMEOUT"):
+            ProtocolEngine.retransmission(packets, [err_timeout, MOUSE_ACK])
+
+
+class TestProtocolEngineStateMachine:
+    """Tests for queuing inputs and consuming responses."""
+
+    def test_data_to_send_concatenates_queued_packets(self) -> None:
+        """Test that queued inputs are drained as one buffer."""
+        engine = ProtocolEngine()
+        engine.send(KeyboardInput(keys=[KeyCode.KEY_A]))
+        engine.send(KeyboardInput())
+
+        data = engine.data_to_send()
+
+        assert data == (
+            ProtocolEngine.encode(KeyboardInput(keys=[KeyCode.KEY_A]))
+            + ProtocolEngine.encode(KeyboardInput())
+        )
+        assert engine.data_to_send() == b""
+
+    def test_responses_are_returned_in_order(self) -> None:
+        """Test that frames split across chunks are parsed in order."""
+        engine = ProtocolEngine()
+        engine.send(KeyboardInput())
+        engine.send(MouseInput())
+        stream = KEYBOARD_ACK + MOUSE_ACK
+
+        engine.receive_data(stream[:4])
+        assert engine.next_event() is None
+        engine.receive_data(stream[4:10])
+        first = engine.next_event()
+        engine.receive_data(stream[10:])
+        second = engine.next_event()
+
+        assert isinstance(first, ResponseReceived)
+        assert isinstance(second, ResponseReceived)
+        assert (first.frame.raw, second.frame.raw) == (KEYBOARD_ACK, MOUSE_ACK)
+        assert engine.next_event() is None
+        assert engine.outstanding == 0
+
+    def test_outstanding_tracks_unanswered_packets(self) -> None:
+        """Test that outstanding counts queued packets without responses."""
+        engine = ProtocolEngine()
+        engine.send(KeyboardInput())
+        engine.send_packet(CH9329Protocol.build_keyboard_release_packet())
+        expected_outstanding = 2
+        assert engine.outstanding == expected_outstanding
+
+        engine.receive_data(KEYBOARD_ACK)
+        engine.next_event()
+
+        assert engine.outstanding == 1
+
+    def test_error_response_answers_packet(self) -> None:
+        """Test that an error status frame answers the packet it belongs to."""
+        engine = ProtocolEngine()
+        engine.send(MouseInput())
+
+        engine.receive_data(MOUSE_ERR_TIMEOUT)
+
+        assert isinstance(engine.next_event(), ResponseReceived)
+        assert engine.outstanding == 0
+
+    def test_unsolicited_frame_is_not_counted(self) -> None:
+        """Test that a frame for another command leaves the packets alone."""
+        engine = ProtocolEngine()
+        engine.send(MouseInput())
+
+        engine.receive_data(KEYBOARD_ACK + INFO_RESPONSE)
+
+        assert isinstance(engine.next_event(), UnsolicitedFrame)
+        assert isinstance(engine.next_event(), UnsolicitedFrame)
+        assert engine.outstanding == 1
+
+    def test_unsolicited_frame_without_outstanding_packet(self) -> None:
+        """Test that frames arriving while nothing is queued are unsolicited."""
+        engine = ProtocolEngine()
+
+        engine.receive_data(KEYBOARD_ACK)
+
+        assert isinstance(engine.next_event(), UnsolicitedFrame)
+        assert engine.outstanding == 0
+
+    def test_next_response_skips_unsolicited_frames(self) -> None:
+        """Test that next_response returns only answers."""
+        engine = ProtocolEngine()
+        engine.send(MouseInput())
+
+        engine.receive_data(KEYBOARD_ACK + MOUSE_ACK)
+        frame = engine.next_response()
+
+        assert frame is not None
+        assert frame.raw == MOUSE_ACK
+        assert engine.next_response() is None
+
+    def test_expire_gives_up_on_oldest_packet(self) -> None:
+        """Test that expire drops the oldest packet and the partial frame."""
+        engine = ProtocolEngine()
+        engine.send(KeyboardInput())
+        engine.send(MouseInput())
+        engine.receive_data(KEYBOARD_ACK[:4])
+
+        assert engine.expire()
+        engine.receive_data(MOUSE_ACK)
+
+        event = engine.next_event()
+        assert isinstance(event, ResponseReceived)
+        assert event.frame.raw == MOUSE_ACK
+        assert not engine.expire()
+
+    def test_clear_forgets_everything(self) -> None:
+        """Test that clear drops queued bytes, packets and received bytes."""
+        engine = ProtocolEngine()
+        engine.send(KeyboardInput())
+        engine.receive_data(KEYBOARD_ACK[:4])
+
+        engine.clear()
+
+        assert engine.data_to_send() == b""
+        assert engine.outstanding == 0
+        assert engine.bytes_needed == len(KEYBOARD_ACK)
+
+
+class TestPacketCache:
+    """Tests for the LRU packet cache."""
+
+    def test_repeated_input_is_a_hit(self) -> None:
+        """Test that an equal input returns the cached packet."""
+        cache = PacketCache()
+        state = KeyboardInput(modifiers={ModifierKey.KEY_LEFTSHIFT})
+
+        first = cache.encode(state)
+        second = cache.encode(KeyboardInput(modifiers={ModifierKey.KEY_LEFTSHIFT}))
+
+        assert first == ProtocolEngine.encode(state)
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_order_is_part_of_the_key(self) -> None:
+        """Test that inputs with reordered keys get their own packets."""
+        cache = PacketCache()
+        forward = KeyboardInput(keys=[KeyCode.KEY_A, KeyCode.KEY_B])
+        backward = KeyboardInput(keys=[KeyCode.KEY_B, KeyCode.KEY_A])
+
+        assert cache.encode(forward) == ProtocolEngine.encode(forward)
+        assert cache.encode(backward) == ProtocolEngine.encode(backward)
+        assert cache.misses == len(cache)
+
+    def test_input_types_do_not_collide(self) -> None:
+        """Test that released keyboard, mouse and media inputs differ."""
+        cache = PacketCache()
+        inputs: list[InputData] = [KeyboardInput(), MouseInput(), MediaKeyInput()]
+
+        packets = [cache.encode(input_data) for input_data in inputs]
+
+        assert packets == [ProtocolEngine.encode(i) for i in inputs]
+        assert len(cache) == len(inputs)
+
+    def test_least_recently_used_packet_is_evicted(self) -> None:
+        """Test that the cache stays within maxsize."""
+        cache = PacketCache(maxsize=2)
+        release = KeyboardInput()
+        cache.encode(release)
+        cache.encode(MouseInput(x=1))
+        cache.encode(release)
+        cache.encode(MouseInput(x=2))
+
+        cache.encode(release)
+        cache.encode(MouseInput(x=1))
+
+        # The second move evicted the first, which then had to be encoded again
+        assert (cache.hits, cache.misses, len(cache)) == (2, 4, 2)
+
+    def test_clear_resets_counters(self) -> None:
+        """Test that clear() drops packets and statistics."""
+        cache = PacketCache()
+        cache.encode(KeyboardInput())
+        cache.encode(KeyboardInput())
+
+        cache.clear()
+
+        assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+    def test_unsupported_input_is_not_cached(self) -> None:
+        """Test that encoding errors propagate without caching anything."""
+        cache = PacketCache()
+        state = KeyboardInput.model_construct(
+            modifiers=set(), keys=[ModifierKey.KEY_LEFTCTRL]
+        )
+
+        with pytest.raises(UnsupportedEvdevCodeError):
+            cache.encode(state)
+        assert len(cache) == 0
+
+    def test_rejects_invalid_maxsize(self) -> None:
+        """Test that maxsize must be positive."""
+        with pytest.raises(ValueError, match="maxsize"):
+            PacketCache(maxsize=0)
@@ -0,0 +1,102 @@
+"""Tests for the evdev to USB HID lookup tables."""
+
+import pytest
+
+from ch9329py import ecodes
+from ch9329py.evdev_mapping import (
+    _EVDEV_TO_USB_HID_KEYBOARD,
+    _EVDEV_TO_USB_HID_MODIFIER,
+    _EVDEV_TO_USB_HID_MOUSE,
+    UNSUPPORTED,
+    evdev_to_usb_hid_keyboard,
+    evdev_to_usb_hid_keyboard_codes,
+    evdev_to_usb_hid_keyboard_report,
+    evdev_to_usb_hid_modifier,
+    evdev_to_usb_hid_modifier_bits,
+    evdev_to_usb_hid_mouse,
+    evdev_to_usb_hid_mouse_bits,
+    evdev_to_usb_hid_mouse_buttons,
+)
+from ch9329py.exceptions import UnsupportedEvdevCodeError
+
+# Codes outside every table, including negative and multi-byte ones
+OUT_OF_RANGE_CODES = [-1, 999, ecodes.BTN_MOUSE + 256]
+LEFT_AND_MIDDLE_BUTTONS = 0x05
+
+
+class TestSingleLookups:
+    """Tests for the per-code conversion functions."""
+
+    def test_tables_match_dicts(self) -> None:
+        """Test that the compiled tables agree with the mapping dicts."""
+        assert {
+            code: evdev_to_usb_hid_keyboard(code) for code in _EVDEV_TO_USB_HID_KEYBOARD
+        } == _EVDEV_TO_USB_HID_KEYBOARD
+        assert {
+            code: evdev_to_usb_hid_modifier(code) for code in _EVDEV_TO_USB_HID_MODIFIER
+        } == _EVDEV_TO_USB_HID_MODIFIER
+        assert {
+            code: evdev_to_usb_hid_mouse(code) for code in _EVDEV_TO_USB_HID_MOUSE
+        } == _EVDEV_TO_USB_HID_MOUSE
+
+    @pytest.mark.parametrize("code", [ecodes.KEY_RESERVED, *OUT_OF_RANGE_CODES])
+    def test_unsupported_codes_raise(self, code: int) -> None:
+        """Test that unmapped codes raise instead of returning the sentinel."""
+        for convert in (
+            evdev_to_usb_hid_keyboard,
+            evdev_to_usb_hid_modifier,
+            evdev_to_usb_hid_mouse,
+        ):
+            with pytest.raises(UnsupportedEvdevCodeError):
+                convert(code)
+
+
+class TestBulkLookups:
+    """Tests for the functions that convert several codes at once."""
+
+    def test_keyboard_codes_keep_order(self) -> None:
+        """Test that scan codes are returned in the order of the keys."""
+        assert evdev_to_usb_hid_keyboard_codes(
+            [ecodes.KEY_B, ecodes.KEY_A, ecodes.KEY_ENTER]
+        ) == bytes([0x05, 0x04, 0x28])
+
+    def test_unsupported_codes_map_to_sentinel(self) -> None:
+        """Test that unmapped codes are flagged instead of raising."""
+        codes = [ecodes.KEY_A, ecodes.KEY_LEFTCTRL, *OUT_OF_RANGE_CODES]
+
+        assert evdev_to_usb_hid_keyboard_codes(codes) == bytes(
+            [0x04, UNSUPPORTED, UNSUPPORTED, UNSUPPORTED, UNSUPPORTED]
+        )
+        assert evdev_to_usb_hid_modifier_bits(codes) == bytes(
+            [UNSUPPORTED, 0x01, UNSUPPORTED, UNSUPPORTED, UNSUPPORTED]
+        )
+        assert evdev_to_usb_hid_mouse_bits([ecodes.BTN_RIGHT, *codes]) == bytes(
+            [0x02, *[UNSUPPORTED] * len(codes)]
+        )
+
+    def test_empty_inputs(self) -> None:
+        """Test that no codes convert to empty results."""
+        assert evdev_to_usb_hid_keyboard_codes([]) == b""
+        assert evdev_to_usb_hid_keyboard_report(set(), []) == (0, b"")
+        assert evdev_to_usb_hid_mouse_buttons(set()) == 0
+
+    def test_keyboard_report_combines_modifiers(self) -> None:
+        """Test that modifier bits are combined into one bitmask."""
+        assert evdev_to_usb_hid_keyboard_report(
+            {ecodes.KEY_LEFTSHIFT, ecodes.KEY_RIGHTALT},
+            [ecodes.KEY_Z],
+        ) == (0x42, b"\x1d")
+
+    def test_keyboard_report_raises_for_unsupported_key(self) -> None:
+        """Test that the report names the first unsupported code."""
+        with pytest.raises(UnsupportedEvdevCodeError) as excinfo:
+            evdev_to_usb_hid_keyboard_report(set(), [ecodes.KEY_A, 999, -1])
+
+        assert excinfo.value.code == OUT_OF_RANGE_CODES[1]
+
+    def test_mouse_buttons_raise_for_unsupported_button(self) -> None:
+        """Test that unsupported buttons raise UnsupportedEvdevCodeError."""
+        buttons = evdev_to_usb_hid_mouse_buttons({ecodes.BTN_LEFT, ecodes.BTN_MIDDLE})
+        assert buttons == LEFT_AND_MIDDLE_BUTTONS
+        with pytest.raises(UnsupportedEvdevCodeError):
+            evdev_to_usb_hid_mouse_buttons({ecodes.BTN_SIDE})
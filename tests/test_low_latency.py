@@ -0,0 +1,118 @@
+"""Tests for low-latency tty tuning."""
+
+import os
+import termios
+import tty
+from pathlib import Path
+
+import pytest
+
+from ch9329py import low_latency
+from ch9329py.adapter import SerialAdapter
+from ch9329py.low_latency import LowLatencyReport, enable_low_latency
+from ch9329py.termios_adapter import TermiosAdapter
+from tests.pty_device import KEYBOARD_RELEASE, StandInDevice, ack, requires_pty
+
+ACK_LENGTH = 7
+FAST_BAUDRATE = 115200
+SLOW_BAUDRATE = 9600
+
+pytestmark = requires_pty
+
+
+def _vmin(fd: int) -> int:
+    return int(termios.tcgetattr(fd)[6][termios.VMIN])
+
+
+class TestEnableLowLatency:
+    """Tests for enable_low_latency()."""
+
+    def test_pty_reports_only_read_threshold(self) -> None:
+        """Test that a pty accepts VMIN but not the serial-driver settings."""
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        try:
+            report = enable_low_latency(slave)
+            assert report == LowLatencyReport(
+                async_low_latency=False, read_threshold=True, latency_timer=False
+            )
+            assert report.any_applied
+            assert _vmin(slave) == ACK_LENGTH
+        finally:
+            os.close(slave)
+            os.close(master)
+
+    def test_non_tty_reports_nothing_applied(self, tmp_path: Path) -> None:
+        """Test that an unsupported descriptor degrades instead of raising."""
+        fd = os.open(tmp_path / "not-a-tty", os.O_RDWR | os.O_CREAT)
+        try:
+            report = enable_low_latency(fd)
+        finally:
+            os.close(fd)
+        assert not report.any_applied
+
+    def test_writes_latency_timer(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the latency timer of a USB-serial device is set to 1 ms."""
+        master, slave = os.openpty()
+        try:
+            timer = tmp_path / Path(os.ttyname(slave)).name / "latency_timer"
+            timer.parent.mkdir()
+            timer.write_text("16\n")
+            monkeypatch.setattr(low_latency, "_USB_SERIAL_SYSFS", tmp_path)
+            assert enable_low_latency(slave).latency_timer
+            assert timer.read_text() == "1\n"
+        finally:
+            os.close(slave)
+            os.close(master)
+
+
+class TestAdapterLowLatency:
+    """Tests for the adapters' enable_low_latency()."""
+
+    def test_serial_adapter_sends_after_enabling(self) -> None:
+        """Test that an event-driven SerialAdapter still exchanges frames."""
+        device = StandInDevice()
+        try:
+            with SerialAdapter(
+                device.port, FAST_BAUDRATE, event_driven=True
+            ) as adapter:
+                assert adapter.enable_low_latency().read_threshold
+                assert adapter.send(KEYBOARD_RELEASE) == ack(0x02)
+        finally:
+            device.close()
+
+    def test_serial_adapter_reapplies_after_baudrate_change(self) -> None:
+        """Test that set_baudrate() keeps the low-latency settings."""
+        device = StandInDevice()
+        try:
+            with SerialAdapter(device.port, SLOW_BAUDRATE) as adapter:
+                adapter.enable_low_latency()
+                adapter.set_baudrate(FAST_BAUDRATE)
+                assert _vmin(adapter._serial.fileno()) == ACK_LENGTH  # noqa: SLF001
+        finally:
+            device.close()
+
+    def test_termios_adapter_reapplies_after_baudrate_change(self) -> None:
+        """Test that TermiosAdapter keeps VMIN across set_baudrate()."""
+        device = StandInDevice()
+        try:
+            with TermiosAdapter(device.port, SLOW_BAUDRATE) as adapter:
+                adapter.enable_low_latency()
+                adapter.set_baudrate(FAST_BAUDRATE)
+                assert _vmin(adapter._fd) == ACK_LENGTH  # noqa: SLF001
+                assert adapter.send(KEYBOARD_RELEASE) == ack(0x02)
+        finally:
+            device.close()
+
+    def test_closed_termios_adapter_raises(self) -> None:
+        """Test that enabling on a closed port raises ConnectionError."""
+        device = StandInDevice()
+        try:
+            adapter = TermiosAdapter(device.port, FAST_BAUDRATE)
+            adapter.close()
+            with pytest.raises(ConnectionError, match="not open"):
+                adapter.enable_low_latency()
+        finally:
+            device.close()
@@ -1,17 +1,22 @@
 """Tests for CH9329 data models."""
 
 import pytest
-from evdev import ecodes
 from pydantic import ValidationError
 
+from ch9329py import ecodes
 from ch9329py.models import (
+    ChipInfo,
     KeyboardInput,
+    KeyboardState,
     KeyCode,
     MediaKey,
     MediaKeyInput,
+    MediaKeyState,
     ModifierKey,
     MouseButton,
     MouseInput,
+    MouseState,
+    ParameterConfig,
 )
 
 
@@ -410,3 +415,115 @@ class TestMediaKeyInput:
         """Test that providing more than one key raises validation error."""
         with pytest.raises(ValidationError):
             MediaKeyInput(keys=[MediaKey.KEY_MUTE, MediaKey.KEY_VOLUMEUP])
+
+
+WORK_MODE_KEYBOARD_ONLY = 0x80
+DEFAULT_BAUDRATE = 9600
+FAST_BAUDRATE = 115200
+DEFAULT_PACKET_INTERVAL = 3
+
+
+class TestInputStates:
+    """Tests for the lightweight input state types."""
+
+    def test_keyboard_state_round_trip(self) -> None:
+        """Test that KeyboardState converts losslessly to and from the model."""
+        model = KeyboardInput(
+            modifiers={ModifierKey.KEY_LEFTCTRL, ModifierKey.KEY_RIGHTALT},
+            keys=[KeyCode.KEY_B, KeyCode.KEY_A],
+        )
+
+        state = KeyboardState.from_input(model)
+
+        assert state == KeyboardState(modifiers=0x41, keys=(0x05, 0x04))
+        assert state.to_input() == model
+
+    def test_mouse_state_round_trip(self) -> None:
+        """Test that MouseState converts losslessly to and from the model."""
+        model = MouseInput(
+            buttons={MouseButton.BTN_LEFT, MouseButton.BTN_MIDDLE},
+            x=-128,
+            y=127,
+            scroll=-3,
+        )
+
+        state = MouseState.from_input(model)
+
+        assert state == MouseState(buttons=0x05, x=-128, y=127, scroll=-3)
+        assert state.to_input() == model
+
+    @pytest.mark.parametrize("keys", [[], [MediaKey.KEY_VOLUMEDOWN]])
+    def test_media_key_state_round_trip(self, keys: list[MediaKey]) -> None:
+        """Test that MediaKeyState converts losslessly to and from the model."""
+        model = MediaKeyInput(keys=keys)
+
+        assert MediaKeyState.from_input(model).to_input() == model
+
+    def test_states_are_hashable_and_immutable(self) -> None:
+        """Test that states can be used as dict keys and cannot be changed."""
+        state = KeyboardState(0x02, (0x04,))
+
+        assert {state: "shift+a"}[KeyboardState(0x02, (0x04,))] == "shift+a"
+        with pytest.raises(AttributeError):
+            state.modifiers = 0  # type: ignore[misc]
+        assert not hasattr(state, "__dict__")
+
+    def test_to_input_validates(self) -> None:
+        """Test that invalid trusted values are rejected at the boundary."""
+        with pytest.raises(ValueError, match="0xE8"):
+            KeyboardState(keys=(0xE8,)).to_input()
+        with pytest.raises(ValidationError):
+            MouseState(x=500).to_input()
+        with pytest.raises(ValueError, match="MediaKey"):
+            MediaKeyState((0x02, 0x03, 0x00, 0x00)).to_input()
+
+
+class TestParameterConfig:
+    """Tests for ParameterConfig model."""
+
+    CONFIG = bytes([0x80, 0x00, 0x00, 0x00, 0x00, 0x25, 0x80, 0x08, 0x00, 0x00, 0x03])
+    CONFIG += bytes(39)
+
+    def test_fields(self) -> None:
+        """Test that fields are decoded from the raw block."""
+        config = ParameterConfig(data=self.CONFIG)
+
+        assert config.work_mode == WORK_MODE_KEYBOARD_ONLY
+        assert config.serial_mode == 0x00
+        assert config.address == 0x00
+        assert config.baudrate == DEFAULT_BAUDRATE
+        assert config.packet_interval == DEFAULT_PACKET_INTERVAL
+
+    def test_with_baudrate_preserves_other_bytes(self) -> None:
+        """Test that only the baud rate bytes change."""
+        config = ParameterConfig(data=self.CONFIG).with_baudrate(FAST_BAUDRATE)
+
+        assert config.baudrate == FAST_BAUDRATE
+        assert config.data[:3] == self.CONFIG[:3]
+        assert config.data[7:] == self.CONFIG[7:]
+
+    def test_rejects_wrong_length(self) -> None:
+        """Test that data must be exactly 50 bytes."""
+        with pytest.raises(ValidationError):
+            ParameterConfig(data=bytes(49))
+
+
+class TestChipInfo:
+    """Tests for ChipInfo."""
+
+    def test_decodes_lock_leds(self) -> None:
+        """Test that each LED bit is decoded."""
+        info = ChipInfo.from_data(bytes([0x30, 0x01, 0x05, 0, 0, 0, 0, 0]))
+
+        assert info == ChipInfo(
+            version=0x30,
+            usb_connected=True,
+            num_lock=True,
+            caps_lock=False,
+            scroll_lock=True,
+        )
+
+    def test_rejects_wrong_length(self) -> None:
+        """Test that data must be exactly 8 bytes."""
+        with pytest.raises(ValueError, match="8 bytes, got 1"):
+            ChipInfo.from_data(b"\x00")
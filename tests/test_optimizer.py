@@ -0,0 +1,151 @@
+"""Tests for the input sequence optimizer."""
+
+import itertools
+
+import pytest
+
+from ch9329py.emulator import KeyboardReport, key_presses
+from ch9329py.engine import InputData
+from ch9329py.models import (
+    KeyboardInput,
+    KeyboardState,
+    KeyCode,
+    MediaKey,
+    MediaKeyInput,
+    ModifierKey,
+    MouseButton,
+    MouseInput,
+)
+from ch9329py.optimizer import optimize_inputs
+
+A = KeyboardInput(keys=[KeyCode.KEY_A])
+B = KeyboardInput(keys=[KeyCode.KEY_B])
+SHIFT_A = KeyboardInput(modifiers={ModifierKey.KEY_LEFTSHIFT}, keys=[KeyCode.KEY_A])
+SHIFT = KeyboardInput(modifiers={ModifierKey.KEY_LEFTSHIFT})
+RELEASE = KeyboardInput()
+CTRL = KeyboardInput(modifiers={ModifierKey.KEY_LEFTCTRL})
+CTRL_C = KeyboardInput(modifiers={ModifierKey.KEY_LEFTCTRL}, keys=[KeyCode.KEY_C])
+AB = KeyboardInput(keys=[KeyCode.KEY_A, KeyCode.KEY_B])
+CA = KeyboardInput(keys=[KeyCode.KEY_C, KeyCode.KEY_A])
+
+
+def _keyboard_events(inputs: list[InputData]) -> tuple[list[object], object]:
+    """Return the key presses and final state a host sees for the inputs.
+
+    Modifier presses are listed with the keys held when they go down, which
+    are the keys of the previous report because modifiers apply first.
+    """
+    states = [
+        KeyboardState.from_input(input_data)
+        for input_data in inputs
+        if isinstance(input_data, KeyboardInput)
+    ]
+    reports = [KeyboardReport(state.modifiers, state.keys) for state in states]
+    modifier_presses = [
+        (
+            previous.modifiers,
+            frozenset(previous.keys),
+            state.modifiers & ~previous.modifiers,
+        )
+        for previous, state in itertools.pairwise(states)
+        if state.modifiers & ~previous.modifiers
+    ]
+    return [*key_presses(reports), *modifier_presses], states[-1]
+
+
+class TestOptimizeInputs:
+    """Tests for optimize_inputs()."""
+
+    def test_release_between_different_keys_is_dropped(self) -> None:
+        """Test that typing "ab" with releases keeps only the final release."""
+        result = optimize_inputs([A, RELEASE, B, RELEASE])
+
+        assert result.inputs == [A, B, RELEASE]
+        assert result.frames_saved == 1
+
+    def test_release_before_same_key_is_kept(self) -> None:
+        """Test that a key is still released before it is pressed again."""
+        inputs = [A, RELEASE, A, RELEASE]
+
+        assert optimize_inputs(inputs) == (inputs, 0)
+
+    def test_released_modifier_pressed_again_is_kept(self) -> None:
+        """Test that a shift release between shifted keys stays observable."""
+        shift_b = KeyboardInput(
+            modifiers={ModifierKey.KEY_LEFTSHIFT}, keys=[KeyCode.KEY_B]
+        )
+        inputs = [SHIFT_A, RELEASE, shift_b, RELEASE]
+
+        assert optimize_inputs(inputs).frames_saved == 0
+
+    def test_modifier_tap_is_kept(self) -> None:
+        """Test that pressing only a modifier is not optimized away."""
+        inputs = [RELEASE, SHIFT, RELEASE]
+
+        assert optimize_inputs(inputs) == (inputs, 0)
+
+    @pytest.mark.parametrize(
+        "inputs",
+        [
+            [A, RELEASE, CTRL_C, RELEASE],
+            [AB, CA, RELEASE, CTRL],
+            [SHIFT, RELEASE, CTRL_C, RELEASE],
+        ],
+    )
+    def test_release_before_modifier_press_is_kept(
+        self, inputs: list[InputData]
+    ) -> None:
+        """Test that keys and modifiers are released before a modifier goes down."""
+        assert optimize_inputs(inputs) == (inputs, 0)
+
+    def test_repeated_states_are_dropped(self) -> None:
+        """Test that frames equal to the current state are dropped."""
+        result = optimize_inputs([A, A, RELEASE, RELEASE, RELEASE])
+
+        assert result.inputs == [A, RELEASE]
+        assert result.frames_saved == len([A, RELEASE, RELEASE])
+
+    def test_first_frame_of_each_device_is_kept(self) -> None:
+        """Test that the unknown initial host state is never assumed."""
+        inputs: list[InputData] = [RELEASE, MouseInput(), MediaKeyInput()]
+
+        assert optimize_inputs(inputs) == (inputs, 0)
+
+    def test_mouse_frames_without_effect_are_dropped(self) -> None:
+        """Test that mouse frames without motion or button change are dropped."""
+        press = MouseInput(buttons={MouseButton.BTN_LEFT})
+        drag = MouseInput(buttons={MouseButton.BTN_LEFT}, x=5)
+        inputs = [press, MouseInput(buttons={MouseButton.BTN_LEFT}), drag, drag]
+
+        assert optimize_inputs(inputs) == ([press, drag, drag], 1)
+
+    def test_media_release_without_press_is_dropped(self) -> None:
+        """Test that media releases only follow a press."""
+        mute = MediaKeyInput(keys=[MediaKey.KEY_MUTE])
+        inputs = [MediaKeyInput(), mute, MediaKeyInput(), MediaKeyInput()]
+
+        assert optimize_inputs(inputs) == (inputs[:3], 1)
+
+    def test_other_devices_keep_keyboard_frames_apart(self) -> None:
+        """Test that frames are only removed between adjacent keyboard frames."""
+        click = MouseInput(buttons={MouseButton.BTN_LEFT})
+        inputs: list[InputData] = [A, RELEASE, click, B, RELEASE]
+
+        assert optimize_inputs(inputs) == (inputs, 0)
+
+    @pytest.mark.parametrize(
+        "inputs",
+        [
+            [A, RELEASE, B, RELEASE, A, RELEASE, SHIFT_A, RELEASE],
+            [SHIFT_A, SHIFT, RELEASE, B, KeyboardInput(keys=[KeyCode.KEY_A]), B],
+            [SHIFT, SHIFT_A, SHIFT, B, RELEASE, SHIFT, RELEASE],
+            [A, RELEASE, CTRL_C, RELEASE, B, RELEASE],
+            [AB, CA, RELEASE, CTRL, RELEASE],
+        ],
+    )
+    def test_host_sees_the_same_presses(self, inputs: list[InputData]) -> None:
+        """Test that presses, their modifiers and the final state are kept."""
+        result = optimize_inputs(inputs)
+
+        assert _keyboard_events(result.inputs) == _keyboard_events(inputs)
+        assert len(result.inputs) + result.frames_saved == len(inputs)
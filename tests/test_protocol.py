@@ -1,6 +1,18 @@
 """Tests for CH9329 protocol packet building."""
 
-from ch9329py.protocol import CH9329Protocol
+from collections.abc import Callable
+
+import pytest
+
+from ch9329py.exceptions import DeviceStatusError, InvalidResponseError
+from ch9329py.protocol import (
+    CH9329Protocol,
+    FrameParser,
+    PacketEncoder,
+    ResponseStatus,
+)
+
+ACK = b"\x57\xab\x00\x82\x01\x00\x85"
 
 
 class TestKeyboardPackets:
@@ -395,3 +407,317 @@ class TestPacketValidation:
         assert (
             len(packet) == MEDIA_PACKET_LENGTH
         )  # Header(2) + Addr(1) + Cmd(1) + Len(1) + Data(4) + Checksum(1)
+
+
+class TestKeyboardReportPackets:
+    """Tests for building full six-key keyboard packets."""
+
+    def test_build_keyboard_packet_pads_unused_slots(self) -> None:
+        """Test that unused key slots are zero."""
+        packet = CH9329Protocol.build_keyboard_packet(0x02, [0x04, 0x05])
+
+        assert packet == bytes(
+            [0x57, 0xAB, 0x00, 0x02, 0x08, 0x02, 0x00, 0x04, 0x05] + [0x00] * 4 + [0x17]
+        )
+
+    def test_build_keyboard_packet_matches_press_packet(self) -> None:
+        """Test that a single key matches build_keyboard_press_packet()."""
+        assert CH9329Protocol.build_keyboard_packet(
+            0x02, [0x04]
+        ) == CH9329Protocol.build_keyboard_press_packet(0x02, 0x04)
+
+    def test_build_keyboard_packet_rejects_too_many_keys(self) -> None:
+        """Test that more than six keys raise ValueError."""
+        with pytest.raises(ValueError, match="At most 6"):
+            CH9329Protocol.build_keyboard_packet(0x00, [0x04] * 7)
+
+
+class TestPacketEncoder:
+    """Tests for in-place packet encoding."""
+
+    @pytest.mark.parametrize(
+        ("modifier", "keycodes"),
+        [(0x00, []), (0x02, [0x04]), (0xFF, [0xE7, 0x04, 0x05, 0x06, 0x07, 0x08])],
+    )
+    def test_keyboard_matches_builder(self, modifier: int, keycodes: list[int]) -> None:
+        """Test that keyboard() writes the same bytes as the builder."""
+        packet = PacketEncoder().keyboard(modifier, keycodes)
+
+        assert packet == CH9329Protocol.build_keyboard_packet(modifier, keycodes)
+
+    def test_keyboard_rejects_too_many_keys(self) -> None:
+        """Test that more than six keys raise ValueError."""
+        with pytest.raises(ValueError, match="At most 6"):
+            PacketEncoder().keyboard(0x00, [0x04] * 7)
+
+    @pytest.mark.parametrize(
+        ("x", "y", "scroll"),
+        [(0, 0, 0), (10, 20, 0), (-1, -128, -127), (500, -500, 300)],
+    )
+    def test_mouse_rel_matches_builder(self, x: int, y: int, scroll: int) -> None:
+        """Test that mouse_rel() clamps and encodes like the builder."""
+        packet = PacketEncoder().mouse_rel(0x05, x, y, scroll)
+
+        assert packet == CH9329Protocol.build_mouse_rel_packet(0x05, x, y, scroll)
+
+    @pytest.mark.parametrize(("x", "y"), [(0, 0), (4095, 256), (-5, 9999)])
+    def test_mouse_abs_matches_builder(self, x: int, y: int) -> None:
+        """Test that mouse_abs() clamps and encodes like the builder."""
+        packet = PacketEncoder().mouse_abs(0x01, x, y)
+
+        assert packet == CH9329Protocol.build_mouse_abs_packet(0x01, x, y)
+
+    def test_media_matches_builder(self) -> None:
+        """Test that media() writes the same bytes as the builder."""
+        packet = PacketEncoder().media(0x02, 0xE9, 0x00, 0x00)
+
+        assert packet == CH9329Protocol.build_media_press_packet(0x02, 0xE9, 0x00, 0x00)
+
+    @pytest.mark.parametrize(
+        ("encode", "build"),
+        [
+            (
+                lambda e: e.keyboard(0x00, [0x100]),
+                lambda: CH9329Protocol.build_keyboard_packet(0x00, [0x100]),
+            ),
+            (
+                lambda e: e.mouse_rel(-1, 0, 0, 0),
+                lambda: CH9329Protocol.build_mouse_rel_packet(-1, 0, 0, 0),
+            ),
+            (
+                lambda e: e.mouse_abs(0x100, 0, 0),
+                lambda: CH9329Protocol.build_mouse_abs_packet(0x100, 0, 0),
+            ),
+            (
+                lambda e: e.media(0x02, 0x100, 0x00, 0x00),
+                lambda: CH9329Protocol.build_media_press_packet(0x02, 0x100, 0, 0),
+            ),
+        ],
+    )
+    def test_out_of_range_values_raise_like_builder(
+        self,
+        encode: Callable[[PacketEncoder], object],
+        build: Callable[[], object],
+    ) -> None:
+        """Test that the encoder and the builders reject the same values."""
+        with pytest.raises(ValueError, match="out of range"):
+            encode(PacketEncoder())
+        with pytest.raises(ValueError, match="out of range"):
+            build()
+
+    def test_packets_are_written_in_place(self) -> None:
+        """Test that each packet type reuses its own slot in the buffer."""
+        encoder = PacketEncoder()
+        press = encoder.keyboard(0x00, [0x04])
+        move = encoder.mouse_rel(0x00, 1, 1, 0)
+        release = encoder.keyboard(0x00, [])
+
+        assert release is press
+        assert press == CH9329Protocol.build_keyboard_release_packet()
+        assert move == CH9329Protocol.build_mouse_rel_packet(0x00, 1, 1, 0)
+
+
+class TestFrameParser:
+    """Tests for parsing frames received from the device."""
+
+    def test_frame_length_of_ack(self) -> None:
+        """Test that frame_length() reads the length field."""
+        assert CH9329Protocol.frame_length(ACK[:5]) == len(ACK)
+
+    def test_frame_length_needs_header(self) -> None:
+        """Test that frame_length() rejects incomplete or foreign prefixes."""
+        assert CH9329Protocol.frame_length(ACK[:4]) is None
+        assert CH9329Protocol.frame_length(b"\x00\x01\x02\x03\x04") is None
+
+    def test_parses_frame_fed_in_chunks(self) -> None:
+        """Test that a frame split across feeds is returned once complete."""
+        parser = FrameParser()
+        parser.feed(ACK[:3])
+        assert parser.next_frame() is None
+        parser.feed(ACK[3:])
+
+        frame = parser.next_frame()
+
+        assert frame is not None
+        assert frame.address == 0x00
+        assert frame.command == ACK[3]
+        assert frame.data == b"\x00"
+        assert frame.raw == ACK
+
+    def test_parses_long_frame(self) -> None:
+        """Test that frames with a long data section are parsed whole."""
+        data = bytes(range(8))
+        frame_bytes = [0x57, 0xAB, 0x00, 0x81, len(data), *data]
+        raw = bytes([*frame_bytes, sum(frame_bytes) & 0xFF])
+        parser = FrameParser()
+        parser.feed(raw + ACK)
+
+        first = parser.next_frame()
+        second = parser.next_frame()
+
+        assert first is not None
+        assert first.data == data
+        assert second is not None
+        assert second.raw == ACK
+
+    def test_clear_discards_partial_frame(self) -> None:
+        """Test that clear() drops buffered bytes."""
+        parser = FrameParser()
+        parser.feed(ACK[:4])
+        parser.clear()
+        parser.feed(ACK)
+
+        frame = parser.next_frame()
+
+        assert frame is not None
+        assert frame.raw == ACK
+
+
+class TestFrameParserResync:
+    """Tests for resynchronizing after corrupted input."""
+
+    @staticmethod
+    def _frames(parser: FrameParser) -> list[bytes]:
+        frames = []
+        while (frame := parser.next_frame()) is not None:
+            frames.append(frame.raw)
+        return frames
+
+    def test_skips_leading_garbage(self) -> None:
+        """Test that bytes before a header are discarded."""
+        parser = FrameParser()
+        parser.feed(b"\x00\xff\x57" + ACK)
+
+        assert self._frames(parser) == [ACK]
+        assert parser.discarded == len(b"\x00\xff\x57")
+
+    def test_skips_frame_with_bad_checksum(self) -> None:
+        """Test that a corrupted frame does not hide the next one."""
+        corrupted = ACK[:-1] + b"\x00"
+        parser = FrameParser()
+        parser.feed(corrupted + ACK)
+
+        assert self._frames(parser) == [ACK]
+
+    def test_recovers_from_dropped_byte(self) -> None:
+        """Test that a truncated frame does not shift later frames."""
+        truncated = ACK[:3] + ACK[4:]
+        parser = FrameParser()
+        parser.feed(truncated + ACK + ACK)
+
+        assert self._frames(parser) == [ACK, ACK]
+
+    def test_recovers_from_extra_byte(self) -> None:
+        """Test that an inserted byte does not shift later frames."""
+        parser = FrameParser()
+        parser.feed(ACK[:5] + b"\x00" + ACK[5:] + ACK)
+
+        assert self._frames(parser) == [ACK]
+
+    def test_rejects_implausible_length(self) -> None:
+        """Test that a header with an oversized length does not stall parsing."""
+        parser = FrameParser()
+        parser.feed(b"\x57\xab\x00\x82\xff" + ACK)
+
+        assert self._frames(parser) == [ACK]
+
+    def test_rejects_non_response_command(self) -> None:
+        """Test that an echoed request packet is skipped."""
+        request = CH9329Protocol.build_keyboard_release_packet()
+        parser = FrameParser()
+        parser.feed(request + ACK)
+
+        assert self._frames(parser) == [ACK]
+
+    def test_keeps_header_split_across_chunks(self) -> None:
+        """Test that a trailing first header byte is kept for the next chunk."""
+        parser = FrameParser()
+        parser.feed(b"\x00" + ACK[:1])
+        assert parser.next_frame() is None
+        parser.feed(ACK[1:])
+
+        assert self._frames(parser) == [ACK]
+
+    def test_bytes_needed(self) -> None:
+        """Test that bytes_needed never reads past the end of a frame."""
+        parser = FrameParser()
+        assert parser.bytes_needed == len(ACK)
+        parser.feed(ACK[:5])
+        assert parser.bytes_needed == len(ACK) - 5
+        parser.feed(ACK[5:])
+        assert parser.bytes_needed == 1
+
+
+class TestConfigurationPackets:
+    """Tests for parameter configuration and reset packets."""
+
+    def test_build_get_parameter_config_packet(self) -> None:
+        """Test the get parameter configuration packet."""
+        assert CH9329Protocol.build_get_parameter_config_packet() == bytes(
+            [0x57, 0xAB, 0x00, 0x08, 0x00, 0x0A]
+        )
+
+    def test_build_set_parameter_config_packet(self) -> None:
+        """Test that the configuration block is sent as payload."""
+        packet = CH9329Protocol.build_set_parameter_config_packet(bytes(50))
+
+        assert packet[:5] == bytes([0x57, 0xAB, 0x00, 0x09, 0x32])
+        assert packet[5:-1] == bytes(50)
+        assert packet[-1] == (0x57 + 0xAB + 0x09 + 0x32) & 0xFF
+
+    def test_build_reset_packet(self) -> None:
+        """Test the software reset packet."""
+        assert CH9329Protocol.build_reset_packet() == bytes(
+            [0x57, 0xAB, 0x00, 0x0F, 0x00, 0x11]
+        )
+
+
+CMD_KEYBOARD = 0x02
+
+
+class TestDecodeResponse:
+    """Tests for validating responses from the device."""
+
+    def test_success_ack(self) -> None:
+        """Test that a success acknowledgement is accepted."""
+        frame = CH9329Protocol.decode_response(ACK, CMD_KEYBOARD)
+
+        assert frame.status is ResponseStatus.SUCCESS
+        assert frame.raw == ACK
+
+    def test_response_with_data_is_success(self) -> None:
+        """Test that a data response without a status byte is a success."""
+        response = CH9329Protocol._build_packet(0x88, [0x00] * 50)  # noqa: SLF001
+
+        frame = CH9329Protocol.decode_response(response, 0x08)
+
+        assert frame.status is ResponseStatus.SUCCESS
+        assert frame.data == bytes(50)
+
+    @pytest.mark.parametrize("status", list(ResponseStatus)[1:])
+    def test_error_status_raises(self, status: ResponseStatus) -> None:
+        """Test that an error response raises DeviceStatusError."""
+        response = CH9329Protocol._build_packet(0xC2, [status.value])  # noqa: SLF001
+
+        with pytest.raises(DeviceStatusError) as exc_info:
+            CH9329Protocol.decode_response(response, CMD_KEYBOARD)
+
+        assert exc_info.value.status is status
+        assert exc_info.value.command == CMD_KEYBOARD
+        assert exc_info.value.response == response
+
+    @pytest.mark.parametrize(
+        ("response", "match"),
+        [
+            (b"", "No response"),
+            (b"\x57\xac\x00\x82\x01\x00\x86", "header"),
+            (b"\x57\xab\x00\x82\x01\x00", "length"),
+            (b"\x57\xab\x00\x82\x01\x00\x86", "checksum"),
+            (b"\x57\xab\x00\x83\x01\x00\x86", "Unexpected response command"),
+            (b"\x57\xab\x00\x82\x01\x42\xc7", "Unknown response status"),
+        ],
+    )
+    def test_malformed_response_raises(self, response: bytes, match: str) -> None:
+        """Test that malformed responses raise InvalidResponseError."""
+        with pytest.raises(InvalidResponseError, match=match):
+            CH9329Protocol.decode_response(response, CMD_KEYBOARD)
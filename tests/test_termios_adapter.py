@@ -0,0 +1,119 @@
+"""Tests for the raw termios communication adapter."""
+
+import os
+
+import pytest
+
+from ch9329py.driver import CH9329Driver
+from ch9329py.models import KeyboardInput, KeyCode
+from ch9329py.termios_adapter import TermiosAdapter
+from tests.pty_device import (
+    KEYBOARD_RELEASE,
+    MOUSE_RELEASE,
+    StandInDevice,
+    ack,
+    requires_pty,
+)
+
+FAST_BAUDRATE = 115200
+# More than the kernel buffers for a pseudo-terminal
+STALLED_WRITE_SIZE = 1 << 20
+
+pytestmark = requires_pty
+
+
+class TestTermiosAdapter:
+    """Tests for TermiosAdapter."""
+
+    def test_send_returns_response(self) -> None:
+        """Test that send() returns the device's acknowledgement."""
+        device = StandInDevice()
+        try:
+            with TermiosAdapter(device.port, FAST_BAUDRATE) as adapter:
+                assert adapter.send(KEYBOARD_RELEASE) == ack(0x02)
+            assert device.received == [KEYBOARD_RELEASE]
+        finally:
+            device.close()
+
+    def test_send_many_collects_every_response(self) -> None:
+        """Test that send_many() writes once and returns responses in order."""
+        device = StandInDevice()
+        try:
+            with TermiosAdapter(device.port, FAST_BAUDRATE) as adapter:
+                responses = adapter.send_many([KEYBOARD_RELEASE, MOUSE_RELEASE])
+            assert responses == [ack(0x02), ack(0x05)]
+        finally:
+            device.close()
+
+    def test_unsolicited_frames_are_skipped(self) -> None:
+        """Test that frames for other commands are not taken as responses."""
+        device = StandInDevice(unsolicited=ack(0x01))
+        try:
+            with TermiosAdapter(device.port, FAST_BAUDRATE) as adapter:
+                responses = adapter.send_many([KEYBOARD_RELEASE, MOUSE_RELEASE])
+            assert responses == [ack(0x02), ack(0x05)]
+        finally:
+            device.close()
+
+    def test_timeout_returns_empty_response(self) -> None:
+        """Test that a missing response yields empty bytes."""
+        device = StandInDevice(respond=False)
+        try:
+            with TermiosAdapter(device.port, FAST_BAUDRATE, timeout=0.02) as adapter:
+                assert adapter.send(KEYBOARD_RELEASE) == b""
+        finally:
+            device.close()
+
+    def test_works_with_driver(self) -> None:
+        """Test that the adapter can back a response-checking driver."""
+        device = StandInDevice()
+        try:
+            adapter = TermiosAdapter(device.port, FAST_BAUDRATE)
+            with CH9329Driver(adapter, check_responses=True) as driver:
+                driver.send_keyboard_input(KeyboardInput(keys=[KeyCode.KEY_A]))
+        finally:
+            device.close()
+
+    def test_set_baudrate(self) -> None:
+        """Test that the port can be switched to another baud rate."""
+        device = StandInDevice()
+        try:
+            with TermiosAdapter(device.port, 9600) as adapter:
+                adapter.set_baudrate(FAST_BAUDRATE)
+                assert adapter.send(KEYBOARD_RELEASE) == ack(0x02)
+        finally:
+            device.close()
+
+    def test_rejects_unsupported_baudrate(self) -> None:
+        """Test that a baud rate without termios constant raises ValueError."""
+        with pytest.raises(ValueError, match="Unsupported baud rate"):
+            TermiosAdapter("/dev/null", 12345)
+
+    def test_open_failure_raises_connection_error(self) -> None:
+        """Test that a missing port raises ConnectionError."""
+        with pytest.raises(ConnectionError, match="Failed to open serial port"):
+            TermiosAdapter("/dev/does-not-exist", FAST_BAUDRATE)
+
+    def test_send_after_close_raises(self) -> None:
+        """Test that sending on a closed adapter raises ConnectionError."""
+        device = StandInDevice()
+        try:
+            adapter = TermiosAdapter(device.port, FAST_BAUDRATE)
+            adapter.close()
+            with pytest.raises(ConnectionError, match="not open"):
+                adapter.send(KEYBOARD_RELEASE)
+        finally:
+            device.close()
+
+    def test_stalled_write_raises(self) -> None:
+        """Test that a write the port never drains times out."""
+        # Nobody reads the other end, so the output buffer fills up
+        controller, port = os.openpty()
+        adapter = TermiosAdapter(os.ttyname(port), FAST_BAUDRATE, timeout=0.02)
+        try:
+            with pytest.raises(ConnectionError, match="Timed out writing"):
+                adapter.send(bytes(STALLED_WRITE_SIZE))
+        finally:
+            adapter.close()
+            os.close(controller)
+            os.close(port)
@@ -0,0 +1,171 @@
+"""Tests for the text-to-keystroke compiler."""
+
+import string
+
+import pytest
+
+from ch9329py.emulator import KeyboardReport, key_presses
+from ch9329py.protocol import CH9329Protocol
+from ch9329py.text import KeyboardLayout, compile_text, keystroke
+
+RELEASE = CH9329Protocol.build_keyboard_release_packet()
+SHIFT = 0x02
+CAPS_LOCK = 0x39
+QUERY = "SELECT 1, 2, 3 FROM T1;"
+# Every character either layout can type
+CHARACTERS = string.ascii_letters + string.digits + string.punctuation + " \n\t¥"
+
+
+def _typed_text(
+    packets: tuple[bytes, ...], layout: KeyboardLayout, *, caps_lock: bool = False
+) -> str:
+    """Decode packets into the text a host with the layout would receive."""
+    characters = {}
+    for char in CHARACTERS:
+        try:
+            stroke = keystroke(char, layout)
+        except ValueError:
+            continue
+        characters[stroke.modifier, stroke.keycode] = char
+    reports = [
+        KeyboardReport(packet[5], tuple(code for code in packet[7:-1] if code))
+        for packet in packets
+    ]
+    typed = []
+    for press in key_presses(reports):
+        if press.keycode == CAPS_LOCK:
+            caps_lock = not caps_lock
+        elif caps_lock and characters[press] in string.ascii_letters:
+            typed.append(characters[press].swapcase())
+        else:
+            typed.append(characters[press])
+    return "".join(typed)
+
+
+class TestCompileText:
+    """Tests for compile_text()."""
+
+    def test_one_report_per_character(self) -> None:
+        """Test that different keys follow each other without releases."""
+        assert compile_text("Hi!") == (
+            CH9329Protocol.build_keyboard_packet(SHIFT, [0x0B]),
+            CH9329Protocol.build_keyboard_packet(0x00, [0x0C]),
+            CH9329Protocol.build_keyboard_packet(SHIFT, [0x1E]),
+            RELEASE,
+        )
+
+    def test_repeated_key_is_released_in_between(self) -> None:
+        """Test that a key is released before it types again."""
+        assert compile_text("aA") == (
+            CH9329Protocol.build_keyboard_packet(0x00, [0x04]),
+            RELEASE,
+            CH9329Protocol.build_keyboard_packet(SHIFT, [0x04]),
+            RELEASE,
+        )
+
+    def test_empty_text(self) -> None:
+        """Test that empty text compiles to no packets."""
+        assert compile_text("") == ()
+
+    @pytest.mark.parametrize("caps_lock", [None, False, True])
+    @pytest.mark.parametrize("rollover", [False, True])
+    @pytest.mark.parametrize("layout", list(KeyboardLayout))
+    def test_host_receives_the_text(
+        self, layout: KeyboardLayout, *, rollover: bool, caps_lock: bool | None
+    ) -> None:
+        """Test that every typeable character arrives in order."""
+        text = (
+            "".join(char for char in CHARACTERS if _can_type(char, layout))
+            + "Hello, world!\n"
+            + QUERY
+        )
+
+        packets = compile_text(text, layout, rollover=rollover, caps_lock=caps_lock)
+        assert _typed_text(packets, layout, caps_lock=bool(caps_lock)) == text
+
+    def test_jis_specific_keys(self) -> None:
+        """Test that JIS characters use the Yen and Ro keys."""
+        assert keystroke("\\", KeyboardLayout.JIS)[:2] == (0x00, 0x87)
+        assert keystroke("|", KeyboardLayout.JIS)[:2] == (SHIFT, 0x89)
+        assert keystroke("@", KeyboardLayout.JIS)[:2] == (0x00, 0x2F)
+        assert keystroke("@", KeyboardLayout.US)[:2] == (SHIFT, 0x1F)
+
+    def test_untypeable_character_raises(self) -> None:
+        """Test that characters missing from the layout raise ValueError."""
+        with pytest.raises(ValueError, match="'¥' cannot be typed with the US"):
+            compile_text("5¥")
+
+    def test_rollover_presses_several_keys_per_report(self) -> None:
+        """Test that characters with the same shift state share a report."""
+        assert compile_text("abC Aa", rollover=True) == (
+            CH9329Protocol.build_keyboard_packet(0x00, [0x04, 0x05]),
+            CH9329Protocol.build_keyboard_packet(SHIFT, [0x06]),
+            CH9329Protocol.build_keyboard_packet(0x00, [0x2C]),
+            CH9329Protocol.build_keyboard_packet(SHIFT, [0x04]),
+            RELEASE,
+            CH9329Protocol.build_keyboard_packet(0x00, [0x04]),
+            RELEASE,
+        )
+
+    def test_rollover_fills_at_most_six_keys(self) -> None:
+        """Test that a full report starts a new one."""
+        packets = compile_text("qwertyuiop", rollover=True)
+
+        assert packets[0] == CH9329Protocol.build_keyboard_packet(
+            0x00, [0x14, 0x1A, 0x08, 0x15, 0x17, 0x1C]
+        )
+        assert packets[1] == CH9329Protocol.build_keyboard_packet(
+            0x00, [0x18, 0x0C, 0x12, 0x13]
+        )
+
+    def test_rollover_needs_fewer_frames(self) -> None:
+        """Test that prose takes under half a report per character."""
+        text = "The quick brown fox jumps over the lazy dog. " * 4
+
+        assert len(compile_text(text, rollover=True)) * 2 < len(text)
+        assert len(compile_text(text)) > len(text)
+
+    def test_caps_lock_on_inverts_letter_shift(self) -> None:
+        """Test that letters keep their case when Caps Lock is on."""
+        assert compile_text("Hi", caps_lock=True) == (
+            CH9329Protocol.build_keyboard_packet(0x00, [0x0B]),
+            CH9329Protocol.build_keyboard_packet(SHIFT, [0x0C]),
+            RELEASE,
+        )
+
+    @pytest.mark.parametrize("caps_lock", [False, True])
+    def test_caps_lock_is_toggled_when_cheaper(self, *, caps_lock: bool) -> None:
+        """Test that upper case rollover text toggles Caps Lock around it."""
+        toggle = CH9329Protocol.build_keyboard_packet(0x00, [CAPS_LOCK])
+        text = QUERY.lower() if caps_lock else QUERY
+
+        packets = compile_text(text, rollover=True, caps_lock=caps_lock)
+
+        assert packets[0] == packets[-2] == toggle
+        assert len(packets) < len(compile_text(QUERY, rollover=True))
+        assert _typed_text(packets, KeyboardLayout.US, caps_lock=caps_lock) == text
+
+    def test_caps_lock_is_not_toggled_one_key_per_report(self) -> None:
+        """Test that shift is kept when every character needs a report anyway."""
+        assert compile_text(QUERY, caps_lock=False) == compile_text(QUERY)
+
+    def test_jis_toggles_caps_lock_with_shift(self) -> None:
+        """Test that JIS hosts get shift with the Caps Lock key."""
+        packets = compile_text(
+            QUERY, KeyboardLayout.JIS, rollover=True, caps_lock=False
+        )
+
+        assert packets[0] == CH9329Protocol.build_keyboard_packet(SHIFT, [CAPS_LOCK])
+
+    def test_repeated_text_reuses_packets(self) -> None:
+        """Test that compiling the same text again returns the cached result."""
+        assert compile_text("cached") is compile_text("cached")
+
+
+def _can_type(char: str, layout: KeyboardLayout) -> bool:
+    """Return whether the layout can type a character."""
+    try:
+        keystroke(char, layout)
+    except ValueError:
+        return False
+    return True
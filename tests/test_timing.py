@@ -0,0 +1,72 @@
+"""Tests for CH9329 timing helpers."""
+
+import pytest
+
+from ch9329py.timing import LatencyEstimator, wire_time
+
+KEYBOARD_PACKET_LENGTH = 14
+
+
+class TestWireTime:
+    """Tests for wire_time()."""
+
+    def test_keyboard_packet_at_9600(self) -> None:
+        """Test that a keyboard packet takes about 15 ms at 9600 baud."""
+        assert wire_time(KEYBOARD_PACKET_LENGTH, 9600) == pytest.approx(
+            0.01458, abs=1e-5
+        )
+
+    def test_scales_with_baudrate(self) -> None:
+        """Test that a faster link shortens the transmission time."""
+        assert wire_time(KEYBOARD_PACKET_LENGTH, 115200) == pytest.approx(
+            wire_time(KEYBOARD_PACKET_LENGTH, 9600) / 12
+        )
+
+
+class TestLatencyEstimator:
+    """Tests for LatencyEstimator."""
+
+    def test_no_samples(self) -> None:
+        """Test that an empty estimator has no estimate."""
+        assert LatencyEstimator().estimate() is None
+
+    def test_nearest_rank_percentile(self) -> None:
+        """Test that the nearest-rank percentile is reported."""
+        estimator = LatencyEstimator(percentile=90.0)
+        for sample in range(1, 11):
+            estimator.add(sample / 1000)
+
+        assert estimator.estimate() == pytest.approx(0.009)
+
+    def test_zero_percentile_is_minimum(self) -> None:
+        """Test that the 0th percentile is the smallest sample."""
+        estimator = LatencyEstimator(percentile=0.0)
+        for sample in (0.003, 0.001, 0.002):
+            estimator.add(sample)
+
+        assert estimator.estimate() == pytest.approx(0.001)
+
+    def test_window_forgets_old_samples(self) -> None:
+        """Test that only the most recent samples are kept."""
+        estimator = LatencyEstimator(percentile=0.0, window=2)
+        for sample in (0.001, 0.005, 0.006):
+            estimator.add(sample)
+
+        assert len(estimator) == len((0.005, 0.006))
+        assert estimator.estimate() == pytest.approx(0.005)
+
+    def test_clear(self) -> None:
+        """Test that clear() forgets all samples."""
+        estimator = LatencyEstimator()
+        estimator.add(0.001)
+        estimator.clear()
+
+        assert estimator.estimate() is None
+
+    @pytest.mark.parametrize(
+        ("percentile", "window"), [(-1.0, 8), (101.0, 8), (50.0, 0)]
+    )
+    def test_rejects_invalid_arguments(self, percentile: float, window: int) -> None:
+        """Test that invalid arguments raise ValueError."""
+        with pytest.raises(ValueError, match="must be"):
+            LatencyEstimator(percentile=percentile, window=window)
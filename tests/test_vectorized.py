@@ -0,0 +1,116 @@
+"""Tests for the NumPy batch encoder."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ch9329py.protocol import CH9329Protocol  # noqa: E402
+from ch9329py.vectorized import encode_keyboard, encode_mouse_rel  # noqa: E402
+
+MOUSE_REL_LENGTH = 11
+KEYBOARD_LENGTH = 14
+
+
+class TestEncodeMouseRel:
+    """Tests for encode_mouse_rel()."""
+
+    def test_matches_scalar_builder(self) -> None:
+        """Test that every packet equals build_mouse_rel_packet()."""
+        rng = np.random.default_rng(0)
+        buttons = rng.integers(0, 8, 500)
+        dx, dy, scroll = rng.integers(-300, 300, (3, 500))
+
+        batch = encode_mouse_rel(buttons, dx, dy, scroll)
+
+        expected = [
+            CH9329Protocol.build_mouse_rel_packet(*map(int, values))
+            for values in zip(buttons, dx, dy, scroll, strict=True)
+        ]
+        assert [packet.tobytes() for packet in batch.packets()] == expected
+        assert batch.data == b"".join(expected)
+
+    def test_offsets_delimit_fixed_size_frames(self) -> None:
+        """Test that offsets hold one boundary more than there are packets."""
+        batch = encode_mouse_rel(0, [1, 2, 3], 0, 0)
+
+        assert len(batch) == len([1, 2, 3])
+        assert batch.offsets.tolist() == [
+            i * MOUSE_REL_LENGTH for i in range(len(batch) + 1)
+        ]
+
+    def test_scalars_broadcast(self) -> None:
+        """Test that constant columns can be given as scalars."""
+        batch = encode_mouse_rel(0x01, np.array([5, -5]), 0, 1)
+
+        assert batch.packets()[1] == CH9329Protocol.build_mouse_rel_packet(
+            0x01, -5, 0, 1
+        )
+
+    def test_empty_trace(self) -> None:
+        """Test that an empty trace encodes to no packets."""
+        batch = encode_mouse_rel([], [], [], [])
+
+        assert (batch.data, batch.offsets.tolist(), batch.packets()) == (b"", [0], [])
+
+    def test_rejects_mismatched_lengths(self) -> None:
+        """Test that columns of different lengths raise ValueError."""
+        with pytest.raises(ValueError, match="broadcast"):
+            encode_mouse_rel([0, 0], [1, 2, 3], 0, 0)
+
+    def test_rejects_two_dimensional_columns(self) -> None:
+        """Test that columns must be one-dimensional."""
+        with pytest.raises(ValueError, match="one-dimensional"):
+            encode_mouse_rel(0, [[1, 2]], 0, 0)
+
+    def test_rejects_invalid_buttons(self) -> None:
+        """Test that button states must be bytes."""
+        with pytest.raises(ValueError, match="buttons"):
+            encode_mouse_rel([256], 0, 0, 0)
+
+
+class TestEncodeKeyboard:
+    """Tests for encode_keyboard()."""
+
+    def test_matches_scalar_builder(self) -> None:
+        """Test that every packet equals build_keyboard_packet()."""
+        rng = np.random.default_rng(1)
+        modifiers = rng.integers(0, 256, 200)
+        keycodes = rng.integers(0, 0xE8, (200, 6))
+
+        batch = encode_keyboard(modifiers, keycodes)
+
+        expected = [
+            CH9329Protocol.build_keyboard_packet(int(modifier), keys.tolist())
+            for modifier, keys in zip(modifiers, keycodes, strict=True)
+        ]
+        assert [packet.tobytes() for packet in batch.packets()] == expected
+
+    def test_pads_missing_key_slots(self) -> None:
+        """Test that fewer than six key columns are padded with zeros."""
+        batch = encode_keyboard([0x02, 0x00], [[0x04, 0x05], [0x00, 0x00]])
+
+        assert batch.data == (
+            CH9329Protocol.build_keyboard_packet(0x02, [0x04, 0x05])
+            + CH9329Protocol.build_keyboard_release_packet()
+        )
+        assert batch.offsets.tolist() == [0, KEYBOARD_LENGTH, 2 * KEYBOARD_LENGTH]
+
+    def test_rejects_too_many_key_slots(self) -> None:
+        """Test that more than six key columns raise ValueError."""
+        with pytest.raises(ValueError, match="At most 6"):
+            encode_keyboard([0], [[0] * 7])
+
+    def test_rejects_mismatched_rows(self) -> None:
+        """Test that each modifier needs exactly one keycode row."""
+        with pytest.raises(ValueError, match="keycode rows"):
+            encode_keyboard([0, 0], [[0x04]])
+
+    def test_rejects_wrong_dimensions(self) -> None:
+        """Test that keycodes must be a two-dimensional array."""
+        with pytest.raises(ValueError, match="two-dimensional"):
+            encode_keyboard([0], [0x04])
+
+    def test_rejects_invalid_keycodes(self) -> None:
+        """Test that keycodes must be bytes."""
+        with pytest.raises(ValueError, match="keycodes"):
+            encode_keyboard([0], [[-1]])